@@ -12,5 +12,5 @@ from . import models
 # Import wizards (Phase 2)
 # from . import wizard
 
-# Import utils (Phase 2)
-# from . import utils
+# Import utils
+from . import utils
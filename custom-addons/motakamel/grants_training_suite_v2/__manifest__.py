@@ -1,7 +1,7 @@
 # -*- coding: utf-8 -*-
 {
     'name': 't66',
-    'version': '18.0.1.13.0',
+    'version': '18.0.1.15.0',
     'category': 'Education',
     'summary': 'Training center management from grant intake to certification',
     'description': """
@@ -67,6 +67,7 @@
         'views/training_dashboard_views.xml',
         'views/notification_system_views.xml',
         'views/certificate_automation_views.xml',
+        'views/cron_run_views.xml',
         'views/menu_views.xml',
     ],
     'demo': [
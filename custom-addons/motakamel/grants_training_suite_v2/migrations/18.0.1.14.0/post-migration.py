@@ -0,0 +1,91 @@
+# -*- coding: utf-8 -*-
+
+import logging
+from odoo import api, SUPERUSER_ID
+
+_logger = logging.getLogger(__name__)
+
+# (model, table, binary column, filename column)
+BINARY_FIELDS = [
+    ('gr.intake.batch', 'gr_intake_batch', 'file_data', 'filename'),
+    ('gr.certificate', 'gr_certificate', 'certificate_file', 'certificate_filename'),
+    ('gr.homework.attempt', 'gr_homework_attempt', 'submission_file', 'submission_filename'),
+    ('gr.document.request', 'gr_document_request', 'document_file', 'document_filename'),
+]
+
+# Rows moved per batch, so only a bounded number of payloads is held in memory
+BATCH_SIZE = 100
+
+
+def _column_exists(cr, table, column):
+    cr.execute("""
+        SELECT 1
+        FROM information_schema.columns
+        WHERE table_name = %s AND column_name = %s
+    """, (table, column))
+    return bool(cr.fetchone())
+
+
+def _move_column_to_filestore(env, model, table, column, filename_column):
+    """Create field attachments from the values of an inline binary column.
+
+    The filestore is content addressed (files are named after their SHA1
+    checksum), so identical payloads end up stored once on disk.
+    """
+    cr = env.cr
+    cr.execute(f"""
+        SELECT t.id
+        FROM "{table}" t
+        WHERE t."{column}" IS NOT NULL
+        AND NOT EXISTS (
+            SELECT 1 FROM ir_attachment a
+            WHERE a.res_model = %s AND a.res_field = %s AND a.res_id = t.id
+        )
+        ORDER BY t.id
+    """, (model, column))
+    record_ids = [row[0] for row in cr.fetchall()]
+    _logger.info('Moving %d %s.%s values to the filestore', len(record_ids), model, column)
+
+    Attachment = env['ir.attachment']
+    for start in range(0, len(record_ids), BATCH_SIZE):
+        batch_ids = record_ids[start:start + BATCH_SIZE]
+        cr.execute(f"""
+            SELECT id, "{column}", "{filename_column}"
+            FROM "{table}"
+            WHERE id IN %s
+        """, (tuple(batch_ids),))
+        vals_list = []
+        for record_id, value, filename in cr.fetchall():
+            vals_list.append({
+                'name': filename or column,
+                'res_model': model,
+                'res_field': column,
+                'res_id': record_id,
+                'type': 'binary',
+                'datas': bytes(value),
+            })
+        Attachment.create(vals_list)
+        Attachment.invalidate_model()
+
+    cr.execute(f'ALTER TABLE "{table}" DROP COLUMN "{column}"')
+    _logger.info('Dropped inline binary column %s.%s', table, column)
+
+
+def migrate(cr, version):
+    """Post-migration script for version 18.0.1.14.0 - Binary payloads moved to the filestore."""
+    env = api.Environment(cr, SUPERUSER_ID, {})
+
+    _logger.info('Starting post-migration script for grants_training_suite_v2 v18.0.1.14.0 - Filestore Attachments')
+
+    for model, table, column, filename_column in BINARY_FIELDS:
+        if not _column_exists(cr, table, column):
+            _logger.info('Column %s.%s already removed, nothing to move', table, column)
+            continue
+        _move_column_to_filestore(env, model, table, column, filename_column)
+
+    # Intake file sizes are now read from the attachments
+    batches = env['gr.intake.batch'].search([])
+    env.add_to_compute(batches._fields['file_size'], batches)
+    batches.flush_recordset(['file_size'])
+
+    _logger.info('Finished post-migration script for grants_training_suite_v2 v18.0.1.14.0.')
@@ -0,0 +1,83 @@
+# -*- coding: utf-8 -*-
+
+import json
+import logging
+from odoo import api, SUPERUSER_ID
+
+_logger = logging.getLogger(__name__)
+
+# Batches converted at a time, so only a bounded number of documents is held in memory
+BATCH_SIZE = 100
+
+
+def _column_exists(cr, table, column):
+    cr.execute("""
+        SELECT 1
+        FROM information_schema.columns
+        WHERE table_name = %s AND column_name = %s
+    """, (table, column))
+    return bool(cr.fetchone())
+
+
+def _move_failed_records(env):
+    """Create one failed record per row of the JSON failed records documents."""
+    cr = env.cr
+    cr.execute("""
+        SELECT id
+        FROM gr_intake_batch
+        WHERE failed_records_data IS NOT NULL
+        ORDER BY id
+    """)
+    batch_ids = [row[0] for row in cr.fetchall()]
+    _logger.info('Moving the failed records of %d intake batches to rows', len(batch_ids))
+
+    Record = env['gr.intake.batch.record']
+    for start in range(0, len(batch_ids), BATCH_SIZE):
+        cr.execute("""
+            SELECT id, failed_records_data
+            FROM gr_intake_batch
+            WHERE id IN %s
+        """, (tuple(batch_ids[start:start + BATCH_SIZE]),))
+        vals_list = []
+        for batch_id, document in cr.fetchall():
+            try:
+                failed_records = json.loads(document).get('failed_records', [])
+            except (json.JSONDecodeError, TypeError, AttributeError):
+                _logger.warning('Could not read the failed records of intake batch %s', batch_id)
+                continue
+            rows = {}
+            for record in failed_records:
+                # The JSON documents could hold the same row twice
+                rows[record.get('row_number') or 0] = record
+            vals_list += [{
+                'intake_batch_id': batch_id,
+                'row_number': row_number,
+                'data': record.get('data') or {},
+                'errors': '\n'.join(record.get('errors') or []),
+                'warnings': '\n'.join(record.get('warnings') or []) or False,
+            } for row_number, record in rows.items()]
+        Record.create(vals_list)
+        Record.invalidate_model()
+
+    cr.execute('ALTER TABLE gr_intake_batch DROP COLUMN failed_records_data')
+    _logger.info('Dropped column gr_intake_batch.failed_records_data')
+
+
+def migrate(cr, version):
+    """Post-migration script for version 18.0.1.15.0 - Failed records stored as rows."""
+    env = api.Environment(cr, SUPERUSER_ID, {})
+
+    _logger.info('Starting post-migration script for grants_training_suite_v2 v18.0.1.15.0 - Failed Record Rows')
+
+    if _column_exists(cr, 'gr_intake_batch', 'failed_records_data'):
+        _move_failed_records(env)
+    else:
+        _logger.info('Column gr_intake_batch.failed_records_data already removed, nothing to move')
+
+    # Failed and corrected counts are now aggregated from the rows
+    batches = env['gr.intake.batch'].search([])
+    env.add_to_compute(batches._fields['failed_records_count'], batches)
+    env.add_to_compute(batches._fields['corrected_records_count'], batches)
+    batches.flush_recordset(['failed_records_count', 'corrected_records_count'])
+
+    _logger.info('Finished post-migration script for grants_training_suite_v2 v18.0.1.15.0.')
@@ -12,6 +12,9 @@ from . import intake_batch_mapping_wizard
 # Model 1.2: Intake Batch Correction Wizard (Phase 3.1.2)
 from . import intake_batch_correction_wizard
 
+# Model 1.3: Intake Batch Failed Record (Phase 3.1.2)
+from . import intake_batch_record
+
 # Model 2: Student
 from . import student
 
@@ -59,3 +62,6 @@ from . import homework_grade_history
 from . import certificate_template
 from . import certificate_template_preview
 from . import certificate_automation_wizard
+
+# Scheduled job run telemetry
+from . import cron_run
@@ -2,6 +2,7 @@
 
 import logging
 from datetime import datetime, timedelta
+from urllib.parse import quote as url_quote
 from odoo import models, fields, api, _
 from odoo.exceptions import UserError, ValidationError
 
@@ -195,6 +196,7 @@ class Certificate(models.Model):
     # Certificate File
     certificate_file = fields.Binary(
         string='Certificate File',
+        attachment=True,
         help='Digital certificate file'
     )
     
@@ -299,31 +301,34 @@ class Certificate(models.Model):
             else:
                 record.is_valid = False
     
-    @api.model
-    def create(self, vals):
+    @api.model_create_multi
+    def create(self, vals_list):
         """Override create to set sequence and verification code."""
-        if vals.get('name', _('New')) == _('New'):
-            vals['name'] = self.env['ir.sequence'].next_by_code('gr.certificate') or _('New')
-        
-        # Generate verification code if not provided
-        if not vals.get('verification_code'):
-            import secrets
-            vals['verification_code'] = secrets.token_hex(8).upper()
+        import secrets
         
-        # Set default validity period (2 years) if not provided
-        if not vals.get('valid_until') and vals.get('issue_date'):
-            issue_date = fields.Date.from_string(vals['issue_date'])
-            vals['valid_until'] = issue_date + timedelta(days=730)  # 2 years
-        elif not vals.get('valid_until'):
-            vals['valid_until'] = fields.Date.today() + timedelta(days=730)
+        for vals in vals_list:
+            if vals.get('name', _('New')) == _('New'):
+                vals['name'] = self.env['ir.sequence'].next_by_code('gr.certificate') or _('New')
+            
+            # Generate verification code if not provided
+            if not vals.get('verification_code'):
+                vals['verification_code'] = secrets.token_hex(8).upper()
+            
+            # Set default validity period (2 years) if not provided
+            if not vals.get('valid_until') and vals.get('issue_date'):
+                issue_date = fields.Date.from_string(vals['issue_date'])
+                vals['valid_until'] = issue_date + timedelta(days=730)  # 2 years
+            elif not vals.get('valid_until'):
+                vals['valid_until'] = fields.Date.today() + timedelta(days=730)
         
-        certificate = super(Certificate, self).create(vals)
+        certificates = super(Certificate, self).create(vals_list)
         
         # Log creation
-        _logger.info('Certificate created: %s - Student: %s, Type: %s', 
-                    certificate.name, certificate.student_id.name, certificate.certificate_type)
+        for certificate in certificates:
+            _logger.info('Certificate created: %s - Student: %s, Type: %s', 
+                        certificate.name, certificate.student_id.name, certificate.certificate_type)
         
-        return certificate
+        return certificates
     
     def action_issue(self):
         """Action to issue the certificate."""
@@ -736,15 +741,19 @@ Training Team
             mail = self.env['mail.mail'].create(mail_values)
             
             # Attach certificate
-            if self.certificate_file:
+            file_attachment = self._get_certificate_file_attachment()
+            if file_attachment:
+                # Raw bytes are passed on without a base64 round trip; the
+                # filestore is content addressed, so the PDF is stored once.
                 attachment = self.env['ir.attachment'].create({
                     'name': self.certificate_filename,
                     'type': 'binary',
-                    'datas': self.certificate_file,
+                    'raw': file_attachment.raw,
                     'res_model': 'mail.mail',
                     'res_id': mail.id,
                     'mimetype': 'application/pdf',
                 })
+                mail.attachment_ids = [(4, attachment.id)]
             
             # Send email
             mail.send()
@@ -774,9 +783,29 @@ Training Team
         
         return {
             'type': 'ir.actions.act_url',
-            'url': f'/web/content?model=gr.certificate&id={self.id}&field=certificate_file&filename_field=certificate_filename&download=true',
+            'url': self._get_certificate_download_url(),
             'target': 'new',
         }
+
+    def _get_certificate_file_attachment(self):
+        """Return the filestore attachment holding the certificate PDF."""
+        self.ensure_one()
+        return self.env['ir.attachment'].sudo().search([
+            ('res_model', '=', self._name),
+            ('res_field', '=', 'certificate_file'),
+            ('res_id', '=', self.id),
+        ], limit=1)
+
+    def _get_certificate_download_url(self):
+        """URL streaming the certificate PDF from the filestore.
+
+        The field route is served by ``ir.binary``, which streams the file
+        with ETag and HTTP range support instead of building the base64
+        payload in memory.
+        """
+        self.ensure_one()
+        filename = url_quote(self.certificate_filename or f'certificate_{self.id}.pdf')
+        return f'/web/content/{self._name}/{self.id}/certificate_file/{filename}?download=true'
     
     @api.model
     def auto_generate_certificates_for_completed_students(self):
@@ -5,6 +5,8 @@ from odoo.exceptions import UserError
 import logging
 from datetime import datetime, timedelta
 
+from .cron_run import track_cron_run
+
 _logger = logging.getLogger(__name__)
 
 
@@ -152,6 +154,7 @@ class CertificateAutomation(models.Model):
         _logger.info('Certificate automation archived: %s', self.name)
 
     @api.model
+    @track_cron_run('Certificate Automation Processing')
     def process_automatic_certificates(self):
         """Process automatic certificate generation for all active automations."""
         _logger.info('Starting automatic certificate generation process...')
@@ -371,6 +374,7 @@ class CertificateAutomation(models.Model):
         }
 
     @api.model
+    @track_cron_run('Failed Certificate Cleanup')
     def cleanup_failed_certificates(self):
         """Clean up failed certificate generations."""
         _logger.info('Cleaning up failed certificate generations...')
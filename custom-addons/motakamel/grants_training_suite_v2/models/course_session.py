@@ -220,30 +220,36 @@ class CourseSession(models.Model):
                 if not self.name or self.name == 'New Session':
                     self.name = f"Session - {self.student_id.name}"
     
-    @api.model
-    def create(self, vals):
+    @api.model_create_multi
+    def create(self, vals_list):
         """Override create to set default values."""
-        # Generate session name if not provided
-        if not vals.get('name') or vals.get('name') == 'New':
-            student_name = vals.get('student_id') and self.env['gr.student'].browse(vals['student_id']).name or 'Student'
-            session_date = vals.get('session_date')
-            if session_date:
-                try:
-                    date_obj = fields.Datetime.from_string(session_date)
-                    date_str = date_obj.strftime('%Y-%m-%d %H:%M')
-                    vals['name'] = f"Session - {student_name} - {date_str}"
-                except:
+        # Read the names of all students of the batch at once
+        students = self.env['gr.student'].browse(
+            list({vals['student_id'] for vals in vals_list if vals.get('student_id')})
+        )
+        student_names = {student.id: student.name for student in students}
+        
+        for vals in vals_list:
+            # Generate session name if not provided
+            if not vals.get('name') or vals.get('name') == 'New':
+                student_name = student_names.get(vals.get('student_id')) or 'Student'
+                session_date = vals.get('session_date')
+                if session_date:
+                    try:
+                        date_obj = fields.Datetime.to_datetime(session_date)
+                        date_str = date_obj.strftime('%Y-%m-%d %H:%M')
+                        vals['name'] = f"Session - {student_name} - {date_str}"
+                    except:
+                        vals['name'] = f"Session - {student_name}"
+                else:
                     vals['name'] = f"Session - {student_name}"
-            else:
-                vals['name'] = f"Session - {student_name}"
         
-        course_session = super(CourseSession, self).create(vals)
+        course_sessions = super(CourseSession, self).create(vals_list)
         
         # Log creation
-        _logger.info('Course session created: %s - Student: %s, Date: %s', 
-                    course_session.name, course_session.student_id.name, course_session.session_date)
+        _logger.info('%d course session(s) created', len(course_sessions))
         
-        return course_session
+        return course_sessions
     
     def action_start_session(self):
         """Action to start the session."""
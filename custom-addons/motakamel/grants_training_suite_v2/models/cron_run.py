@@ -0,0 +1,189 @@
+# -*- coding: utf-8 -*-
+
+import functools
+import logging
+import time
+import traceback
+from datetime import timedelta
+
+from odoo import models, fields, api, tools, SUPERUSER_ID
+
+_logger = logging.getLogger(__name__)
+
+
+def track_cron_run(job_name):
+    """Record duration, query count and rows processed of a cron entry point.
+
+    The decorated method must return the number of rows it processed (the
+    scheduled jobs of this module already return their counts). Usage::
+
+        @api.model
+        @track_cron_run('Dashboard Auto Refresh')
+        def refresh_all_dashboards(self):
+            ...
+    """
+    def decorator(method):
+        @functools.wraps(method)
+        def wrapper(self, *args, **kwargs):
+            return self.env['gr.cron.run']._run_tracked(job_name, method, self, *args, **kwargs)
+        return wrapper
+    return decorator
+
+
+class CronRun(models.Model):
+    _name = 'gr.cron.run'
+    _description = 'Scheduled Job Run'
+    _order = 'start_date desc, id desc'
+
+    job_name = fields.Char(
+        string='Job',
+        required=True,
+        index=True,
+        help='Name of the scheduled job that was executed'
+    )
+
+    model_name = fields.Char(
+        string='Model',
+        help='Technical name of the model the job runs on'
+    )
+
+    method_name = fields.Char(
+        string='Method',
+        help='Technical name of the job entry point'
+    )
+
+    start_date = fields.Datetime(
+        string='Started',
+        required=True,
+        index=True,
+        help='Date and time when the run started'
+    )
+
+    duration = fields.Float(
+        string='Duration (s)',
+        digits=(12, 3),
+        aggregator='avg',
+        help='Wall clock duration of the run in seconds'
+    )
+
+    query_count = fields.Integer(
+        string='SQL Queries',
+        aggregator='avg',
+        help='Number of SQL statements executed by the run'
+    )
+
+    rows_processed = fields.Integer(
+        string='Rows Processed',
+        help='Number of records processed, as returned by the job'
+    )
+
+    state = fields.Selection([
+        ('done', 'Done'),
+        ('failed', 'Failed'),
+    ], string='Status', required=True, default='done', index=True)
+
+    error_message = fields.Text(
+        string='Error',
+        help='Traceback of the failure, if any'
+    )
+
+    @api.model
+    def _run_tracked(self, job_name, method, records, *args, **kwargs):
+        """Execute ``method`` on ``records`` and store one run entry.
+
+        Only two counter reads and one INSERT are added to the job, so the
+        instrumentation is cheap enough to stay enabled in production.
+        """
+        cr = records.env.cr
+        start_date = fields.Datetime.now()
+        start_queries = getattr(cr, 'sql_log_count', 0)
+        start_time = time.perf_counter()
+        vals = {
+            'job_name': job_name,
+            'model_name': records._name,
+            'method_name': method.__name__,
+            'start_date': start_date,
+        }
+        try:
+            result = method(records, *args, **kwargs)
+        except Exception:
+            vals.update({
+                'duration': time.perf_counter() - start_time,
+                'query_count': getattr(cr, 'sql_log_count', 0) - start_queries,
+                'state': 'failed',
+                'error_message': traceback.format_exc(),
+            })
+            # The job transaction is rolled back by the scheduler, so the
+            # failure is committed from a separate cursor.
+            self._log_failed_run(vals)
+            raise
+
+        vals.update({
+            'duration': time.perf_counter() - start_time,
+            'query_count': getattr(cr, 'sql_log_count', 0) - start_queries,
+            'rows_processed': result if isinstance(result, int) else 0,
+        })
+        self.sudo().create(vals)
+        return result
+
+    @api.model
+    def _log_failed_run(self, vals):
+        """Store a failed run outside of the current transaction."""
+        try:
+            with self.env.registry.cursor() as cr:
+                api.Environment(cr, SUPERUSER_ID, {})['gr.cron.run'].create(vals)
+        except Exception as e:
+            _logger.error('Failed to record failed run of %s: %s', vals.get('job_name'), str(e))
+
+    @api.model
+    def cleanup_old_runs(self, days=90):
+        """Delete run entries older than ``days`` to keep the table small."""
+        limit_date = fields.Datetime.now() - timedelta(days=days)
+        old_runs = self.search([('start_date', '<', limit_date)])
+        count = len(old_runs)
+        old_runs.unlink()
+        _logger.info('Deleted %d scheduled job runs older than %d days', count, days)
+        return count
+
+
+class CronRunStatistics(models.Model):
+    _name = 'gr.cron.run.statistics'
+    _description = 'Scheduled Job Run Statistics'
+    _auto = False
+    _order = 'job_name, day desc'
+
+    job_name = fields.Char(string='Job', readonly=True)
+    day = fields.Date(string='Day', readonly=True)
+    run_count = fields.Integer(string='Runs', readonly=True)
+    failed_count = fields.Integer(string='Failed Runs', readonly=True)
+    rows_processed = fields.Integer(string='Rows Processed', readonly=True)
+    avg_duration = fields.Float(string='Avg Duration (s)', digits=(12, 3), aggregator='avg', readonly=True)
+    p50_duration = fields.Float(string='P50 Duration (s)', digits=(12, 3), aggregator='max', readonly=True)
+    p95_duration = fields.Float(string='P95 Duration (s)', digits=(12, 3), aggregator='max', readonly=True)
+    p99_duration = fields.Float(string='P99 Duration (s)', digits=(12, 3), aggregator='max', readonly=True)
+    max_duration = fields.Float(string='Max Duration (s)', digits=(12, 3), aggregator='max', readonly=True)
+    avg_query_count = fields.Float(string='Avg SQL Queries', digits=(12, 1), aggregator='avg', readonly=True)
+    p95_query_count = fields.Float(string='P95 SQL Queries', digits=(12, 1), aggregator='max', readonly=True)
+
+    def init(self):
+        tools.drop_view_if_exists(self.env.cr, self._table)
+        self.env.cr.execute("""
+            CREATE OR REPLACE VIEW %s AS (
+                SELECT
+                    MIN(r.id) AS id,
+                    r.job_name AS job_name,
+                    r.start_date::date AS day,
+                    COUNT(*) AS run_count,
+                    COUNT(*) FILTER (WHERE r.state = 'failed') AS failed_count,
+                    SUM(COALESCE(r.rows_processed, 0)) AS rows_processed,
+                    AVG(r.duration) AS avg_duration,
+                    PERCENTILE_CONT(0.50) WITHIN GROUP (ORDER BY r.duration) AS p50_duration,
+                    PERCENTILE_CONT(0.95) WITHIN GROUP (ORDER BY r.duration) AS p95_duration,
+                    PERCENTILE_CONT(0.99) WITHIN GROUP (ORDER BY r.duration) AS p99_duration,
+                    MAX(r.duration) AS max_duration,
+                    AVG(r.query_count) AS avg_query_count,
+                    PERCENTILE_CONT(0.95) WITHIN GROUP (ORDER BY r.query_count) AS p95_query_count
+                FROM gr_cron_run r
+                GROUP BY r.job_name, r.start_date::date
+            )
+        """ % self._table)
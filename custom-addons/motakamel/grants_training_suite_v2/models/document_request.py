@@ -143,6 +143,7 @@ class DocumentRequest(models.Model):
     # Document File
     document_file = fields.Binary(
         string='Document File',
+        attachment=True,
         help='Uploaded document file'
     )
     
@@ -4,6 +4,8 @@ import logging
 from odoo import models, fields, api, _
 from odoo.exceptions import ValidationError, UserError
 
+from .cron_run import track_cron_run
+
 _logger = logging.getLogger(__name__)
 
 class EnrollmentWizard(models.Model):
@@ -11,6 +13,10 @@ class EnrollmentWizard(models.Model):
     _description = 'Student Enrollment Wizard for Training Programs'
     _inherit = ['mail.thread', 'mail.activity.mixin']
 
+    # Selections larger than this are enrolled by a scheduled job
+    BACKGROUND_THRESHOLD = 500
+    CHUNK_SIZE = 500
+
     # Wizard Configuration
     training_program_id = fields.Many2one(
         'gr.training.program',
@@ -116,6 +122,49 @@ class EnrollmentWizard(models.Model):
         default=fields.Datetime.now
     )
     
+    # Background Processing
+    state = fields.Selection([
+        ('draft', 'Draft'),
+        ('queued', 'Queued'),
+        ('running', 'Running'),
+        ('done', 'Done'),
+    ], string='Processing Status', default='draft', readonly=True, copy=False)
+    
+    queued_student_ids = fields.Many2many(
+        'gr.student',
+        'gr_enrollment_wizard_queued_student_rel',
+        'wizard_id',
+        'student_id',
+        string='Queued Students',
+        readonly=True,
+        copy=False,
+        help='Students being enrolled by this wizard'
+    )
+    
+    total_count = fields.Integer(
+        string='Students to Process',
+        readonly=True,
+        default=0
+    )
+    
+    processed_count = fields.Integer(
+        string='Students Processed',
+        readonly=True,
+        default=0
+    )
+    
+    progress_percentage = fields.Float(
+        string='Progress (%)',
+        compute='_compute_progress_percentage',
+        help='Share of the selected students already processed'
+    )
+    
+    error_log = fields.Text(
+        string='Error Log',
+        readonly=True,
+        copy=False
+    )
+    
     # Computed Fields
     available_students = fields.Many2many(
         'gr.student',
@@ -166,6 +215,15 @@ class EnrollmentWizard(models.Model):
             students = self.env['gr.student'].search(domain)
             wizard.available_students = students
     
+    @api.depends('processed_count', 'total_count')
+    def _compute_progress_percentage(self):
+        """Compute the background processing progress."""
+        for wizard in self:
+            if wizard.total_count:
+                wizard.progress_percentage = wizard.processed_count * 100.0 / wizard.total_count
+            else:
+                wizard.progress_percentage = 0.0
+    
     @api.depends('available_students')
     def _compute_available_students_count(self):
         """Compute count of available students."""
@@ -234,74 +292,132 @@ class EnrollmentWizard(models.Model):
         }
     
     def action_proceed_with_enrollment(self):
-        """Proceed with the enrollment process."""
+        """Proceed with the enrollment process.
+
+        Small selections are enrolled right away. Selections larger than
+        ``BACKGROUND_THRESHOLD`` are queued and processed by a scheduled job in
+        chunks of ``CHUNK_SIZE`` students, updating the progress counters of the
+        wizard after each chunk.
+        """
         self.ensure_one()
         
         if not self.training_program_id and not self.course_integration_id:
             raise UserError(_('Please select a training program or course integration.'))
         
+        if self.state in ['queued', 'running']:
+            raise UserError(_('This enrollment is already being processed in the background.'))
+        
         students_to_enroll = self._get_students_to_enroll()
         
         if not students_to_enroll:
             raise UserError(_('No students match the selected criteria.'))
         
-        try:
-            enrolled_count = 0
-            invited_count = 0
-            errors = []
-            enrollment_start = fields.Datetime.now()
-            
-            for student in students_to_enroll:
-                try:
-                    if self.enrollment_type in ['direct_enroll', 'invite_and_enroll']:
-                        # Direct enrollment
-                        self._enroll_student_in_program(student)
-                        enrolled_count += 1
-                    
-                    if self.enrollment_type in ['invite_only', 'invite_and_enroll']:
-                        # Send invitation
-                        self._send_enrollment_invitation(student)
-                        invited_count += 1
-                    
-                    # Log the action
-                    self._log_enrollment_action(student)
-                    
-                except Exception as e:
-                    error_msg = f'Error processing student {student.name}: {str(e)}'
-                    errors.append(error_msg)
-                    _logger.error(error_msg)
-            
-            # Update wizard with results
-            self.write({
-                'enrolled_count': enrolled_count,
-                'invited_count': invited_count,
-                'error_count': len(errors),
-                'enrollment_date': enrollment_start,
-                'enrollment_summary': self._generate_enrollment_summary(students_to_enroll, enrolled_count, invited_count, errors)
-            })
-            
-            # Show success message
-            success_message = _('Enrollment completed successfully!\n')
-            success_message += _('Enrolled: %d students\n') % enrolled_count
-            if self.enrollment_type in ['invite_only', 'invite_and_enroll']:
-                success_message += _('Invited: %d students\n') % invited_count
-            if errors:
-                success_message += _('Errors: %d\n') % len(errors)
-            
+        self.write({
+            'queued_student_ids': [(6, 0, students_to_enroll.ids)],
+            'total_count': len(students_to_enroll),
+            'processed_count': 0,
+            'enrolled_count': 0,
+            'invited_count': 0,
+            'error_count': 0,
+            'error_log': False,
+            'enrollment_date': fields.Datetime.now(),
+            'enrollment_summary': False,
+        })
+        
+        if len(students_to_enroll) > self.BACKGROUND_THRESHOLD:
+            self.state = 'queued'
+            self.env.ref('grants_training_suite_v2.ir_cron_process_queued_enrollments')._trigger()
             return {
                 'type': 'ir.actions.client',
                 'tag': 'display_notification',
                 'params': {
-                    'title': _('Enrollment Complete'),
-                    'message': success_message,
-                    'type': 'warning' if errors else 'success',
+                    'title': _('Enrollment Queued'),
+                    'message': _('%d students will be enrolled in the background. '
+                                 'Progress is shown on the wizard.') % len(students_to_enroll),
+                    'type': 'info',
                     'sticky': True,
                 }
             }
-            
+        
+        try:
+            self.state = 'running'
+            while self.processed_count < self.total_count:
+                self._process_next_chunk()
         except Exception as e:
             _logger.error('Error during enrollment: %s', str(e))
             raise UserError(_('Error during enrollment: %s') % str(e))
+        
+        # Show success message
+        success_message = _('Enrollment completed successfully!\n')
+        success_message += _('Enrolled: %d students\n') % self.enrolled_count
+        if self.enrollment_type in ['invite_only', 'invite_and_enroll']:
+            success_message += _('Invited: %d students\n') % self.invited_count
+        if self.error_count:
+            success_message += _('Errors: %d\n') % self.error_count
+        
+        return {
+            'type': 'ir.actions.client',
+            'tag': 'display_notification',
+            'params': {
+                'title': _('Enrollment Complete'),
+                'message': success_message,
+                'type': 'warning' if self.error_count else 'success',
+                'sticky': True,
+            }
+        }
+    
+    @api.model
+    @track_cron_run('Process Queued Enrollments')
+    def _cron_process_queued_enrollments(self):
+        """Process queued enrollment wizards chunk by chunk, committing after each chunk."""
+        wizards = self.search([('state', 'in', ['queued', 'running'])], order='id')
+        for wizard in wizards:
+            wizard.state = 'running'
+            while wizard.processed_count < wizard.total_count:
+                wizard._process_next_chunk()
+                # Persist progress so the wizard shows it while the job runs
+                self.env.cr.commit()
+        return len(wizards)
+    
+    def _process_next_chunk(self):
+        """Enroll the next chunk of queued students and update the progress counters."""
+        self.ensure_one()
+        
+        queued_ids = sorted(self.queued_student_ids.ids)
+        chunk = self.env['gr.student'].browse(
+            queued_ids[self.processed_count:self.processed_count + self.CHUNK_SIZE]
+        )
+        
+        enrolled_count = invited_count = 0
+        errors = []
+        try:
+            with self.env.cr.savepoint():
+                if self.enrollment_type in ['direct_enroll', 'invite_and_enroll']:
+                    enrolled_count = len(self._enroll_students_in_program(chunk))
+                if self.enrollment_type in ['invite_only', 'invite_and_enroll']:
+                    self._send_enrollment_invitations(chunk)
+                    invited_count = len(chunk)
+                self._log_enrollment_actions(chunk)
+        except Exception as e:
+            enrolled_count = invited_count = 0
+            errors.append(f'Error processing students {chunk[:1].name} to {chunk[-1:].name}: {str(e)}')
+            _logger.error(errors[-1])
+        
+        vals = {
+            'processed_count': self.processed_count + len(chunk),
+            'enrolled_count': self.enrolled_count + enrolled_count,
+            'invited_count': self.invited_count + invited_count,
+            'error_count': self.error_count + len(errors),
+        }
+        if errors:
+            vals['error_log'] = '\n'.join(filter(None, [self.error_log] + errors))
+        if vals['processed_count'] >= self.total_count:
+            vals['state'] = 'done'
+            vals['enrollment_summary'] = self._generate_enrollment_summary(
+                self.queued_student_ids, vals['enrolled_count'], vals['invited_count'],
+                (vals.get('error_log') or self.error_log or '').splitlines()
+            )
+        self.write(vals)
     
     def _get_students_to_enroll(self):
         """Get students to enroll based on wizard settings."""
@@ -310,66 +426,60 @@ class EnrollmentWizard(models.Model):
         else:
             return self.available_students
     
-    def _enroll_student_in_program(self, student):
-        """Enroll a student in the training program or individual course."""
+    def _get_target_courses(self):
+        """Return the course integrations the wizard enrolls students in."""
         if self.training_program_id:
-            # Enroll in training program (all courses)
-            existing_enrollments = self.env['gr.progress.tracker'].search([
-                ('student_id', '=', student.id),
-                ('course_integration_id', 'in', self.training_program_id.course_integrations.ids)
-            ])
-            
-            if existing_enrollments:
-                _logger.info('Student %s already enrolled in some courses of program %s', 
-                            student.name, self.training_program_id.name)
-                return
-            
-            # Enroll in all active courses
-            enrolled_courses = []
-            for course in self.training_program_id.course_integrations:
-                if course.status == 'active':
-                    # Create progress tracker
-                    self.env['gr.progress.tracker'].create({
-                        'student_id': student.id,
-                        'course_integration_id': course.id,
-                        'status': 'not_started'
-                    })
-                    enrolled_courses.append(course.name)
-            
-            _logger.info('Enrolled student %s in program %s (courses: %s)', 
-                        student.name, self.training_program_id.name, ', '.join(enrolled_courses))
-        
-        elif self.course_integration_id:
-            # Enroll in individual course
-            existing_tracker = self.env['gr.progress.tracker'].search([
-                ('student_id', '=', student.id),
-                ('course_integration_id', '=', self.course_integration_id.id)
-            ])
-            
-            if existing_tracker:
-                _logger.info('Student %s already enrolled in course %s', 
-                            student.name, self.course_integration_id.name)
-                return
-            
-            # Create progress tracker
-            self.env['gr.progress.tracker'].create({
-                'student_id': student.id,
-                'course_integration_id': self.course_integration_id.id,
-                'status': 'not_started'
-            })
-            
-            _logger.info('Enrolled student %s in course %s', 
-                        student.name, self.course_integration_id.name)
+            return self.training_program_id.course_integrations.filtered(lambda c: c.status == 'active')
+        return self.course_integration_id
+    
+    def _enroll_students_in_program(self, students):
+        """Create the missing progress trackers of ``students`` in the target courses.
+
+        The missing (student, course) pairs are computed with one anti-join
+        against existing trackers and created with a single batched create.
+        Returns the students that received at least one new tracker.
+        """
+        courses = self._get_target_courses()
+        if not students or not courses:
+            return self.env['gr.student']
+        
+        Tracker = self.env['gr.progress.tracker']
+        Tracker.flush_model(['student_id', 'course_integration_id'])
+        self.env.cr.execute("""
+            SELECT s.id, c.id
+              FROM unnest(%s) AS s(id)
+             CROSS JOIN unnest(%s) AS c(id)
+             WHERE NOT EXISTS (
+                   SELECT 1
+                     FROM gr_progress_tracker t
+                    WHERE t.student_id = s.id
+                      AND t.course_integration_id = c.id
+             )
+             ORDER BY s.id, c.id
+        """, [students.ids, courses.ids])
+        missing_pairs = self.env.cr.fetchall()
+        
+        Tracker.create([{
+            'student_id': student_id,
+            'course_integration_id': course_id,
+            'status': 'not_started'
+        } for student_id, course_id in missing_pairs])
+        
+        enrolled_students = self.env['gr.student'].browse(sorted({pair[0] for pair in missing_pairs}))
+        target_name = self.training_program_id.name if self.training_program_id else self.course_integration_id.name
+        _logger.info('Enrolled %d students in %s (%d new trackers, %d already enrolled)',
+                    len(enrolled_students), target_name, len(missing_pairs),
+                    len(students) - len(enrolled_students))
+        return enrolled_students
     
-    def _send_enrollment_invitation(self, student):
-        """Send enrollment invitation to student."""
+    def _send_enrollment_invitations(self, students):
+        """Send enrollment invitations to students with one batched create."""
         # Create notification
         target_name = self.training_program_id.name if self.training_program_id else self.course_integration_id.name
         target_type = 'Training Program' if self.training_program_id else 'Course'
         
         subject = _('%s Invitation: %s') % (target_type, target_name)
-        message = _('Dear %s,\n\n') % student.name
-        message += _('You have been invited to join the %s: %s\n\n') % (target_type.lower(), target_name)
+        message = _('You have been invited to join the %s: %s\n\n') % (target_type.lower(), target_name)
         
         if self.notification_message:
             message += self.notification_message + '\n\n'
@@ -392,39 +502,41 @@ class EnrollmentWizard(models.Model):
         
         message += _('\nWe look forward to your participation!\n\nBest regards,\nTraining Team')
         
-        # Send notification (in-app notification)
-        self.env['mail.message'].create({
+        # Send notifications (in-app notification)
+        subtype_id = self.env.ref('mail.mt_note').id
+        greeting = _('Dear %s,\n\n')
+        self.env['mail.message'].create([{
             'model': 'gr.student',
             'res_id': student.id,
             'subject': subject,
-            'body': message,
+            'body': greeting % student.name + message,
             'message_type': 'notification',
-            'subtype_id': self.env.ref('mail.mt_note').id,
-        })
+            'subtype_id': subtype_id,
+        } for student in students])
         
-        target_name = self.training_program_id.name if self.training_program_id else self.course_integration_id.name
-        _logger.info('Sent enrollment invitation to student %s for %s', 
-                    student.name, target_name)
+        _logger.info('Sent enrollment invitations to %d students for %s', len(students), target_name)
     
-    def _log_enrollment_action(self, student):
-        """Log the enrollment action for tracking."""
+    def _log_enrollment_actions(self, students):
+        """Log the enrollment actions for tracking with one batched create."""
         action_type = 'enrollment'
         if self.enrollment_type == 'invite_only':
             action_type = 'invitation'
         elif self.enrollment_type == 'invite_and_enroll':
             action_type = 'enrollment_and_invitation'
         
-        # Create activity log entry
+        # Create activity log entries
         target_name = self.training_program_id.name if self.training_program_id else self.course_integration_id.name
-        self.env['mail.activity'].create({
-            'activity_type_id': self.env.ref('mail.mail_activity_data_todo').id,
+        activity_type_id = self.env.ref('mail.mail_activity_data_todo').id
+        res_model_id = self.env['ir.model']._get_id('gr.student')
+        self.env['mail.activity'].create([{
+            'activity_type_id': activity_type_id,
             'summary': _('Student %s - %s') % (action_type.title(), student.name),
             'note': _('Student %s %s in %s via wizard') % (
                 student.name, action_type, target_name),
-            'model': 'gr.student',
+            'res_model_id': res_model_id,
             'res_id': student.id,
             'user_id': self.env.user.id,
-        })
+        } for student in students])
     
     def _generate_enrollment_summary(self, students, enrolled_count, invited_count, errors):
         """Generate enrollment summary."""
@@ -443,8 +555,10 @@ class EnrollmentWizard(models.Model):
         
         if students:
             summary_lines.append("Processed Students:")
-            for student in students:
+            for student in students[:50]:  # Show first 50
                 summary_lines.append(f"  - {student.name} ({student.email})")
+            if len(students) > 50:
+                summary_lines.append(f"  ... and {len(students) - 50} more")
             summary_lines.append("")
         
         if errors:
@@ -463,6 +577,11 @@ class EnrollmentWizard(models.Model):
             'invited_count': 0,
             'error_count': 0,
             'enrollment_date': False,
+            'state': 'draft',
+            'queued_student_ids': [(5, 0, 0)],
+            'total_count': 0,
+            'processed_count': 0,
+            'error_log': False,
         })
         
         return {
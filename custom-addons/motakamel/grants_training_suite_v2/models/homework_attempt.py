@@ -106,6 +106,7 @@ class HomeworkAttempt(models.Model):
     
     submission_file = fields.Binary(
         string='Submission File',
+        attachment=True,
         help='File attachment for the homework submission'
     )
     
@@ -285,30 +286,49 @@ class HomeworkAttempt(models.Model):
             else:
                 record.processing_time = 0.0
     
-    @api.model
-    def create(self, vals):
-        """Override create to set sequence and attempt number."""
-        if vals.get('name', _('New')) == _('New'):
-            vals['name'] = self.env['ir.sequence'].next_by_code('gr.homework.attempt') or _('New')
-        
-        # Set attempt number if not provided
-        if not vals.get('attempt_number'):
-            student_id = vals.get('student_id')
-            homework_title = vals.get('homework_title')
-            if student_id and homework_title:
-                existing_attempts = self.search([
-                    ('student_id', '=', student_id),
-                    ('homework_title', '=', homework_title)
-                ])
-                vals['attempt_number'] = len(existing_attempts) + 1
-        
-        homework_attempt = super(HomeworkAttempt, self).create(vals)
+    @api.model_create_multi
+    def create(self, vals_list):
+        """Override create to set sequence, attempt number and track initial grade."""
+        for vals in vals_list:
+            if vals.get('name', _('New')) == _('New'):
+                vals['name'] = self.env['ir.sequence'].next_by_code('gr.homework.attempt') or _('New')
+        
+        self._assign_attempt_numbers(vals_list)
+        
+        records = super(HomeworkAttempt, self).create(vals_list)
+        
+        graded = records.filtered('grade')
+        graded._track_grade_changes({record.id: 0.0 for record in graded})
         
         # Log creation
-        _logger.info('Homework attempt created: %s - Student: %s, Title: %s', 
-                    homework_attempt.name, homework_attempt.student_id.name, homework_attempt.homework_title)
+        _logger.info('%d homework attempt(s) created: %s', len(records), ', '.join(records.mapped('name')))
         
-        return homework_attempt
+        return records
+    
+    def _assign_attempt_numbers(self, vals_list):
+        """Set missing attempt numbers with one grouped count for the whole batch."""
+        pending = [
+            vals for vals in vals_list
+            if not vals.get('attempt_number') and vals.get('student_id') and vals.get('homework_title')
+        ]
+        if not pending:
+            return
+        
+        groups = self._read_group(
+            [
+                ('student_id', 'in', list({vals['student_id'] for vals in pending})),
+                ('homework_title', 'in', list({vals['homework_title'] for vals in pending})),
+            ],
+            groupby=['student_id', 'homework_title'],
+            aggregates=['__count'],
+        )
+        counts = {(student.id, title): count for student, title, count in groups}
+        
+        # Attempts created in the same batch follow each other
+        for vals in pending:
+            key = (vals['student_id'], vals['homework_title'])
+            counts[key] = counts.get(key, 0) + 1
+            vals['attempt_number'] = counts[key]
     
     def action_submit(self):
         """Action to submit the homework."""
@@ -546,43 +566,35 @@ class HomeworkAttempt(models.Model):
             if record.max_grade <= 0:
                 raise ValidationError(_('Maximum grade must be greater than 0.'))
     
-    @api.model_create_multi
-    def create(self, vals_list):
-        """Override create to track initial grade."""
-        records = super().create(vals_list)
-        for record in records:
-            if record.grade:
-                record._track_grade_change(0.0, record.grade)
-        return records
-    
     def write(self, vals):
         """Override write to track grade changes."""
-        for record in self:
-            if 'grade' in vals:
-                old_grade = record.grade
-                super(HomeworkAttempt, record).write(vals)
-                if old_grade != vals['grade']:
-                    record._track_grade_change(old_grade, vals['grade'])
-            else:
-                super(HomeworkAttempt, record).write(vals)
-        return True
+        if 'grade' not in vals:
+            return super(HomeworkAttempt, self).write(vals)
+        
+        old_grades = {record.id: record.grade for record in self}
+        result = super(HomeworkAttempt, self).write(vals)
+        
+        changed = self.filtered(lambda record: old_grades[record.id] != vals['grade'])
+        changed._track_grade_changes(old_grades)
+        return result
     
-    def _track_grade_change(self, old_grade, new_grade):
-        """Track grade changes in history."""
-        self.ensure_one()
+    def _track_grade_changes(self, old_grades):
+        """Track grade changes in history with a single batched create."""
+        if not self:
+            return
         
-        # Create grade history entry
-        self.env['gr.homework.grade.history'].create({
-            'homework_attempt_id': self.id,
-            'old_grade': old_grade,
-            'new_grade': new_grade,
-            'change_date': fields.Datetime.now(),
+        now = fields.Datetime.now()
+        self.env['gr.homework.grade.history'].create([{
+            'homework_attempt_id': record.id,
+            'old_grade': old_grades[record.id],
+            'new_grade': record.grade,
+            'change_date': now,
             'changed_by_id': self.env.user.id,
             'change_reason': _('Grade updated'),
-        })
+        } for record in self])
         
-        _logger.info('Grade change tracked for homework attempt %s: %s -> %s by user %s',
-                    self.name, old_grade, new_grade, self.env.user.name)
+        _logger.info('Grade changes tracked for %d homework attempt(s) by user %s',
+                    len(self), self.env.user.name)
     
     @api.constrains('due_date')
     def _check_due_date(self):
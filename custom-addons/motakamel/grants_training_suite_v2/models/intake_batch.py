@@ -5,10 +5,13 @@ import csv
 import io
 import json
 import logging
-from datetime import datetime
+from collections import defaultdict
+from datetime import datetime, timedelta
 from odoo import models, fields, api, _
 from odoo.exceptions import UserError, ValidationError
 
+from ..utils.intake_validation import IntakeRecordValidator
+
 _logger = logging.getLogger(__name__)
 
 class IntakeBatch(models.Model):
@@ -31,6 +34,7 @@ class IntakeBatch(models.Model):
     
     file_data = fields.Binary(
         string='File',
+        attachment=True,
         help='Upload CSV or Excel file with student data'
     )
     
@@ -176,9 +180,11 @@ class IntakeBatch(models.Model):
     )
     
     # Failed Records Management (Phase 3.1.2)
-    failed_records_data = fields.Text(
-        string='Failed Records Data',
-        help='JSON string containing failed records with detailed error information'
+    failed_record_ids = fields.One2many(
+        'gr.intake.batch.record',
+        'intake_batch_id',
+        string='Failed Records',
+        help='Records that failed validation, with their errors and corrections'
     )
     
     failed_records_count = fields.Integer(
@@ -189,6 +195,14 @@ class IntakeBatch(models.Model):
         help='Number of records that failed processing'
     )
     
+    corrected_records_count = fields.Integer(
+        string='Corrected Records Count',
+        default=0,
+        compute='_compute_failed_records_count',
+        store=True,
+        help='Number of failed records that have been corrected'
+    )
+    
     has_failed_records = fields.Boolean(
         string='Has Failed Records',
         compute='_compute_has_failed_records',
@@ -296,6 +310,12 @@ class IntakeBatch(models.Model):
         ('hybrid', 'Hybrid'),
     ], string='Default Session Type', default='online', help='Default type for created sessions')
     
+    max_sessions_per_slot = fields.Integer(
+        string='Sessions per Time Slot',
+        default=10,
+        help='Maximum number of sessions scheduled in the same time slot for students without an agent'
+    )
+    
     session_creation_summary = fields.Text(
         string='Session Creation Summary',
         help='Summary of session creation process'
@@ -335,11 +355,22 @@ class IntakeBatch(models.Model):
     
     @api.depends('file_data')
     def _compute_file_size(self):
-        """Compute file size from binary data."""
+        """Compute file size from the filestore attachment, without reading the file."""
+        saved = self.filtered('id')
+        sizes = {}
+        if saved:
+            attachments = self.env['ir.attachment'].sudo().search_read([
+                ('res_model', '=', self._name),
+                ('res_field', '=', 'file_data'),
+                ('res_id', 'in', saved.ids),
+            ], ['res_id', 'file_size'])
+            sizes = {attachment['res_id']: attachment['file_size'] for attachment in attachments}
         for record in self:
-            if record.file_data:
-                # Calculate size from base64 encoded data
-                record.file_size = len(record.file_data) * 3 // 4  # Approximate size
+            if record.id in sizes:
+                record.file_size = sizes[record.id]
+            elif record.file_data:
+                # Unsaved upload: approximate size from the base64 value
+                record.file_size = len(record.file_data) * 3 // 4
             else:
                 record.file_size = 0
     
@@ -453,18 +484,18 @@ class IntakeBatch(models.Model):
             else:
                 record.stage_icon = 'fa-question'
     
-    @api.depends('failed_records_data')
+    @api.depends('failed_record_ids.status')
     def _compute_failed_records_count(self):
-        """Compute the number of failed records."""
+        """Compute the number of failed and corrected records."""
+        counts = defaultdict(dict)
+        for batch, status, count in self.env['gr.intake.batch.record']._read_group(
+                [('intake_batch_id', 'in', self._origin.ids)],
+                ['intake_batch_id', 'status'], ['__count']):
+            counts[batch.id][status] = count
         for record in self:
-            if record.failed_records_data:
-                try:
-                    failed_data = json.loads(record.failed_records_data)
-                    record.failed_records_count = len(failed_data.get('failed_records', []))
-                except (json.JSONDecodeError, TypeError):
-                    record.failed_records_count = 0
-            else:
-                record.failed_records_count = 0
+            batch_counts = counts[record._origin.id]
+            record.failed_records_count = sum(batch_counts.values())
+            record.corrected_records_count = batch_counts.get('corrected', 0)
     
     @api.depends('failed_records_count')
     def _compute_has_failed_records(self):
@@ -825,93 +856,10 @@ class IntakeBatch(models.Model):
     
     def _validate_records(self, records):
         """Validate records and return list of errors with detailed feedback."""
-        errors = []
-        warnings = []
+        row_errors, row_warnings = IntakeRecordValidator(records).validate()
         
-        # Required fields (updated for Phase 1.1 enhancements)
-        required_fields = ['name', 'name_arabic', 'name_english', 'email']
-        optional_fields = ['phone', 'birth_date', 'gender', 'nationality', 'native_language', 'english_level', 'has_certificate']
-        
-        # Track duplicate emails and names
-        email_set = set()
-        name_set = set()
-        
-        for i, record in enumerate(records, 1):
-            # Check required fields
-            for field in required_fields:
-                if not record.get(field) or str(record.get(field)).strip() == '':
-                    errors.append(f'Row {i}: Missing required field "{field}"')
-            
-            # Validate email format and uniqueness
-            email = record.get('email', '').strip()
-            if email:
-                if '@' not in email or '.' not in email.split('@')[-1]:
-                    errors.append(f'Row {i}: Invalid email format "{email}"')
-                elif email.lower() in email_set:
-                    errors.append(f'Row {i}: Duplicate email address "{email}"')
-                else:
-                    email_set.add(email.lower())
-            
-            # Validate name uniqueness (warning, not error)
-            name = record.get('name', '').strip()
-            if name:
-                if name in name_set:
-                    warnings.append(f'Row {i}: Duplicate name "{name}" (may be intentional)')
-                else:
-                    name_set.add(name)
-            
-            # Validate birth_date format if provided
-            birth_date = record.get('birth_date', '').strip()
-            if birth_date:
-                try:
-                    # Try to parse common date formats
-                    datetime.strptime(birth_date, '%Y-%m-%d')
-                except ValueError:
-                    try:
-                        datetime.strptime(birth_date, '%d/%m/%Y')
-                    except ValueError:
-                        try:
-                            datetime.strptime(birth_date, '%m/%d/%Y')
-                        except ValueError:
-                            errors.append(f'Row {i}: Invalid date format for birth_date "{birth_date}". Use YYYY-MM-DD format.')
-            
-            # Validate gender if provided
-            gender = record.get('gender', '').strip().lower()
-            if gender and gender not in ['male', 'female', 'm', 'f']:
-                errors.append(f'Row {i}: Invalid gender "{record.get("gender")}". Use "male", "female", "m", or "f".')
-            
-            # Validate english_level if provided
-            english_level = record.get('english_level', '').strip().lower()
-            valid_levels = ['beginner', 'elementary', 'intermediate', 'upper_intermediate', 'advanced']
-            if english_level and english_level not in valid_levels:
-                errors.append(f'Row {i}: Invalid english_level "{record.get("english_level")}". Valid options: {", ".join(valid_levels)}')
-            
-            # Validate has_certificate if provided
-            has_cert = record.get('has_certificate', '').strip().lower()
-            if has_cert and has_cert not in ['true', 'false', 'yes', 'no', '1', '0']:
-                errors.append(f'Row {i}: Invalid has_certificate value "{record.get("has_certificate")}". Use "true"/"false" or "yes"/"no".')
-            
-            # Validate certificate consistency
-            if has_cert in ['true', 'yes', '1']:
-                cert_type = record.get('certificate_type', '').strip()
-                cert_date = record.get('certificate_date', '').strip()
-                if not cert_type and not cert_date:
-                    warnings.append(f'Row {i}: Has certificate is true but no certificate details provided')
-                elif cert_date:
-                    try:
-                        datetime.strptime(cert_date, '%Y-%m-%d')
-                    except ValueError:
-                        errors.append(f'Row {i}: Invalid certificate_date format "{cert_date}". Use YYYY-MM-DD format.')
-            
-            # Validate birth date reasonableness (warning)
-            if birth_date:
-                try:
-                    parsed_date = datetime.strptime(birth_date, '%Y-%m-%d')
-                    current_year = datetime.now().year
-                    if parsed_date.year < 1900 or parsed_date.year > current_year:
-                        warnings.append(f'Row {i}: Birth date "{birth_date}" seems unusual')
-                except ValueError:
-                    pass  # Already handled above
+        errors = [f'Row {i}: {msg}' for i, msgs in enumerate(row_errors, 1) for msg in msgs]
+        warnings = [f'Row {i}: {msg}' for i, msgs in enumerate(row_warnings, 1) for msg in msgs]
         
         # Store warnings for later reference (Phase 2.3 enhancement)
         if warnings:
@@ -923,129 +871,18 @@ class IntakeBatch(models.Model):
     
     def _validate_records_with_details(self, records):
         """Validate records and return detailed error information for failed records management."""
-        errors = []
-        warnings = []
-        failed_records = []
-        
-        # Required fields (updated for Phase 1.1 enhancements)
-        required_fields = ['name', 'name_arabic', 'name_english', 'email']
-        optional_fields = ['phone', 'birth_date', 'gender', 'nationality', 'native_language', 'english_level', 'has_certificate']
+        row_errors, row_warnings = IntakeRecordValidator(records).validate()
         
-        # Track duplicate emails and names
-        email_set = set()
-        name_set = set()
-        
-        for i, record in enumerate(records, 1):
-            record_errors = []
-            record_warnings = []
-            
-            # Check required fields
-            for field in required_fields:
-                if not record.get(field) or str(record.get(field)).strip() == '':
-                    error_msg = f'Missing required field "{field}"'
-                    errors.append(f'Row {i}: {error_msg}')
-                    record_errors.append(error_msg)
-            
-            # Validate email format and uniqueness
-            email = record.get('email', '').strip()
-            if email:
-                if '@' not in email or '.' not in email.split('@')[-1]:
-                    error_msg = f'Invalid email format "{email}"'
-                    errors.append(f'Row {i}: {error_msg}')
-                    record_errors.append(error_msg)
-                elif email.lower() in email_set:
-                    error_msg = f'Duplicate email address "{email}"'
-                    errors.append(f'Row {i}: {error_msg}')
-                    record_errors.append(error_msg)
-                else:
-                    email_set.add(email.lower())
-            
-            # Validate name uniqueness (warning, not error)
-            name = record.get('name', '').strip()
-            if name:
-                if name in name_set:
-                    warning_msg = f'Duplicate name "{name}" (may be intentional)'
-                    warnings.append(f'Row {i}: {warning_msg}')
-                    record_warnings.append(warning_msg)
-                else:
-                    name_set.add(name)
-            
-            # Validate birth_date format if provided
-            birth_date = record.get('birth_date', '').strip()
-            if birth_date:
-                try:
-                    # Try to parse common date formats
-                    datetime.strptime(birth_date, '%Y-%m-%d')
-                except ValueError:
-                    try:
-                        datetime.strptime(birth_date, '%d/%m/%Y')
-                    except ValueError:
-                        try:
-                            datetime.strptime(birth_date, '%m/%d/%Y')
-                        except ValueError:
-                            error_msg = f'Invalid date format for birth_date "{birth_date}". Use YYYY-MM-DD format.'
-                            errors.append(f'Row {i}: {error_msg}')
-                            record_errors.append(error_msg)
-            
-            # Validate gender if provided
-            gender = record.get('gender', '').strip().lower()
-            if gender and gender not in ['male', 'female', 'm', 'f']:
-                error_msg = f'Invalid gender "{record.get("gender")}". Use "male", "female", "m", or "f".'
-                errors.append(f'Row {i}: {error_msg}')
-                record_errors.append(error_msg)
-            
-            # Validate english_level if provided
-            english_level = record.get('english_level', '').strip().lower()
-            valid_levels = ['beginner', 'elementary', 'intermediate', 'upper_intermediate', 'advanced']
-            if english_level and english_level not in valid_levels:
-                error_msg = f'Invalid english_level "{record.get("english_level")}". Valid options: {", ".join(valid_levels)}'
-                errors.append(f'Row {i}: {error_msg}')
-                record_errors.append(error_msg)
-            
-            # Validate has_certificate if provided
-            has_cert = record.get('has_certificate', '').strip().lower()
-            if has_cert and has_cert not in ['true', 'false', 'yes', 'no', '1', '0']:
-                error_msg = f'Invalid has_certificate value "{record.get("has_certificate")}". Use "true"/"false" or "yes"/"no".'
-                errors.append(f'Row {i}: {error_msg}')
-                record_errors.append(error_msg)
-            
-            # Validate certificate consistency
-            if has_cert in ['true', 'yes', '1']:
-                cert_type = record.get('certificate_type', '').strip()
-                cert_date = record.get('certificate_date', '').strip()
-                if not cert_type and not cert_date:
-                    warning_msg = f'Has certificate is true but no certificate details provided'
-                    warnings.append(f'Row {i}: {warning_msg}')
-                    record_warnings.append(warning_msg)
-                elif cert_date:
-                    try:
-                        datetime.strptime(cert_date, '%Y-%m-%d')
-                    except ValueError:
-                        error_msg = f'Invalid certificate_date format "{cert_date}". Use YYYY-MM-DD format.'
-                        errors.append(f'Row {i}: {error_msg}')
-                        record_errors.append(error_msg)
-            
-            # Validate birth date reasonableness (warning)
-            if birth_date:
-                try:
-                    parsed_date = datetime.strptime(birth_date, '%Y-%m-%d')
-                    current_year = datetime.now().year
-                    if parsed_date.year < 1900 or parsed_date.year > current_year:
-                        warning_msg = f'Birth date "{birth_date}" seems unusual'
-                        warnings.append(f'Row {i}: {warning_msg}')
-                        record_warnings.append(warning_msg)
-                except ValueError:
-                    pass  # Already handled above
-            
-            # Store failed record if it has errors
-            if record_errors:
-                failed_records.append({
-                    'row_number': i,
-                    'data': record,
-                    'errors': record_errors,
-                    'warnings': record_warnings,
-                    'status': 'failed'
-                })
+        errors = [f'Row {i}: {msg}' for i, msgs in enumerate(row_errors, 1) for msg in msgs]
+        warnings = [f'Row {i}: {msg}' for i, msgs in enumerate(row_warnings, 1) for msg in msgs]
+        failed_records = [{
+            'intake_batch_id': self.id,
+            'row_number': i,
+            'data': record,
+            'errors': '\n'.join(record_errors),
+            'warnings': '\n'.join(record_warnings) or False,
+        } for i, (record, record_errors, record_warnings)
+            in enumerate(zip(records, row_errors, row_warnings), 1) if record_errors]
         
         # Store warnings for later reference
         if warnings:
@@ -1053,18 +890,9 @@ class IntakeBatch(models.Model):
         else:
             self.validation_warnings = False
         
-        # Store failed records data for correction interface
-        if failed_records:
-            failed_data = {
-                'failed_records': failed_records,
-                'total_failed': len(failed_records),
-                'validation_timestamp': fields.Datetime.now().isoformat(),
-                'batch_id': self.id,
-                'batch_name': self.name
-            }
-            self.failed_records_data = json.dumps(failed_data, indent=2)
-        else:
-            self.failed_records_data = False
+        # Store failed records for the correction interface, one row each
+        self.failed_record_ids.unlink()
+        self.env['gr.intake.batch.record'].create(failed_records)
         
         return errors
     
@@ -1213,6 +1041,17 @@ class IntakeBatch(models.Model):
         
         _logger.info('Starting to create students from %d records', len(records))
         
+        # Duplicate detection: exact email matches and likely duplicates
+        # (same phone, names or birth date) are looked up for all rows at once
+        Student = self.env['gr.student']
+        emails = [record.get('email') for record in records if record.get('email')]
+        existing_by_email = {}
+        if emails:
+            for student in Student.search([('email', 'in', emails)], order='id'):
+                existing_by_email.setdefault(student.email, student)
+        duplicate_candidates = Student._find_duplicate_candidates(records)
+        possible_duplicates = []
+        
         for i, record in enumerate(records, 1):
             try:
                 # Parse birth_date if provided
@@ -1254,11 +1093,7 @@ class IntakeBatch(models.Model):
                 
                 # Check for existing student by email (duplicate detection)
                 email = record.get('email')
-                existing_student = None
-                if email:
-                    existing_student = self.env['gr.student'].search([
-                        ('email', '=', email)
-                    ], limit=1)
+                existing_student = existing_by_email.get(email) if email else None
                 
                 # Prepare student values
                 student_vals = {
@@ -1297,6 +1132,12 @@ class IntakeBatch(models.Model):
                     student = self.env['gr.student'].create(student_vals)
                     created_students.append(student)
                     _logger.info('Student %d created successfully with ID: %s', i, student.id)
+                    
+                    for duplicate, score in duplicate_candidates[i - 1][:1]:
+                        possible_duplicates.append(
+                            f'Row {i}: "{student.name}" may be a duplicate of "{duplicate.name}" '
+                            f'({duplicate.email}, score {score:.2f})'
+                        )
                 
             except Exception as e:
                 error_msg = f'Row {i}: Error creating student "{record.get("name", "Unknown")}": {str(e)}'
@@ -1313,11 +1154,13 @@ class IntakeBatch(models.Model):
                     len(created_students), len(updated_students), total_errors, total_skipped, len(records))
         
         # Store import statistics in the batch
-        self._store_import_statistics(created_students, updated_students, errors, skipped_students)
+        self._store_import_statistics(created_students, updated_students, errors, skipped_students,
+                                      possible_duplicates=possible_duplicates)
         
         return created_students
     
-    def _store_import_statistics(self, created_students, updated_students, errors, skipped_students):
+    def _store_import_statistics(self, created_students, updated_students, errors, skipped_students,
+                                 possible_duplicates=None):
         """Store import statistics in the batch record."""
         self.ensure_one()
         
@@ -1364,6 +1207,14 @@ class IntakeBatch(models.Model):
                 summary_lines.append(f"  • {error}")
             if len(errors) > 5:
                 summary_lines.append(f"  ... and {len(errors) - 5} more errors")
+            summary_lines.append("")
+        
+        if possible_duplicates:
+            summary_lines.append(f"⚠️ POSSIBLE DUPLICATES ({len(possible_duplicates)}):")
+            for duplicate in possible_duplicates[:10]:  # Show first 10
+                summary_lines.append(f"  • {duplicate}")
+            if len(possible_duplicates) > 10:
+                summary_lines.append(f"  ... and {len(possible_duplicates) - 10} more")
         
         self.import_summary = '\n'.join(summary_lines)
     
@@ -1837,24 +1688,17 @@ class IntakeBatch(models.Model):
             if not students:
                 raise UserError(_('No students found in this batch.'))
             
-            created_sessions = []
-            errors = []
             session_creation_start = fields.Datetime.now()
             
-            for student in students:
-                try:
-                    session = self._create_session_for_student(student)
-                    if session:
-                        created_sessions.append(session)
-                except Exception as e:
-                    error_msg = f'Error creating session for student {student.name}: {str(e)}'
-                    errors.append(error_msg)
-                    _logger.error(error_msg)
+            # Build every session in memory, then insert them in one batch
+            session_vals_list, errors = self._build_session_schedule(students)
+            created_sessions = self.env['gr.course.session'].create(session_vals_list)
+            scheduled_count = len(created_sessions.filtered(lambda s: s.state == 'scheduled'))
             
             # Update batch with session creation results
             self.write({
                 'sessions_created_count': len(created_sessions),
-                'sessions_scheduled_count': len([s for s in created_sessions if s.state == 'scheduled']),
+                'sessions_scheduled_count': scheduled_count,
                 'session_creation_date': session_creation_start,
                 'session_creation_errors': '\n'.join(errors) if errors else False,
                 'session_creation_summary': self._generate_session_creation_summary(created_sessions, errors)
@@ -1869,7 +1713,7 @@ class IntakeBatch(models.Model):
                 
                 self._send_batch_notification(notification_type, message, {
                     'sessions_created': len(created_sessions),
-                    'sessions_scheduled': len([s for s in created_sessions if s.state == 'scheduled']),
+                    'sessions_scheduled': scheduled_count,
                     'errors': len(errors),
                     'students_processed': len(students)
                 })
@@ -1893,58 +1737,95 @@ class IntakeBatch(models.Model):
             _logger.error('Error creating sessions for batch %s: %s', self.name, str(e))
             raise UserError(_('Error creating sessions: %s') % str(e))
     
-    def _create_session_for_student(self, student):
-        """Create a course session for a specific student."""
-        try:
-            # Determine session parameters
-            session_date = self._calculate_session_date(student)
-            session_duration = self.default_session_duration
-            session_type = self.default_session_type
-            
-            # Use session template if available
-            session_vals = {
-                'name': f"Session - {student.name} - {session_date.strftime('%Y-%m-%d %H:%M')}",
-                'student_id': student.id,
-                'session_date': session_date,
-                'session_duration': session_duration,
-                'session_type': session_type,
-                'state': 'scheduled',
-                'session_topic': self._get_default_session_topic(student),
-                'session_objectives': self._get_default_session_objectives(student),
-            }
-            
-            # Apply template if available
-            if self.session_template_id:
-                template_vals = self._apply_session_template(session_vals)
-                session_vals.update(template_vals)
-            
-            # Create the session
-            session = self.env['gr.course.session'].create(session_vals)
-            
-            _logger.info('Created session %s for student %s', session.name, student.name)
-            return session
-            
-        except Exception as e:
-            _logger.error('Error creating session for student %s: %s', student.name, str(e))
-            raise e
-    
-    def _calculate_session_date(self, student):
-        """Calculate appropriate session date for student."""
-        from datetime import datetime, timedelta
-        
-        # Start from next week to allow time for preparation
-        base_date = fields.Datetime.now() + timedelta(days=7)
-        
-        # Use student's preferred schedule if available
-        # For now, default to weekday mornings (9 AM)
-        session_date = base_date.replace(hour=9, minute=0, second=0, microsecond=0)
-        
-        # Adjust to next weekday if it's weekend
-        if session_date.weekday() >= 5:  # Saturday = 5, Sunday = 6
-            days_to_add = 7 - session_date.weekday()
-            session_date += timedelta(days=days_to_add)
+    def _build_session_schedule(self, students):
+        """Build the values of one session per student, spread over dates and agents.
+
+        Sessions are placed on the first weekday slot, starting
+        ``default_schedule_days`` (template) or 7 days ahead, where the
+        student's agent has no session yet. Students without an agent share
+        ``max_sessions_per_slot`` places per slot. The template and the agents'
+        existing sessions are read once for the whole batch.
+        Returns ``(session_vals_list, errors)``.
+        """
+        template = self.session_template_id
+        template_vals = self._apply_session_template({}) if template else {}
+        days_ahead = template.default_schedule_days if template and template.default_schedule_days else 7
+        time_slots = self._get_session_time_slots()
+        
+        start_date = (fields.Datetime.now() + timedelta(days=days_ahead)).replace(
+            hour=0, minute=0, second=0, microsecond=0)
+        
+        # Slot usage per agent (False for students without agent), including existing sessions
+        agents = students.mapped('assigned_agent_id')
+        slot_usage = defaultdict(int)
+        if agents:
+            existing_sessions = self.env['gr.course.session'].search_read([
+                ('agent_id', 'in', agents.ids),
+                ('session_date', '>=', start_date),
+                ('state', '=', 'scheduled'),
+            ], ['agent_id', 'session_date'])
+            for session in existing_sessions:
+                slot_usage[(session['agent_id'][0], session['session_date'])] += 1
+        
+        session_vals_list = []
+        errors = []
+        next_day_index = defaultdict(int)
+        for student in students:
+            try:
+                agent_id = student.assigned_agent_id.id or False
+                capacity = 1 if agent_id else max(self.max_sessions_per_slot, 1)
+                day_index = next_day_index[agent_id]
+                session_date = None
+                while session_date is None:
+                    day = start_date + timedelta(days=day_index)
+                    if day.weekday() < 5:  # Skip Saturday and Sunday
+                        for hour, minute in time_slots:
+                            slot = day.replace(hour=hour, minute=minute)
+                            if slot_usage[(agent_id, slot)] < capacity:
+                                session_date = slot
+                                break
+                    if session_date is None:
+                        day_index += 1
+                next_day_index[agent_id] = day_index
+                slot_usage[(agent_id, session_date)] += 1
+                
+                session_vals = {
+                    'name': f"Session - {student.name} - {session_date.strftime('%Y-%m-%d %H:%M')}",
+                    'student_id': student.id,
+                    'session_date': session_date,
+                    'session_duration': self.default_session_duration,
+                    'session_type': self.default_session_type,
+                    'state': 'scheduled',
+                    'session_topic': self._get_default_session_topic(student),
+                    'session_objectives': self._get_default_session_objectives(student),
+                }
+                # Template values override the defaults when they are set
+                session_vals.update({key: value for key, value in template_vals.items()
+                                     if value or key in ('location', 'meeting_link')})
+                session_vals_list.append(session_vals)
+            except Exception as e:
+                error_msg = f'Error creating session for student {student.name}: {str(e)}'
+                errors.append(error_msg)
+                _logger.error(error_msg)
         
-        return session_date
+        return session_vals_list, errors
+    
+    def _get_session_time_slots(self):
+        """Return the (hour, minute) start times of the sessions of a day.
+
+        Slots come from the template's preferred time slots
+        (e.g. "9:00-10:00, 14:00-15:00") and default to 9 AM.
+        """
+        slots = []
+        preferred = self.session_template_id.preferred_time_slots or ''
+        for slot in preferred.split(','):
+            start = slot.split('-')[0].strip()
+            try:
+                start_time = datetime.strptime(start, '%H:%M')
+            except ValueError:
+                continue
+            slots.append((start_time.hour, start_time.minute))
+        return sorted(set(slots)) or [(9, 0)]
     
     def _get_default_session_topic(self, student):
         """Get default session topic based on student's course preference."""
@@ -1995,8 +1876,10 @@ class IntakeBatch(models.Model):
         
         if created_sessions:
             summary_lines.append("Created Sessions:")
-            for session in created_sessions:
+            for session in created_sessions[:50]:  # Show first 50
                 summary_lines.append(f"  - {session.name} ({session.student_id.name})")
+            if len(created_sessions) > 50:
+                summary_lines.append(f"  ... and {len(created_sessions) - 50} more")
             summary_lines.append("")
         
         if errors:
@@ -2074,43 +1957,40 @@ class IntakeBatch(models.Model):
         }
     
     def action_reprocess_failed_records(self):
-        """Re-process only the failed records after corrections."""
+        """Create or update the students of the failed records corrected in the correction wizard."""
         self.ensure_one()
         
         if not self.has_failed_records:
             raise UserError(_('No failed records found for this batch.'))
         
-        # For now, we'll show a message that this feature requires opening the correction wizard first
-        # In a full implementation, we could store the corrected data in a regular model or use a different approach
-        raise UserError(_('Please open the correction wizard first to correct the failed records, then process them from there.'))
-    
-    def _create_students_from_corrected_data(self, corrected_records):
-        """Create students from corrected record data."""
-        created_students = []
+        corrected_records = self.failed_record_ids.filtered(lambda record: record.status == 'corrected')
+        if not corrected_records:
+            raise UserError(_('No corrected records found. Please correct the failed records first.'))
         
-        for record_data in corrected_records:
-            try:
-                # Extract student data from corrected record
-                student_vals = record_data.get('data', {})
-                
-                # Ensure required fields are present
-                if not student_vals.get('name_arabic') or not student_vals.get('name_english'):
-                    student_vals['name_arabic'] = student_vals.get('name', '')
-                    student_vals['name_english'] = student_vals.get('name', '')
-                
-                # Set intake batch
-                student_vals['intake_batch_id'] = self.id
-                student_vals['intake_date'] = fields.Datetime.now()
-                
-                # Create student
-                student = self.env['gr.student'].create(student_vals)
-                created_students.append(student)
-                
-            except Exception as e:
-                _logger.error('Error creating student from corrected record: %s', str(e))
-                continue
+        created_students = self._create_students([dict(record.data or {}) for record in corrected_records])
         
-        return created_students
+        # Rows whose student was created or updated leave the correction
+        # interface, rows that failed again stay there with the import errors
+        emails = [record.data.get('email') for record in corrected_records if record.data.get('email')]
+        processed_emails = set(self.env['gr.student'].search([('email', 'in', emails)]).mapped('email'))
+        processed_records = corrected_records.filtered(lambda record: record.data.get('email') in processed_emails)
+        processed_records.unlink()
+        self.processed_records += len(processed_records)
+        
+        _logger.info('Reprocessed %d corrected records for batch %s: %d created, %d updated',
+                     len(processed_records), self.name, len(created_students), self.updated_students_count)
+        
+        return {
+            'type': 'ir.actions.client',
+            'tag': 'display_notification',
+            'params': {
+                'title': _('Corrected Records Processed'),
+                'message': _('%s of %s corrected records processed: %s students created, %s updated.') % (
+                    len(processed_records), len(corrected_records),
+                    len(created_students), self.updated_students_count),
+                'type': 'success' if len(processed_records) == len(corrected_records) else 'warning',
+            }
+        }
     
     def action_validate_with_failed_tracking(self):
         """Validate records with detailed failed records tracking."""
@@ -2560,7 +2440,7 @@ class IntakeBatch(models.Model):
         self.processing_progress = 'pending'
         
         # Reset failed records fields (Phase 3.1.2)
-        self.failed_records_data = False
+        self.failed_record_ids.unlink()
         
         # Reset notification fields (Phase 3.1.3)
         self.notification_sent = False
@@ -1,6 +1,5 @@
 # -*- coding: utf-8 -*-
 
-import json
 from odoo import models, fields, api, _
 from odoo.exceptions import UserError, ValidationError
 
@@ -22,10 +21,11 @@ class IntakeBatchCorrectionWizard(models.TransientModel):
         readonly=True
     )
     
-    # Failed Records Data
-    failed_records_data = fields.Text(
-        string='Failed Records Data',
-        related='intake_batch_id.failed_records_data',
+    # Failed Records
+    failed_record_ids = fields.One2many(
+        'gr.intake.batch.record',
+        string='Failed Records',
+        related='intake_batch_id.failed_record_ids',
         readonly=True
     )
     
@@ -35,10 +35,10 @@ class IntakeBatchCorrectionWizard(models.TransientModel):
         readonly=True
     )
     
-    # Correction Data
-    corrected_records = fields.Text(
-        string='Corrected Records',
-        help='JSON string containing corrected records data'
+    corrected_records_count = fields.Integer(
+        string='Corrected Records Count',
+        related='intake_batch_id.corrected_records_count',
+        readonly=True
     )
     
     # Status Fields
@@ -52,58 +52,27 @@ class IntakeBatchCorrectionWizard(models.TransientModel):
     # Computed Fields
     failed_records_list = fields.Text(
         string='Failed Records List',
-        compute='_compute_failed_records_list',
-        store=True
+        compute='_compute_failed_records_list'
     )
     
-    corrected_records_count = fields.Integer(
-        string='Corrected Records Count',
-        compute='_compute_corrected_records_count',
-        store=True
-    )
-    
-    @api.depends('failed_records_data')
+    @api.depends('failed_record_ids')
     def _compute_failed_records_list(self):
         """Compute formatted list of failed records for display."""
         for wizard in self:
-            if wizard.failed_records_data:
-                try:
-                    failed_data = json.loads(wizard.failed_records_data)
-                    failed_records = failed_data.get('failed_records', [])
-                    
-                    formatted_list = []
-                    for record in failed_records:
-                        row_num = record.get('row_number', 0)
-                        errors = record.get('errors', [])
-                        warnings = record.get('warnings', [])
-                        
-                        formatted_list.append(f"Row {row_num}:")
-                        for error in errors:
-                            formatted_list.append(f"  ❌ {error}")
-                        for warning in warnings:
-                            formatted_list.append(f"  ⚠️ {warning}")
-                        formatted_list.append("")
-                    
-                    wizard.failed_records_list = '\n'.join(formatted_list)
-                except (json.JSONDecodeError, TypeError):
-                    wizard.failed_records_list = "Error parsing failed records data."
+            if wizard.failed_record_ids:
+                formatted_list = []
+                for record in wizard.failed_record_ids:
+                    formatted_list.append(f"Row {record.row_number}:")
+                    for error in (record.errors or '').splitlines():
+                        formatted_list.append(f"  ❌ {error}")
+                    for warning in (record.warnings or '').splitlines():
+                        formatted_list.append(f"  ⚠️ {warning}")
+                    formatted_list.append("")
+                
+                wizard.failed_records_list = '\n'.join(formatted_list)
             else:
                 wizard.failed_records_list = "No failed records found."
     
-    @api.depends('corrected_records')
-    def _compute_corrected_records_count(self):
-        """Compute the number of corrected records."""
-        for wizard in self:
-            if wizard.corrected_records:
-                try:
-                    corrected_data = json.loads(wizard.corrected_records)
-                    corrected_records = corrected_data.get('corrected_records', [])
-                    wizard.corrected_records_count = len(corrected_records)
-                except (json.JSONDecodeError, TypeError):
-                    wizard.corrected_records_count = 0
-            else:
-                wizard.corrected_records_count = 0
-    
     @api.model
     def create(self, vals):
         """Override create to load failed records data."""
@@ -112,114 +81,60 @@ class IntakeBatchCorrectionWizard(models.TransientModel):
         return wizard
     
     def _load_failed_records(self):
-        """Load failed records data from the intake batch."""
+        """Start correcting the failed records of the intake batch."""
         self.ensure_one()
         
-        if not self.intake_batch_id or not self.intake_batch_id.failed_records_data:
-            return
-        
-        # Initialize corrected records with failed records data
-        try:
-            failed_data = json.loads(self.intake_batch_id.failed_records_data)
-            failed_records = failed_data.get('failed_records', [])
-            
-            # Create initial corrected records structure
-            corrected_data = {
-                'corrected_records': [],
-                'original_failed_count': len(failed_records),
-                'correction_timestamp': fields.Datetime.now().isoformat(),
-                'batch_id': self.intake_batch_id.id,
-                'batch_name': self.intake_batch_id.name
-            }
-            
-            # Initialize corrected records with original data
-            for record in failed_records:
-                corrected_record = {
-                    'row_number': record.get('row_number'),
-                    'data': record.get('data', {}).copy(),
-                    'original_errors': record.get('errors', []),
-                    'original_warnings': record.get('warnings', []),
-                    'corrections_made': [],
-                    'status': 'needs_correction'
-                }
-                corrected_data['corrected_records'].append(corrected_record)
-            
-            self.corrected_records = json.dumps(corrected_data, indent=2)
+        if self.intake_batch_id.failed_records_count:
             self.state = 'correcting'
-            
-        except (json.JSONDecodeError, TypeError) as e:
-            raise UserError(_('Error loading failed records data: %s') % str(e))
+    
+    def _get_record(self, row_number):
+        """Return the failed record of the intake batch at ``row_number``."""
+        record = self.env['gr.intake.batch.record'].search([
+            ('intake_batch_id', '=', self.intake_batch_id.id),
+            ('row_number', '=', row_number),
+        ], limit=1)
+        if not record:
+            raise UserError(_('No failed record found for row %s.') % row_number)
+        return record
     
     def action_correct_record(self, row_number, corrected_data):
         """Correct a specific record."""
         self.ensure_one()
-        
-        if not self.corrected_records:
-            raise UserError(_('No corrected records data found.'))
-        
-        try:
-            corrected_json = json.loads(self.corrected_records)
-            corrected_records = corrected_json.get('corrected_records', [])
-            
-            # Find the record to correct
-            for record in corrected_records:
-                if record.get('row_number') == row_number:
-                    # Update the record data
-                    record['data'].update(corrected_data)
-                    record['corrections_made'].append({
-                        'field': list(corrected_data.keys())[0],
-                        'old_value': record['data'].get(list(corrected_data.keys())[0]),
-                        'new_value': list(corrected_data.values())[0],
-                        'timestamp': fields.Datetime.now().isoformat()
-                    })
-                    record['status'] = 'corrected'
-                    break
-            
-            # Save updated data
-            self.corrected_records = json.dumps(corrected_json, indent=2)
-            
-            return True
-            
-        except (json.JSONDecodeError, TypeError) as e:
-            raise UserError(_('Error correcting record: %s') % str(e))
+        return self._get_record(row_number).action_correct(corrected_data)
     
     def action_validate_corrected_records(self):
         """Validate the corrected records."""
         self.ensure_one()
         
-        if not self.corrected_records:
+        corrected_records = self.env['gr.intake.batch.record'].search([
+            ('intake_batch_id', '=', self.intake_batch_id.id),
+            ('status', '=', 'corrected'),
+        ])
+        if not corrected_records:
             raise UserError(_('No corrected records found.'))
         
-        try:
-            corrected_json = json.loads(self.corrected_records)
-            corrected_records = corrected_json.get('corrected_records', [])
-            
-            validation_errors = []
-            
-            for record in corrected_records:
-                if record.get('status') == 'corrected':
-                    # Validate the corrected record
-                    record_errors = self._validate_single_record(record['data'])
-                    if record_errors:
-                        validation_errors.extend([f"Row {record.get('row_number')}: {error}" for error in record_errors])
-            
-            if validation_errors:
-                raise UserError(_('Validation failed for corrected records:\n%s') % '\n'.join(validation_errors))
-            
-            self.state = 'corrected'
-            
-            return {
-                'type': 'ir.actions.client',
-                'tag': 'display_notification',
-                'params': {
-                    'title': _('Records Validated'),
-                    'message': _('All corrected records passed validation. Ready for processing.'),
-                    'type': 'success',
-                }
+        validation_errors = []
+        
+        for record in corrected_records:
+            # Validate the corrected record
+            record_errors = self._validate_single_record(record.data or {})
+            if record_errors:
+                validation_errors.extend([f"Row {record.row_number}: {error}" for error in record_errors])
+        
+        if validation_errors:
+            raise UserError(_('Validation failed for corrected records:\n%s') % '\n'.join(validation_errors))
+        
+        self.state = 'corrected'
+        
+        return {
+            'type': 'ir.actions.client',
+            'tag': 'display_notification',
+            'params': {
+                'title': _('Records Validated'),
+                'message': _('All corrected records passed validation. Ready for processing.'),
+                'type': 'success',
             }
-            
-        except (json.JSONDecodeError, TypeError) as e:
-            raise UserError(_('Error validating corrected records: %s') % str(e))
+        }
     
     def _validate_single_record(self, record_data):
         """Validate a single record."""
@@ -260,28 +175,4 @@ class IntakeBatchCorrectionWizard(models.TransientModel):
     def action_skip_record(self, row_number):
         """Skip a record (mark as skipped)."""
         self.ensure_one()
-        
-        if not self.corrected_records:
-            raise UserError(_('No corrected records data found.'))
-        
-        try:
-            corrected_json = json.loads(self.corrected_records)
-            corrected_records = corrected_json.get('corrected_records', [])
-            
-            # Find the record to skip
-            for record in corrected_records:
-                if record.get('row_number') == row_number:
-                    record['status'] = 'skipped'
-                    record['corrections_made'].append({
-                        'action': 'skipped',
-                        'timestamp': fields.Datetime.now().isoformat()
-                    })
-                    break
-            
-            # Save updated data
-            self.corrected_records = json.dumps(corrected_json, indent=2)
-            
-            return True
-            
-        except (json.JSONDecodeError, TypeError) as e:
-            raise UserError(_('Error skipping record: %s') % str(e))
+        return self._get_record(row_number).action_skip()
@@ -0,0 +1,88 @@
+# -*- coding: utf-8 -*-
+
+from odoo import models, fields
+
+
+class IntakeBatchRecord(models.Model):
+    _name = 'gr.intake.batch.record'
+    _description = 'Grants Training Intake Batch Failed Record'
+    _order = 'intake_batch_id, row_number'
+    _rec_name = 'row_number'
+
+    intake_batch_id = fields.Many2one(
+        'gr.intake.batch',
+        string='Intake Batch',
+        required=True,
+        ondelete='cascade',
+        index=True,
+        help='Intake batch the record was imported with'
+    )
+
+    row_number = fields.Integer(
+        string='Row Number',
+        required=True,
+        help='Row of the record in the imported file'
+    )
+
+    status = fields.Selection([
+        ('failed', 'Needs Correction'),
+        ('corrected', 'Corrected'),
+        ('skipped', 'Skipped'),
+    ], string='Status', default='failed', required=True, index=True)
+
+    data = fields.Json(
+        string='Data',
+        help='Values of the imported row, keyed by field name'
+    )
+
+    errors = fields.Text(
+        string='Errors',
+        help='Validation errors of the row, one per line'
+    )
+
+    warnings = fields.Text(
+        string='Warnings',
+        help='Validation warnings of the row, one per line'
+    )
+
+    corrections = fields.Json(
+        string='Corrections',
+        help='Log of the corrections made to the row'
+    )
+
+    _sql_constraints = [
+        ('intake_batch_row_unique', 'unique(intake_batch_id, row_number)',
+         'A row can only be stored once per intake batch.'),
+    ]
+
+    def _log_corrections(self, entries):
+        """Return the correction log of the record with ``entries`` appended."""
+        self.ensure_one()
+        timestamp = fields.Datetime.now().isoformat()
+        return (self.corrections or []) + [dict(entry, timestamp=timestamp) for entry in entries]
+
+    def action_correct(self, corrected_data):
+        """Update the data of the record with the corrected values."""
+        self.ensure_one()
+        data = dict(self.data or {})
+        corrections = self._log_corrections([{
+            'field': field,
+            'old_value': data.get(field),
+            'new_value': value,
+        } for field, value in corrected_data.items()])
+        data.update(corrected_data)
+        self.write({
+            'data': data,
+            'corrections': corrections,
+            'status': 'corrected',
+        })
+        return True
+
+    def action_skip(self):
+        """Mark the record as skipped, it will not be processed."""
+        self.ensure_one()
+        self.write({
+            'corrections': self._log_corrections([{'action': 'skipped'}]),
+            'status': 'skipped',
+        })
+        return True
@@ -5,6 +5,8 @@ from odoo.exceptions import UserError
 import logging
 from datetime import datetime, timedelta
 
+from .cron_run import track_cron_run
+
 _logger = logging.getLogger(__name__)
 
 
@@ -214,6 +216,7 @@ class ProgressNotification(models.Model):
         self.status = 'archived'
 
     @api.model
+    @track_cron_run('Create Milestone Notifications')
     def create_milestone_notifications(self):
         """Automatically create milestone notifications for students."""
         _logger.info('Starting automatic milestone notification creation...')
@@ -294,6 +297,7 @@ class ProgressNotification(models.Model):
             return None
 
     @api.model
+    @track_cron_run('Stalled Progress Alerts')
     def create_stalled_progress_alerts(self):
         """Create alerts for students with stalled progress."""
         _logger.info('Checking for stalled progress...')
@@ -342,6 +346,7 @@ class ProgressNotification(models.Model):
         return created_count
 
     @api.model
+    @track_cron_run('Completion Notifications')
     def create_completion_notifications(self):
         """Create notifications for course completions."""
         _logger.info('Checking for course completions...')
@@ -388,6 +393,7 @@ class ProgressNotification(models.Model):
         return created_count
 
     @api.model
+    @track_cron_run('Notification Cleanup')
     def cleanup_old_notifications(self):
         """Clean up old notifications to keep the system clean."""
         _logger.info('Cleaning up old notifications...')
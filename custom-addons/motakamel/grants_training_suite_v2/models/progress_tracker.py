@@ -12,6 +12,9 @@ class ProgressTracker(models.Model):
     _description = 'Unified Progress Tracking'
     _order = 'student_id, course_integration_id'
 
+    # Number of students auto-enrolled per committed batch
+    AUTO_ENROLL_CHUNK_SIZE = 500
+
     student_id = fields.Many2one(
         'gr.student',
         string='Student',
@@ -260,28 +263,34 @@ class ProgressTracker(models.Model):
 
     @api.model
     def auto_enroll_eligible_students(self):
-        """Auto-enroll eligible students in eLearning courses."""
+        """Auto-enroll eligible students in eLearning courses.
+        
+        Students are enrolled in bulk, chunk by chunk; each chunk runs in a
+        savepoint and is committed so a failing chunk does not undo the
+        others.
+        """
         _logger.info('Starting auto-enrollment process...')
         
         # Get eligible students not yet integrated
         eligible_students = self.env['gr.student'].search([
             ('is_eligible', '=', True),
             ('integration_status', '=', 'not_integrated')
-        ])
+        ], order='id')
         
         enrollment_count = 0
         error_count = 0
         
-        for student in eligible_students:
+        for start in range(0, len(eligible_students), self.AUTO_ENROLL_CHUNK_SIZE):
+            chunk = eligible_students[start:start + self.AUTO_ENROLL_CHUNK_SIZE]
             try:
-                result = student.action_auto_enroll_eligible_courses()
-                if result and 'params' in result and 'type' in result['params'] and result['params']['type'] == 'success':
-                    enrollment_count += 1
-                    
+                with self.env.cr.savepoint():
+                    result = chunk._auto_enroll_in_eligible_courses()
+                enrollment_count += len(result['students'])
             except Exception as e:
-                error_count += 1
-                _logger.error('Failed to auto-enroll student %s: %s', student.name, str(e))
-                continue
+                error_count += len(chunk)
+                _logger.error('Failed to auto-enroll students %s to %s: %s',
+                              chunk[:1].name, chunk[-1:].name, str(e))
+            self.env.cr.commit()
         
         _logger.info('Auto-enrollment completed: %d students enrolled, %d errors', enrollment_count, error_count)
         return {
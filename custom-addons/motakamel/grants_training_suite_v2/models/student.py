@@ -3,8 +3,11 @@
 import logging
 from datetime import datetime, date
 from odoo import models, fields, api, _
+from odoo.osv import expression
 from odoo.exceptions import UserError, ValidationError
 
+from ..utils import student_matching
+
 _logger = logging.getLogger(__name__)
 
 class Student(models.Model):
@@ -52,6 +55,7 @@ class Student(models.Model):
     birth_date = fields.Date(
         string='Birth Date',
         tracking=True,
+        index=True,
         help='Student birth date'
     )
     
@@ -265,6 +269,139 @@ class Student(models.Model):
         help='Reason for eligibility or rejection'
     )
     
+    # Duplicate Detection (blocking keys)
+    phone_key = fields.Char(
+        string='Phone Key',
+        compute='_compute_duplicate_keys',
+        store=True,
+        index=True,
+        help='Normalized phone number used to find duplicate students'
+    )
+    
+    name_arabic_key = fields.Char(
+        string='Arabic Name Key',
+        compute='_compute_duplicate_keys',
+        store=True,
+        index=True,
+        help='Normalized Arabic name used to find duplicate students'
+    )
+    
+    name_english_key = fields.Char(
+        string='English Name Key',
+        compute='_compute_duplicate_keys',
+        store=True,
+        index=True,
+        help='Phonetic key of the English name used to find duplicate students'
+    )
+    
+    duplicate_candidate_ids = fields.Many2many(
+        'gr.student',
+        string='Possible Duplicates',
+        compute='_compute_duplicate_candidate_ids',
+        help='Existing students that are likely the same person'
+    )
+    
+    @api.depends('phone', 'name_arabic', 'name_english')
+    def _compute_duplicate_keys(self):
+        """Compute the blocking keys used by duplicate detection."""
+        for record in self:
+            record.phone_key = student_matching.normalize_phone(record.phone)
+            record.name_arabic_key = student_matching.arabic_name_key(record.name_arabic)
+            record.name_english_key = student_matching.english_name_key(record.name_english)
+    
+    @api.depends('email', 'phone', 'birth_date', 'name_arabic', 'name_english')
+    def _compute_duplicate_candidate_ids(self):
+        """Compute likely duplicates of the students being edited."""
+        vals_list = [{
+            'email': record.email,
+            'phone': record.phone,
+            'birth_date': record.birth_date,
+            'name_arabic': record.name_arabic,
+            'name_english': record.name_english,
+        } for record in self]
+        matches = self._find_duplicate_candidates(vals_list)
+        for record, candidates in zip(self, matches):
+            duplicates = self.browse([
+                student.id for student, _score in candidates if student.id != record._origin.id
+            ])
+            record.duplicate_candidate_ids = duplicates
+    
+    @api.model
+    def _find_duplicate_candidates(self, vals_list, threshold=0.6, limit=5):
+        """Return likely existing duplicates for each student values dictionary.
+
+        Candidates are fetched with a single query on the indexed blocking keys
+        (email, normalized phone, Arabic name and English phonetic name), so only
+        students sharing at least one key are scored instead of every pair.
+        Returns, for each entry of ``vals_list``, a list of ``(student, score)``
+        sorted by decreasing score.
+        """
+        keyed_vals = []
+        emails, phone_keys, arabic_keys, english_keys = set(), set(), set(), set()
+        for vals in vals_list:
+            keys = {
+                'email': str(vals.get('email') or '').strip().lower() or False,
+                'phone_key': student_matching.normalize_phone(vals.get('phone')),
+                'birth_date': student_matching.normalize_birth_date(vals.get('birth_date')),
+                'name_arabic': vals.get('name_arabic'),
+                'name_english': vals.get('name_english'),
+                'name_arabic_key': student_matching.arabic_name_key(vals.get('name_arabic')),
+                'name_english_key': student_matching.english_name_key(vals.get('name_english')),
+            }
+            keyed_vals.append(keys)
+            if vals.get('email'):
+                emails.add(str(vals['email']).strip())
+            for key, key_set in (('email', emails), ('phone_key', phone_keys),
+                                 ('name_arabic_key', arabic_keys), ('name_english_key', english_keys)):
+                if keys[key]:
+                    key_set.add(keys[key])
+
+        domains = []
+        if emails:
+            domains.append([('email', 'in', list(emails))])
+        if phone_keys:
+            domains.append([('phone_key', 'in', list(phone_keys))])
+        if arabic_keys:
+            domains.append([('name_arabic_key', 'in', list(arabic_keys))])
+        if english_keys:
+            domains.append([('name_english_key', 'in', list(english_keys))])
+        if not domains:
+            return [[] for _vals in vals_list]
+
+        candidates = self.search(expression.OR(domains))
+        candidate_data = {}
+        blocks = {}
+        for student in candidates:
+            data = {
+                'email': student.email,
+                'phone_key': student.phone_key,
+                'birth_date': student.birth_date,
+                'name_arabic': student.name_arabic,
+                'name_english': student.name_english,
+            }
+            candidate_data[student.id] = (student, data)
+            for key, value in (('email', (student.email or '').lower()), ('phone_key', student.phone_key),
+                               ('name_arabic_key', student.name_arabic_key),
+                               ('name_english_key', student.name_english_key)):
+                if value:
+                    blocks.setdefault((key, value), set()).add(student.id)
+
+        results = []
+        for keys in keyed_vals:
+            block_ids = set()
+            for key in ('email', 'phone_key', 'name_arabic_key', 'name_english_key'):
+                if keys[key]:
+                    block_ids |= blocks.get((key, keys[key]), set())
+            scored = []
+            for student_id in block_ids:
+                student, data = candidate_data[student_id]
+                score = student_matching.duplicate_score(keys, data)
+                if score >= threshold:
+                    scored.append((student, score))
+            scored.sort(key=lambda item: (-item[1], item[0].id))
+            results.append(scored[:limit])
+        return results
+    
     @api.depends('birth_date')
     def _compute_age(self):
         """Compute age from birth date."""
@@ -314,60 +451,16 @@ class Student(models.Model):
         if not self.is_eligible:
             raise UserError(_('Student is not eligible for enrollment. Please check eligibility criteria.'))
         
-        # Find active course integrations with auto-enrollment enabled
-        domain = [
-            ('status', '=', 'active'),
-            ('auto_enroll_eligible', '=', True)
-        ]
+        # Preferred course exists but not auto-enroll eligible, show message
+        preferred = self.preferred_course_integration_id
+        if preferred and preferred.status == 'active' and not preferred.auto_enroll_eligible:
+            raise UserError(_('Your preferred course "%s" is not available for auto-enrollment. Please use manual enrollment.') % preferred.name)
         
-        # If student has a preferred course, prioritize it
-        if self.preferred_course_integration_id and self.preferred_course_integration_id.status == 'active':
-            if self.preferred_course_integration_id.auto_enroll_eligible:
-                course_integrations = self.preferred_course_integration_id
-            else:
-                # Preferred course exists but not auto-enroll eligible, show message
-                raise UserError(_('Your preferred course "%s" is not available for auto-enrollment. Please use manual enrollment.') % self.preferred_course_integration_id.name)
-        else:
-            course_integrations = self.env['gr.course.integration'].search(domain)
-        
-        enrollments_created = 0
-        for integration in course_integrations:
-            # Check if student is already enrolled
-            existing_enrollment = self.env['slide.channel.partner'].search([
-                ('partner_id', '=', self.id),
-                ('channel_id', '=', integration.elearning_course_id.id)
-            ])
-            
-            if not existing_enrollment:
-                try:
-                    # Create eLearning enrollment
-                    enrollment = self.env['slide.channel.partner'].create({
-                        'partner_id': self.id,
-                        'channel_id': integration.elearning_course_id.id,
-                        'enroll_date': fields.Datetime.now(),
-                    })
-                    
-                    # Create progress tracker
-                    self.env['gr.progress.tracker'].create({
-                        'student_id': self.id,
-                        'course_integration_id': integration.id,
-                        'elearning_enrollment_id': enrollment.id,
-                        'status': 'not_started',
-                    })
-                    
-                    enrollments_created += 1
-                    _logger.info('Auto-enrolled student %s in course %s', self.name, integration.elearning_course_id.name)
-                    
-                except Exception as e:
-                    _logger.error('Failed to auto-enroll student %s in course %s: %s', 
-                                self.name, integration.elearning_course_id.name, str(e))
-                    continue
+        result = self._auto_enroll_in_eligible_courses()
+        enrollments_created = result['enrollment_count']
         
         if enrollments_created > 0:
-            # Update integration status
-            self.integration_status = 'enrolled'
             message = _('Auto-enrolled in %d eLearning courses') % enrollments_created
-            self.message_post(body=message)
             return {
                 'type': 'ir.actions.client',
                 'tag': 'display_notification',
@@ -394,6 +487,96 @@ class Student(models.Model):
                 }
             }
     
+    def _get_auto_enroll_courses(self):
+        """Return, per student id, the course integrations to auto-enroll in.
+        
+        An active preferred course is used when it allows auto-enrollment;
+        students whose active preferred course does not allow it get no
+        course. Other students get every active auto-enroll course, found
+        with a single search.
+        """
+        auto_courses = self.env['gr.course.integration'].search([
+            ('status', '=', 'active'),
+            ('auto_enroll_eligible', '=', True)
+        ])
+        courses_by_student = {}
+        for student in self:
+            preferred = student.preferred_course_integration_id
+            if preferred and preferred.status == 'active':
+                courses_by_student[student.id] = preferred if preferred.auto_enroll_eligible else preferred.browse()
+            else:
+                courses_by_student[student.id] = auto_courses
+        return courses_by_student
+    
+    def _auto_enroll_in_eligible_courses(self):
+        """Enroll the students in their auto-enroll courses in bulk.
+        
+        Existing eLearning enrollments of all (student, course) pairs are
+        read with one query. The missing enrollments and their progress
+        trackers are created with two batched creates, the integration
+        status of the enrolled students is set with one write and their
+        chatter messages are logged in one batch.
+        
+        Returns a dictionary with the enrolled students and the number of
+        enrollments created.
+        """
+        courses_by_student = self._get_auto_enroll_courses()
+        pairs = [
+            (student_id, course)
+            for student_id, courses in courses_by_student.items()
+            for course in courses
+            if course.elearning_course_id
+        ]
+        if not pairs:
+            return {'students': self.browse(), 'enrollment_count': 0}
+        
+        # Students are mapped to eLearning members by id, as in the rest of the module
+        Enrollment = self.env['slide.channel.partner']
+        Enrollment.flush_model(['partner_id', 'channel_id'])
+        self.env.cr.execute("""
+            SELECT partner_id, channel_id
+              FROM slide_channel_partner
+             WHERE partner_id = ANY(%s)
+               AND channel_id = ANY(%s)
+        """, [
+            list({student_id for student_id, _course in pairs}),
+            list({course.elearning_course_id.id for _student_id, course in pairs}),
+        ])
+        existing = set(self.env.cr.fetchall())
+        missing_pairs = []
+        for student_id, course in pairs:
+            key = (student_id, course.elearning_course_id.id)
+            if key not in existing:
+                existing.add(key)
+                missing_pairs.append((student_id, course))
+        if not missing_pairs:
+            return {'students': self.browse(), 'enrollment_count': 0}
+        
+        now = fields.Datetime.now()
+        enrollments = Enrollment.create([{
+            'partner_id': student_id,
+            'channel_id': course.elearning_course_id.id,
+            'enroll_date': now,
+        } for student_id, course in missing_pairs])
+        self.env['gr.progress.tracker'].create([{
+            'student_id': student_id,
+            'course_integration_id': course.id,
+            'elearning_enrollment_id': enrollment.id,
+            'status': 'not_started',
+        } for (student_id, course), enrollment in zip(missing_pairs, enrollments)])
+        
+        counts = {}
+        for student_id, _course in missing_pairs:
+            counts[student_id] = counts.get(student_id, 0) + 1
+        students = self.browse(list(counts))
+        students.write({'integration_status': 'enrolled'})
+        students._message_log_batch(bodies={
+            student_id: _('Auto-enrolled in %d eLearning courses') % count
+            for student_id, count in counts.items()
+        })
+        _logger.info('Auto-enrolled %d students in %d eLearning courses', len(students), len(missing_pairs))
+        return {'students': students, 'enrollment_count': len(missing_pairs)}
+    
     def action_manual_enroll_course(self):
         """Manual enrollment in specific eLearning course."""
         self.ensure_one()
@@ -5,6 +5,8 @@ from odoo.exceptions import UserError
 import logging
 from datetime import datetime, timedelta
 
+from .cron_run import track_cron_run
+
 _logger = logging.getLogger(__name__)
 
 
@@ -473,6 +475,7 @@ class TrainingDashboard(models.Model):
         }
 
     @api.model
+    @track_cron_run('Dashboard Auto Refresh')
     def refresh_all_dashboards(self):
         """Refresh all active dashboards."""
         _logger.info('Refreshing all active dashboards...')
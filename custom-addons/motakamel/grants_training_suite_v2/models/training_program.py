@@ -1,7 +1,7 @@
 # -*- coding: utf-8 -*-
 
 from odoo import models, fields, api, _
-from odoo.exceptions import ValidationError
+from odoo.exceptions import UserError, ValidationError
 import logging
 
 _logger = logging.getLogger(__name__)
@@ -196,70 +196,79 @@ class TrainingProgram(models.Model):
     
     def action_generate_certificates(self):
         """Generate certificates for completed students."""
-        for record in self:
-            # TODO: Add certificate template validation when gr.certificate.template model is created
-            # if not record.certificate_template_id:
-            #     raise ValidationError(_('No certificate template configured for this program.'))
-            
-            # Get students who completed all courses
-            completed_students = self._get_completed_students()
-            
-            certificates_created = 0
-            for student in completed_students:
-                # Check if certificate already exists
-                existing_cert = self.env['gr.certificate'].search([
-                    ('student_id', '=', student.id),
-                    ('certificate_type', '=', 'program_completion'),
-                    ('training_program_id', '=', record.id)
-                ])
-                
-                if not existing_cert:
-                    self.env['gr.certificate'].create({
-                        'student_id': student.id,
-                        'certificate_type': 'program_completion',
-                        'training_program_id': record.id,
-                        'state': 'draft'
-                    })
-                    certificates_created += 1
-            
-            _logger.info('Generated %d certificates for program: %s', certificates_created, record.name)
-            return {
-                'type': 'ir.actions.client',
-                'tag': 'display_notification',
-                'params': {
-                    'title': _('Certificates Generated'),
-                    'message': _('Generated %d certificates for program: %s') % (certificates_created, record.name),
-                    'type': 'success',
-                }
+        # TODO: Add certificate template validation when gr.certificate.template model is created
+        # if not record.certificate_template_id:
+        #     raise ValidationError(_('No certificate template configured for this program.'))
+        
+        # Get students who completed all courses, for all programs at once
+        completed_by_program = self._get_completed_students_by_program()
+        
+        # Skip students who already have a program certificate
+        existing_certificates = self.env['gr.certificate'].search_read([
+            ('certificate_type', '=', 'program_completion'),
+            ('training_program_id', 'in', self.ids),
+            ('student_id', 'in', list({sid for sids in completed_by_program.values() for sid in sids})),
+        ], ['student_id', 'training_program_id'])
+        certified = {
+            (cert['training_program_id'][0], cert['student_id'][0]) for cert in existing_certificates
+        }
+        
+        certificate_vals_list = [{
+            'student_id': student_id,
+            'certificate_type': 'program_completion',
+            'training_program_id': program_id,
+            'state': 'draft'
+        } for program_id, student_ids in completed_by_program.items()
+            for student_id in sorted(student_ids) if (program_id, student_id) not in certified]
+        self.env['gr.certificate'].create(certificate_vals_list)
+        
+        certificates_created = len(certificate_vals_list)
+        program_names = ', '.join(self.mapped('name'))
+        _logger.info('Generated %d certificates for program: %s', certificates_created, program_names)
+        return {
+            'type': 'ir.actions.client',
+            'tag': 'display_notification',
+            'params': {
+                'title': _('Certificates Generated'),
+                'message': _('Generated %d certificates for program: %s') % (certificates_created, program_names),
+                'type': 'success',
             }
+        }
+    
+    def _get_completed_students_by_program(self):
+        """Return ``{program_id: set(student_ids)}`` of students who completed all courses.
+
+        A single grouped query compares, per program and student, the number of
+        completed trackers with the number of courses of the program.
+        """
+        result = {program.id: set() for program in self}
+        if not self.ids:
+            return result
+        
+        self.env['gr.progress.tracker'].flush_model(['student_id', 'course_integration_id', 'status'])
+        self.env['gr.course.integration'].flush_model(['training_program_id'])
+        self.env.cr.execute("""
+            WITH program_courses AS (
+                SELECT training_program_id, COUNT(*) AS course_count
+                  FROM gr_course_integration
+                 WHERE training_program_id IN %s
+                 GROUP BY training_program_id
+            )
+            SELECT c.training_program_id, t.student_id
+              FROM gr_progress_tracker t
+              JOIN gr_course_integration c ON c.id = t.course_integration_id
+              JOIN program_courses pc ON pc.training_program_id = c.training_program_id
+             WHERE t.status = 'completed'
+             GROUP BY c.training_program_id, t.student_id, pc.course_count
+            HAVING COUNT(DISTINCT t.course_integration_id) = pc.course_count
+        """, [tuple(self.ids)])
+        for program_id, student_id in self.env.cr.fetchall():
+            result[program_id].add(student_id)
+        return result
     
     def _get_completed_students(self):
         """Get students who have completed all courses in the program."""
-        completed_students = []
-        
-        for record in self:
-            # Get all students enrolled in any course of this program
-            all_students = set()
-            for course in record.course_integrations:
-                for tracker in course.progress_trackers:
-                    all_students.add(tracker.student_id.id)
-            
-            # Check each student's completion status
-            for student_id in all_students:
-                student = self.env['gr.student'].browse(student_id)
-                all_courses_completed = True
-                
-                for course in record.course_integrations:
-                    tracker = self.env['gr.progress.tracker'].search([
-                        ('student_id', '=', student_id),
-                        ('course_integration_id', '=', course.id)
-                    ])
-                    
-                    if not tracker or tracker.status != 'completed':
-                        all_courses_completed = False
-                        break
-                
-                if all_courses_completed:
-                    completed_students.append(student)
-        
-        return completed_students
+        completed_by_program = self._get_completed_students_by_program()
+        return self.env['gr.student'].browse(
+            sorted({student_id for student_ids in completed_by_program.values() for student_id in student_ids})
+        )
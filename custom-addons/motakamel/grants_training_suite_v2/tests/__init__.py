@@ -3,3 +3,12 @@
 from . import test_student_name_fields
 from . import test_enrollment_fixes
 from . import test_column_mapping
+from . import test_cron_run
+from . import test_intake_validation
+from . import test_student_duplicates
+from . import test_homework_grading
+from . import test_bulk_enrollment
+from . import test_session_scheduling
+from . import test_program_completion
+from . import test_binary_storage
+from . import test_auto_enrollment
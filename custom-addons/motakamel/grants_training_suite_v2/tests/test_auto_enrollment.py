@@ -0,0 +1,65 @@
+# -*- coding: utf-8 -*-
+
+from odoo.tests.common import TransactionCase
+
+
+class TestAutoEnrollment(TransactionCase):
+    """Test the set-based auto-enrollment of eligible students."""
+
+    def setUp(self):
+        super(TestAutoEnrollment, self).setUp()
+        self.program = self.env['gr.training.program'].create({
+            'name': 'Auto Program',
+            'status': 'active',
+        })
+        self.courses = self.env['gr.course.integration'].create([{
+            'name': f'Auto Course {i}',
+            'elearning_course_id': self.env['slide.channel'].create({'name': f'Auto Channel {i}'}).id,
+            'training_program_id': self.program.id,
+            'status': 'active',
+            'auto_enroll_eligible': True,
+        } for i in range(2)])
+        self.students = self.env['gr.student'].create([{
+            'name': f'Auto Student {i}',
+            'name_arabic': f'طالب {i}',
+            'name_english': f'Auto Student {i}',
+            'email': f'auto{i}@example.com',
+        } for i in range(3)])
+
+    def test_missing_enrollments_created_in_bulk(self):
+        """Only missing enrollments are created, each with its progress tracker."""
+        Enrollment = self.env['slide.channel.partner']
+        Enrollment.create({
+            'partner_id': self.students[0].id,
+            'channel_id': self.courses[0].elearning_course_id.id,
+        })
+
+        result = self.students._auto_enroll_in_eligible_courses()
+
+        self.assertEqual(result['enrollment_count'], len(self.students) * len(self.courses) - 1)
+        self.assertEqual(result['students'], self.students)
+        trackers = self.env['gr.progress.tracker'].search([('student_id', 'in', self.students.ids)])
+        self.assertEqual(len(trackers), result['enrollment_count'])
+        self.assertTrue(all(tracker.elearning_enrollment_id for tracker in trackers))
+        self.assertEqual(set(self.students.mapped('integration_status')), {'enrolled'})
+
+        # Running again creates nothing
+        self.assertEqual(self.students._auto_enroll_in_eligible_courses()['enrollment_count'], 0)
+
+    def test_preferred_course_restricts_enrollment(self):
+        """An active preferred course replaces the other auto-enroll courses."""
+        manual_course = self.env['gr.course.integration'].create({
+            'name': 'Manual Course',
+            'elearning_course_id': self.env['slide.channel'].create({'name': 'Manual Channel'}).id,
+            'training_program_id': self.program.id,
+            'status': 'active',
+            'auto_enroll_eligible': False,
+        })
+        self.students[0].preferred_course_integration_id = self.courses[1]
+        self.students[1].preferred_course_integration_id = manual_course
+
+        courses = self.students._get_auto_enroll_courses()
+
+        self.assertEqual(courses[self.students[0].id], self.courses[1])
+        self.assertFalse(courses[self.students[1].id])
+        self.assertEqual(courses[self.students[2].id], self.courses)
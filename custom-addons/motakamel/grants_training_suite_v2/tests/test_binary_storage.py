@@ -0,0 +1,70 @@
+# -*- coding: utf-8 -*-
+
+import base64
+
+from odoo.tests.common import TransactionCase
+
+
+class TestBinaryStorage(TransactionCase):
+    """Test that uploaded files and generated PDFs are kept in the filestore."""
+
+    def setUp(self):
+        super(TestBinaryStorage, self).setUp()
+        self.csv_data = b'name,email\nAhmed Ali,ahmed@example.com\n'
+        self.student = self.env['gr.student'].create({
+            'name': 'Filestore Student',
+            'name_arabic': 'طالب',
+            'name_english': 'Filestore Student',
+            'email': 'filestore@example.com',
+        })
+
+    def _field_attachment(self, record, field_name):
+        return self.env['ir.attachment'].sudo().search([
+            ('res_model', '=', record._name),
+            ('res_field', '=', field_name),
+            ('res_id', '=', record.id),
+        ])
+
+    def test_intake_file_in_filestore(self):
+        """The intake file is stored as an attachment and its size read from it."""
+        batch = self.env['gr.intake.batch'].create({
+            'name': 'Filestore Batch',
+            'filename': 'students.csv',
+            'file_data': base64.b64encode(self.csv_data),
+        })
+        attachment = self._field_attachment(batch, 'file_data')
+
+        self.assertEqual(len(attachment), 1)
+        self.assertEqual(attachment.raw, self.csv_data)
+        self.assertEqual(batch.file_size, len(self.csv_data))
+
+    def test_identical_files_share_storage(self):
+        """Identical payloads are deduplicated in the filestore."""
+        batches = self.env['gr.intake.batch'].create([{
+            'name': f'Filestore Batch {i}',
+            'filename': 'students.csv',
+            'file_data': base64.b64encode(self.csv_data),
+        } for i in range(2)])
+        attachments = self._field_attachment(batches[0], 'file_data') | self._field_attachment(batches[1], 'file_data')
+
+        self.assertEqual(len(attachments), 2)
+        self.assertEqual(len(set(attachments.mapped('checksum'))), 1)
+        self.assertEqual(len(set(attachments.mapped('store_fname'))), 1)
+
+    def test_certificate_download_streams_field(self):
+        """The certificate is downloaded through the streaming field route."""
+        certificate = self.env['gr.certificate'].create({
+            'student_id': self.student.id,
+            'certificate_type': 'completion',
+            'certificate_title': 'Filestore Certificate',
+            'certificate_file': base64.b64encode(b'%PDF-1.4 certificate'),
+            'certificate_filename': 'certificate test.pdf',
+        })
+
+        action = certificate.action_download_certificate()
+
+        self.assertEqual(
+            action['url'],
+            f'/web/content/gr.certificate/{certificate.id}/certificate_file/certificate%20test.pdf?download=true',
+        )
+        self.assertEqual(certificate._get_certificate_file_attachment().raw, b'%PDF-1.4 certificate')
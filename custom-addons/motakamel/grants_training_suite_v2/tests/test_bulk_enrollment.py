@@ -0,0 +1,70 @@
+# -*- coding: utf-8 -*-
+
+from odoo.tests.common import TransactionCase
+
+
+class TestBulkEnrollment(TransactionCase):
+    """Test the bulk enrollment path of the enrollment wizard."""
+
+    def setUp(self):
+        super(TestBulkEnrollment, self).setUp()
+        self.program = self.env['gr.training.program'].create({
+            'name': 'Bulk Program',
+            'status': 'active',
+        })
+        self.courses = self.env['gr.course.integration'].create([{
+            'name': f'Bulk Course {i}',
+            'elearning_course_id': self.env['slide.channel'].create({'name': f'Bulk Channel {i}'}).id,
+            'training_program_id': self.program.id,
+            'status': 'active',
+        } for i in range(2)])
+        self.students = self.env['gr.student'].create([{
+            'name': f'Bulk Student {i}',
+            'name_arabic': f'طالب {i}',
+            'name_english': f'Bulk Student {i}',
+            'email': f'bulk{i}@example.com',
+        } for i in range(4)])
+
+    def test_only_missing_pairs_are_created(self):
+        """Existing trackers are kept and only the missing pairs are created."""
+        Tracker = self.env['gr.progress.tracker']
+        Tracker.create({
+            'student_id': self.students[0].id,
+            'course_integration_id': self.courses[0].id,
+            'status': 'not_started',
+        })
+        wizard = self.env['gr.enrollment.wizard'].create({
+            'training_program_id': self.program.id,
+            'enrollment_type': 'invite_and_enroll',
+            'student_selection_type': 'selected_students',
+            'selected_student_ids': [(6, 0, self.students.ids)],
+        })
+
+        wizard.action_proceed_with_enrollment()
+
+        trackers = Tracker.search([('student_id', 'in', self.students.ids)])
+        self.assertEqual(len(trackers), len(self.students) * len(self.courses))
+        self.assertEqual(wizard.state, 'done')
+        self.assertEqual(wizard.processed_count, 4)
+        self.assertEqual(wizard.enrolled_count, 4)
+        self.assertEqual(wizard.invited_count, 4)
+        self.assertEqual(wizard.progress_percentage, 100.0)
+
+    def test_large_selection_is_queued(self):
+        """Selections above the threshold are processed by the scheduled job."""
+        wizard = self.env['gr.enrollment.wizard'].create({
+            'course_integration_id': self.courses[0].id,
+            'enrollment_type': 'direct_enroll',
+            'student_selection_type': 'selected_students',
+            'selected_student_ids': [(6, 0, self.students.ids)],
+        })
+        self.patch(type(wizard), 'BACKGROUND_THRESHOLD', 2)
+        self.patch(type(wizard), 'CHUNK_SIZE', 3)
+        self.patch(self.env.cr, 'commit', lambda: None)
+
+        wizard.action_proceed_with_enrollment()
+        self.assertEqual(wizard.state, 'queued')
+
+        wizard._cron_process_queued_enrollments()
+        self.assertEqual(wizard.state, 'done')
+        self.assertEqual(wizard.enrolled_count, 4)
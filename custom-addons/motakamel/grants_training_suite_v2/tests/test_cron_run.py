@@ -0,0 +1,33 @@
+# -*- coding: utf-8 -*-
+
+from odoo.tests.common import TransactionCase
+
+
+class TestCronRun(TransactionCase):
+    """Test the scheduled job run telemetry."""
+
+    def test_tracked_job_records_run(self):
+        """A tracked cron entry point stores one run with its counters."""
+        CronRun = self.env['gr.cron.run']
+        runs_before = CronRun.search_count([('job_name', '=', 'Notification Cleanup')])
+
+        result = self.env['gr.progress.notification'].cleanup_old_notifications()
+
+        run = CronRun.search([('job_name', '=', 'Notification Cleanup')], limit=1)
+        self.assertEqual(CronRun.search_count([('job_name', '=', 'Notification Cleanup')]), runs_before + 1)
+        self.assertEqual(run.state, 'done')
+        self.assertEqual(run.method_name, 'cleanup_old_notifications')
+        self.assertEqual(run.model_name, 'gr.progress.notification')
+        self.assertEqual(run.rows_processed, result)
+        self.assertGreaterEqual(run.duration, 0.0)
+        self.assertGreater(run.query_count, 0)
+
+    def test_statistics_view(self):
+        """The statistics view aggregates the recorded runs per job and day."""
+        self.env['gr.training.dashboard'].refresh_all_dashboards()
+        self.env.flush_all()
+
+        stats = self.env['gr.cron.run.statistics'].search([('job_name', '=', 'Dashboard Auto Refresh')])
+        self.assertTrue(stats)
+        self.assertGreaterEqual(stats[0].run_count, 1)
+        self.assertGreaterEqual(stats[0].p95_duration, stats[0].p50_duration)
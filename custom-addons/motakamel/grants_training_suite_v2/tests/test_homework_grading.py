@@ -0,0 +1,50 @@
+# -*- coding: utf-8 -*-
+
+from datetime import timedelta
+
+from odoo import fields
+from odoo.tests.common import TransactionCase
+
+
+class TestHomeworkGrading(TransactionCase):
+    """Test the batched create and write paths of homework attempts."""
+
+    def setUp(self):
+        super(TestHomeworkGrading, self).setUp()
+        self.HomeworkAttempt = self.env['gr.homework.attempt']
+        self.students = self.env['gr.student'].create([{
+            'name': f'Student {i}',
+            'name_arabic': f'طالب {i}',
+            'name_english': f'Student {i}',
+            'email': f'student{i}@example.com',
+        } for i in range(3)])
+        self.due_date = fields.Datetime.now() + timedelta(days=7)
+
+    def _create_attempts(self, title, students):
+        return self.HomeworkAttempt.create([{
+            'student_id': student.id,
+            'homework_title': title,
+            'due_date': self.due_date,
+        } for student in students])
+
+    def test_attempt_numbers(self):
+        """Attempt numbers count previous attempts, including those of the same batch."""
+        self._create_attempts('Essay', self.students[:1])
+        attempts = self._create_attempts('Essay', self.students[:1] + self.students)
+
+        self.assertEqual(attempts.mapped('attempt_number'), [2, 3, 1, 1])
+
+    def test_bulk_grade_history(self):
+        """A bulk grade write creates one history row per changed grade only."""
+        attempts = self._create_attempts('Quiz', self.students)
+        attempts[0].grade = 80.0
+        history = self.env['gr.homework.grade.history']
+        history_before = history.search_count([('homework_attempt_id', 'in', attempts.ids)])
+
+        attempts.write({'grade': 80.0})
+
+        new_history = history.search([('homework_attempt_id', 'in', attempts.ids)])
+        self.assertEqual(len(new_history), history_before + 2)
+        self.assertEqual(set(attempts.mapped('grade')), {80.0})
+        latest = new_history.filtered(lambda h: h.homework_attempt_id == attempts[1])
+        self.assertEqual((latest.old_grade, latest.new_grade), (0.0, 80.0))
@@ -0,0 +1,127 @@
+# -*- coding: utf-8 -*-
+
+from odoo.tests.common import TransactionCase
+
+from ..utils.intake_validation import IntakeRecordValidator
+
+
+class TestIntakeValidation(TransactionCase):
+    """Test the column-oriented intake row validation."""
+
+    def setUp(self):
+        super(TestIntakeValidation, self).setUp()
+        self.intake_batch = self.env['gr.intake.batch'].create({
+            'name': 'Test Validation Batch',
+        })
+        self.valid_record = {
+            'name': 'Ahmed Ali',
+            'name_arabic': 'أحمد علي',
+            'name_english': 'Ahmed Ali',
+            'email': 'ahmed@example.com',
+            'birth_date': '1995-04-12',
+            'gender': 'male',
+            'english_level': 'intermediate',
+            'has_certificate': 'no',
+        }
+
+    def test_valid_record(self):
+        """A complete record produces neither errors nor warnings."""
+        row_errors, row_warnings = IntakeRecordValidator([self.valid_record]).validate()
+        self.assertEqual(row_errors, [[]])
+        self.assertEqual(row_warnings, [[]])
+
+    def test_row_messages(self):
+        """Errors and warnings keep their row numbers and wording."""
+        records = [
+            self.valid_record,
+            dict(self.valid_record, email='AHMED@example.com', birth_date='31/12/1995'),
+            dict(self.valid_record, name='Other', email='other@example', birth_date='1800-01-01'),
+            dict(self.valid_record, name='Third', email='third@example.com', gender='x', birth_date='12-31-1995'),
+        ]
+
+        errors = self.intake_batch._validate_records(records)
+
+        self.assertEqual(errors, [
+            'Row 2: Duplicate email address "AHMED@example.com"',
+            'Row 3: Invalid email format "other@example"',
+            'Row 4: Invalid date format for birth_date "12-31-1995". Use YYYY-MM-DD format.',
+            'Row 4: Invalid gender "x". Use "male", "female", "m", or "f".',
+        ])
+        self.assertEqual(self.intake_batch.validation_warnings, '\n'.join([
+            'Row 2: Duplicate name "Ahmed Ali" (may be intentional)',
+            'Row 3: Birth date "1800-01-01" seems unusual',
+        ]))
+
+    def test_failed_records_details(self):
+        """Rows with errors are stored for the correction interface."""
+        records = [self.valid_record, dict(self.valid_record, name_arabic='', email='second@example.com')]
+
+        errors = self.intake_batch._validate_records_with_details(records)
+
+        self.assertEqual(errors, ['Row 2: Missing required field "name_arabic"'])
+        self.assertEqual(self.intake_batch.failed_records_count, 1)
+        failed = self.intake_batch.failed_record_ids
+        self.assertEqual(failed.row_number, 2)
+        self.assertEqual(failed.status, 'failed')
+        self.assertEqual(failed.data['email'], 'second@example.com')
+        self.assertEqual(failed.errors, 'Missing required field "name_arabic"')
+
+        # Validating again replaces the stored rows
+        self.intake_batch._validate_records_with_details([self.valid_record])
+        self.assertFalse(self.intake_batch.failed_record_ids)
+        self.assertEqual(self.intake_batch.failed_records_count, 0)
+
+    def test_failed_records_correction(self):
+        """Corrections update a single row and the stored counts."""
+        records = [
+            dict(self.valid_record, name_arabic=''),
+            dict(self.valid_record, name='Other', email='other@example'),
+            dict(self.valid_record, name='Third', email=''),
+        ]
+        self.intake_batch._validate_records_with_details(records)
+        wizard = self.env['gr.intake.batch.correction.wizard'].create({
+            'intake_batch_id': self.intake_batch.id,
+        })
+        self.assertEqual(wizard.state, 'correcting')
+        self.assertEqual(wizard.failed_records_count, 3)
+
+        wizard.action_correct_record(1, {'name_arabic': 'أحمد علي'})
+        wizard.action_correct_record(2, {'email': 'other@example.com'})
+        wizard.action_skip_record(3)
+
+        first = self.intake_batch.failed_record_ids.filtered(lambda r: r.row_number == 1)
+        self.assertEqual(first.status, 'corrected')
+        self.assertEqual(first.data['name_arabic'], 'أحمد علي')
+        self.assertEqual(first.corrections[0]['old_value'], '')
+        self.assertEqual(self.intake_batch.failed_records_count, 3)
+        self.assertEqual(self.intake_batch.corrected_records_count, 2)
+        self.assertEqual(wizard.corrected_records_count, 2)
+
+        wizard.action_validate_corrected_records()
+        self.assertEqual(wizard.state, 'corrected')
+
+    def test_reprocess_corrected_records(self):
+        """Corrected rows create their students and leave the correction interface."""
+        records = [
+            dict(self.valid_record, name_arabic=''),
+            dict(self.valid_record, name='Other', email='other@example'),
+            dict(self.valid_record, name='Third', email=''),
+        ]
+        self.intake_batch._validate_records_with_details(records)
+        wizard = self.env['gr.intake.batch.correction.wizard'].create({
+            'intake_batch_id': self.intake_batch.id,
+        })
+        wizard.action_correct_record(1, {'name_arabic': 'أحمد علي'})
+        wizard.action_correct_record(2, {'email': 'other@example.com'})
+        wizard.action_skip_record(3)
+        wizard.action_validate_corrected_records()
+
+        wizard.action_process_corrected_records()
+
+        students = self.env['gr.student'].search([('intake_batch_id', '=', self.intake_batch.id)])
+        self.assertEqual(sorted(students.mapped('email')), ['ahmed@example.com', 'other@example.com'])
+        self.assertEqual(students.filtered(lambda s: s.email == 'ahmed@example.com').name_arabic, 'أحمد علي')
+        self.assertFalse(students.filtered(lambda s: s.email == 'ahmed@example.com').has_certificate)
+        self.assertEqual(self.intake_batch.corrected_records_count, 0)
+        self.assertEqual(self.intake_batch.failed_record_ids.mapped('status'), ['skipped'])
+        self.assertEqual(self.intake_batch.created_students_count, 2)
@@ -0,0 +1,52 @@
+# -*- coding: utf-8 -*-
+
+from odoo.tests.common import TransactionCase
+
+
+class TestProgramCompletion(TransactionCase):
+    """Test the program completion resolver and certificate generation."""
+
+    def setUp(self):
+        super(TestProgramCompletion, self).setUp()
+        self.program = self.env['gr.training.program'].create({
+            'name': 'Completion Program',
+            'status': 'active',
+        })
+        self.courses = self.env['gr.course.integration'].create([{
+            'name': f'Completion Course {i}',
+            'elearning_course_id': self.env['slide.channel'].create({'name': f'Completion Channel {i}'}).id,
+            'training_program_id': self.program.id,
+        } for i in range(2)])
+        self.students = self.env['gr.student'].create([{
+            'name': f'Completion Student {i}',
+            'name_arabic': f'طالب {i}',
+            'name_english': f'Completion Student {i}',
+            'email': f'completion{i}@example.com',
+        } for i in range(3)])
+        # Student 0 completed both courses, student 1 only one, student 2 none
+        self.env['gr.progress.tracker'].create([{
+            'student_id': student.id,
+            'course_integration_id': course.id,
+            'status': status,
+        } for student, course, status in [
+            (self.students[0], self.courses[0], 'completed'),
+            (self.students[0], self.courses[1], 'completed'),
+            (self.students[1], self.courses[0], 'completed'),
+            (self.students[1], self.courses[1], 'in_progress'),
+            (self.students[2], self.courses[0], 'not_started'),
+        ]])
+
+    def test_completed_students(self):
+        """Only students who completed every course of the program are returned."""
+        self.assertEqual(self.program._get_completed_students(), self.students[0])
+
+    def test_generate_certificates_once(self):
+        """Certificates are created once per completed student."""
+        Certificate = self.env['gr.certificate']
+        domain = [('training_program_id', '=', self.program.id), ('certificate_type', '=', 'program_completion')]
+
+        self.program.action_generate_certificates()
+        self.program.action_generate_certificates()
+
+        self.assertEqual(Certificate.search(domain).student_id, self.students[0])
+        self.assertEqual(Certificate.search_count(domain), 1)
@@ -0,0 +1,55 @@
+# -*- coding: utf-8 -*-
+
+from odoo.tests.common import TransactionCase
+
+
+class TestSessionScheduling(TransactionCase):
+    """Test the batch session scheduler of intake batches."""
+
+    def setUp(self):
+        super(TestSessionScheduling, self).setUp()
+        self.agent = self.env['res.users'].create({
+            'name': 'Scheduling Agent',
+            'login': 'scheduling.agent',
+        })
+        self.template = self.env['gr.session.template'].create({
+            'name': 'Intro Template',
+            'default_topic': 'Welcome Session',
+            'default_duration': 2.0,
+            'default_schedule_days': 3,
+            'preferred_time_slots': '9:00-10:00, 14:00-15:00',
+        })
+        self.batch = self.env['gr.intake.batch'].create({
+            'name': 'Scheduling Batch',
+            'state': 'processed',
+            'session_template_id': self.template.id,
+            'max_sessions_per_slot': 2,
+        })
+        self.students = self.env['gr.student'].create([{
+            'name': f'Scheduled Student {i}',
+            'name_arabic': f'طالب {i}',
+            'name_english': f'Scheduled Student {i}',
+            'email': f'scheduled{i}@example.com',
+            'intake_batch_id': self.batch.id,
+            'assigned_agent_id': self.agent.id if i < 3 else False,
+        } for i in range(6)])
+
+    def test_sessions_spread_over_capacity(self):
+        """Agents get one session per slot and unassigned students share slots."""
+        self.batch.action_create_sessions_for_batch()
+
+        sessions = self.env['gr.course.session'].search([('student_id', 'in', self.students.ids)])
+        self.assertEqual(len(sessions), 6)
+        self.assertEqual(self.batch.sessions_created_count, 6)
+        self.assertEqual(self.batch.sessions_scheduled_count, 6)
+
+        agent_sessions = sessions.filtered(lambda s: s.agent_id == self.agent)
+        self.assertEqual(len(set(agent_sessions.mapped('session_date'))), 3)
+
+        unassigned_dates = sessions.filtered(lambda s: not s.agent_id).mapped('session_date')
+        self.assertEqual(len(set(unassigned_dates)), 2)
+        for session in sessions:
+            self.assertIn((session.session_date.hour, session.session_date.minute), [(9, 0), (14, 0)])
+            self.assertLess(session.session_date.weekday(), 5)
+            self.assertEqual(session.session_topic, 'Welcome Session')
+            self.assertEqual(session.session_duration, 2.0)
@@ -0,0 +1,59 @@
+# -*- coding: utf-8 -*-
+
+from odoo.tests.common import TransactionCase
+
+
+class TestStudentDuplicates(TransactionCase):
+    """Test the blocking-key duplicate student detection."""
+
+    def setUp(self):
+        super(TestStudentDuplicates, self).setUp()
+        self.Student = self.env['gr.student']
+        self.student = self.Student.create({
+            'name': 'Mohammed Ali',
+            'name_arabic': 'محمد علي',
+            'name_english': 'Mohammed Ali',
+            'email': 'mohammed.ali@example.com',
+            'phone': '+966 50 123 4567',
+            'birth_date': '1995-04-12',
+        })
+
+    def test_blocking_keys(self):
+        """Blocking keys ignore phone notation, word order and spelling variants."""
+        self.assertEqual(self.student.phone_key, '501234567')
+        self.assertEqual(self.student.name_english_key, 'A400 M530')
+        self.assertTrue(self.student.name_arabic_key)
+
+    def test_find_candidates_with_other_email(self):
+        """A student with another email but the same phone and birth date is found."""
+        results = self.Student._find_duplicate_candidates([{
+            'name_arabic': 'علي محمد',
+            'name_english': 'Ali Muhammad',
+            'email': 'm.ali@another.com',
+            'phone': '0501234567',
+            'birth_date': '12/04/1995',
+        }, {
+            'name_arabic': 'سارة أحمد',
+            'name_english': 'Sara Ahmed',
+            'email': 'sara@example.com',
+            'phone': '0559876543',
+            'birth_date': '1999-01-01',
+        }])
+
+        self.assertEqual([student for student, _score in results[0]], [self.student])
+        self.assertGreaterEqual(results[0][0][1], 0.6)
+        self.assertEqual(results[1], [])
+
+    def test_form_candidates_exclude_self(self):
+        """The form shows other likely duplicates but never the student itself."""
+        duplicate = self.Student.create({
+            'name': 'Mohamed Ali',
+            'name_arabic': 'محمد على',
+            'name_english': 'Mohamed Ali',
+            'email': 'mohamed.ali@example.org',
+            'phone': '00966501234567',
+            'birth_date': '1995-04-12',
+        })
+
+        self.assertEqual(duplicate.duplicate_candidate_ids, self.student)
+        self.assertEqual(self.student.duplicate_candidate_ids, duplicate)
@@ -0,0 +1,4 @@
+# -*- coding: utf-8 -*-
+
+from . import intake_validation
+from . import student_matching
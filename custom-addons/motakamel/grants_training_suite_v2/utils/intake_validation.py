@@ -0,0 +1,173 @@
+# -*- coding: utf-8 -*-
+
+import re
+from datetime import datetime
+
+REQUIRED_FIELDS = ('name', 'name_arabic', 'name_english', 'email')
+
+# Accepted birth date formats, in order of preference
+DATE_FORMATS = ('%Y-%m-%d', '%d/%m/%Y', '%m/%d/%Y')
+
+VALID_GENDERS = frozenset(['male', 'female', 'm', 'f'])
+VALID_ENGLISH_LEVELS = ('beginner', 'elementary', 'intermediate', 'upper_intermediate', 'advanced')
+VALID_ENGLISH_LEVEL_SET = frozenset(VALID_ENGLISH_LEVELS)
+VALID_BOOLEANS = frozenset(['true', 'false', 'yes', 'no', '1', '0'])
+TRUE_VALUES = frozenset(['true', 'yes', '1'])
+
+# Same rule as before: an "@" and a "." in the part after the last "@"
+EMAIL_RE = re.compile(r'@[^@]*\.[^@]*\Z')
+
+
+def _clean(value):
+    """Return the stripped string form of a cell value."""
+    if value is None:
+        return ''
+    return str(value).strip()
+
+
+def _parse_column(values, formats):
+    """Parse a column of date strings.
+
+    Each distinct value is parsed once, so repeated dates (very common in
+    intake files) cost a dictionary lookup. Returns, per row, the index of
+    the first matching format and the parsed date, or ``(None, None)``.
+    """
+    cache = {}
+    result = []
+    for value in values:
+        if not value:
+            result.append((None, None))
+            continue
+        parsed = cache.get(value)
+        if parsed is None:
+            parsed = (None, None)
+            for index, fmt in enumerate(formats):
+                try:
+                    parsed = (index, datetime.strptime(value, fmt))
+                    break
+                except ValueError:
+                    continue
+            cache[value] = parsed
+        result.append(parsed)
+    return result
+
+
+class IntakeRecordValidator:
+    """Column-oriented validation of intake rows.
+
+    Every rule runs over a whole column at once and appends its messages to
+    the per-row lists, keeping the same messages and the same order as the
+    former row-by-row validation.
+    """
+
+    def __init__(self, records):
+        self.records = records
+        self.row_count = len(records)
+        self.row_errors = [[] for _i in range(self.row_count)]
+        self.row_warnings = [[] for _i in range(self.row_count)]
+
+    def _raw(self, field):
+        return [record.get(field) for record in self.records]
+
+    def _column(self, field):
+        return [_clean(record.get(field, '')) for record in self.records]
+
+    def validate(self):
+        """Run all rules and return ``(row_errors, row_warnings)``."""
+        self._check_required()
+        self._check_emails()
+        self._check_duplicate_names()
+        birth_dates = self._check_birth_dates()
+        self._check_enums()
+        self._check_certificates()
+        self._check_birth_date_ranges(birth_dates)
+        return self.row_errors, self.row_warnings
+
+    def _check_required(self):
+        for field in REQUIRED_FIELDS:
+            message = f'Missing required field "{field}"'
+            for i, value in enumerate(self._raw(field)):
+                if not value or str(value).strip() == '':
+                    self.row_errors[i].append(message)
+
+    def _check_emails(self):
+        seen = set()
+        search = EMAIL_RE.search
+        for i, email in enumerate(self._column('email')):
+            if not email:
+                continue
+            if not search(email):
+                self.row_errors[i].append(f'Invalid email format "{email}"')
+                continue
+            key = email.lower()
+            if key in seen:
+                self.row_errors[i].append(f'Duplicate email address "{email}"')
+            else:
+                seen.add(key)
+
+    def _check_duplicate_names(self):
+        seen = set()
+        for i, name in enumerate(self._column('name')):
+            if not name:
+                continue
+            if name in seen:
+                self.row_warnings[i].append(f'Duplicate name "{name}" (may be intentional)')
+            else:
+                seen.add(name)
+
+    def _check_birth_dates(self):
+        values = self._column('birth_date')
+        parsed = _parse_column(values, DATE_FORMATS)
+        for i, (format_index, _date) in enumerate(parsed):
+            if values[i] and format_index is None:
+                self.row_errors[i].append(
+                    f'Invalid date format for birth_date "{values[i]}". Use YYYY-MM-DD format.'
+                )
+        return values, parsed
+
+    def _check_enums(self):
+        raw_genders = self._raw('gender')
+        for i, gender in enumerate(self._column('gender')):
+            if gender and gender.lower() not in VALID_GENDERS:
+                self.row_errors[i].append(
+                    f'Invalid gender "{raw_genders[i]}". Use "male", "female", "m", or "f".'
+                )
+
+        raw_levels = self._raw('english_level')
+        valid_levels = ", ".join(VALID_ENGLISH_LEVELS)
+        for i, level in enumerate(self._column('english_level')):
+            if level and level.lower() not in VALID_ENGLISH_LEVEL_SET:
+                self.row_errors[i].append(
+                    f'Invalid english_level "{raw_levels[i]}". Valid options: {valid_levels}'
+                )
+
+        raw_certs = self._raw('has_certificate')
+        for i, has_cert in enumerate(self._column('has_certificate')):
+            if has_cert and has_cert.lower() not in VALID_BOOLEANS:
+                self.row_errors[i].append(
+                    f'Invalid has_certificate value "{raw_certs[i]}". Use "true"/"false" or "yes"/"no".'
+                )
+
+    def _check_certificates(self):
+        has_certs = self._column('has_certificate')
+        rows = [i for i, value in enumerate(has_certs) if value.lower() in TRUE_VALUES]
+        if not rows:
+            return
+        cert_dates = [_clean(self.records[i].get('certificate_date', '')) for i in rows]
+        parsed = _parse_column(cert_dates, DATE_FORMATS[:1])
+        for i, cert_date, (format_index, _date) in zip(rows, cert_dates, parsed):
+            cert_type = _clean(self.records[i].get('certificate_type', ''))
+            if not cert_type and not cert_date:
+                self.row_warnings[i].append('Has certificate is true but no certificate details provided')
+            elif cert_date and format_index is None:
+                self.row_errors[i].append(
+                    f'Invalid certificate_date format "{cert_date}". Use YYYY-MM-DD format.'
+                )
+
+    def _check_birth_date_ranges(self, birth_dates):
+        values, parsed = birth_dates
+        current_year = datetime.now().year
+        for i, (format_index, date) in enumerate(parsed):
+            # Only ISO dates are range checked, as before
+            if format_index == 0 and (date.year < 1900 or date.year > current_year):
+                self.row_warnings[i].append(f'Birth date "{values[i]}" seems unusual')
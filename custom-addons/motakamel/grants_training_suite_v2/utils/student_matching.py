@@ -0,0 +1,139 @@
+# -*- coding: utf-8 -*-
+
+import re
+from datetime import date, datetime
+
+from .intake_validation import DATE_FORMATS
+
+# Arabic diacritics (tashkeel), superscript alef and tatweel
+ARABIC_MARKS_RE = re.compile('[\u064B-\u0652\u0670\u0640]')
+ARABIC_LETTER_MAP = str.maketrans({
+    '\u0623': '\u0627',  # alef with hamza above -> alef
+    '\u0625': '\u0627',  # alef with hamza below -> alef
+    '\u0622': '\u0627',  # alef with madda -> alef
+    '\u0671': '\u0627',  # alef wasla -> alef
+    '\u0649': '\u064A',  # alef maksura -> ya
+    '\u0626': '\u064A',  # ya with hamza -> ya
+    '\u0624': '\u0648',  # waw with hamza -> waw
+    '\u0629': '\u0647',  # ta marbuta -> ha
+})
+NON_WORD_RE = re.compile(r'[^\w\s]+', re.UNICODE)
+NON_DIGIT_RE = re.compile(r'\D+')
+
+SOUNDEX_CODES = str.maketrans(
+    'abcdefghijklmnopqrstuvwxyz',
+    '01230120022455012623010202',
+)
+
+# Number of trailing digits compared, so local and international
+# notations of the same number (0501234567, +966501234567) match
+PHONE_KEY_DIGITS = 9
+
+# Weights of the duplicate score, the total is 1.0
+PHONE_WEIGHT = 0.4
+BIRTH_DATE_WEIGHT = 0.2
+NAME_WEIGHT = 0.4
+
+
+def normalize_phone(phone):
+    """Return the last significant digits of a phone number, or False."""
+    if isinstance(phone, float) and phone.is_integer():
+        # Spreadsheet cells holding numbers are parsed as floats
+        phone = int(phone)
+    digits = NON_DIGIT_RE.sub('', str(phone or ''))
+    if len(digits) < 7:
+        return False
+    return digits[-PHONE_KEY_DIGITS:]
+
+
+def normalize_birth_date(value):
+    """Return a birth date given as a date or as an accepted intake string."""
+    if not value:
+        return False
+    if isinstance(value, datetime):
+        return value.date()
+    if isinstance(value, date):
+        return value
+    value = str(value).strip()
+    for fmt in DATE_FORMATS:
+        try:
+            return datetime.strptime(value, fmt).date()
+        except ValueError:
+            continue
+    return False
+
+
+def _tokens(name):
+    return NON_WORD_RE.sub(' ', str(name or '')).lower().split()
+
+
+def normalize_arabic_name(name):
+    """Return an Arabic name without diacritics and spelling variants."""
+    name = ARABIC_MARKS_RE.sub('', str(name or '')).translate(ARABIC_LETTER_MAP)
+    return ' '.join(_tokens(name))
+
+
+def arabic_name_key(name):
+    """Blocking key of an Arabic name, independent of the word order."""
+    tokens = normalize_arabic_name(name).split()
+    return ' '.join(sorted(tokens)) or False
+
+
+def soundex(word):
+    """American Soundex code of a latin word."""
+    word = ''.join(c for c in word.lower() if 'a' <= c <= 'z')
+    if not word:
+        return ''
+    codes = word.translate(SOUNDEX_CODES)
+    result = word[0].upper()
+    previous = codes[0]
+    for char, code in zip(word[1:], codes[1:]):
+        if code != '0' and code != previous:
+            result += code
+            if len(result) == 4:
+                break
+        # h and w do not separate letters with the same code
+        if char not in 'hw':
+            previous = code
+    return result.ljust(4, '0')
+
+
+def english_name_key(name):
+    """Phonetic blocking key of an English name, independent of the word order."""
+    codes = [soundex(token) for token in _tokens(name)]
+    return ' '.join(sorted(code for code in codes if code)) or False
+
+
+def name_ngrams(name, size=3):
+    """Character n-grams of a normalized name, used for similarity scoring."""
+    text = ' %s ' % normalize_arabic_name(name)
+    return {text[i:i + size] for i in range(len(text) - size + 1)}
+
+
+def ngram_similarity(first, second):
+    """Jaccard similarity of two n-gram sets."""
+    if not first or not second:
+        return 0.0
+    return len(first & second) / len(first | second)
+
+
+def duplicate_score(candidate, student):
+    """Score in [0, 1] of ``candidate`` being the same person as ``student``.
+
+    Both arguments are dictionaries with the keys ``email``, ``phone_key``,
+    ``birth_date``, ``name_arabic`` and ``name_english``.
+    """
+    if candidate.get('email') and student.get('email') \
+            and candidate['email'].strip().lower() == student['email'].strip().lower():
+        return 1.0
+    score = 0.0
+    if candidate.get('phone_key') and candidate['phone_key'] == student.get('phone_key'):
+        score += PHONE_WEIGHT
+    if candidate.get('birth_date') and candidate['birth_date'] == student.get('birth_date'):
+        score += BIRTH_DATE_WEIGHT
+    name_similarity = max(
+        ngram_similarity(name_ngrams(candidate.get('name_arabic')), name_ngrams(student.get('name_arabic'))),
+        ngram_similarity(name_ngrams(candidate.get('name_english')), name_ngrams(student.get('name_english'))),
+    )
+    score += NAME_WEIGHT * name_similarity
+    return round(score, 4)
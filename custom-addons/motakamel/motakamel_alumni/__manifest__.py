@@ -8,7 +8,7 @@
 
 {
     'name': 'Motakamel Alumni Management',
-    'version': '18.0.1.0',
+    'version': '18.0.1.1',
     'license': 'LGPL-3',
     'category': 'Education',
     'sequence': 15,
@@ -30,14 +30,17 @@
         # Data
         'data/alumni_sequence.xml',
         'data/alumni_data.xml',
+        'data/alumni_mailing_cron.xml',
+        'data/alumni_counter_data.xml',
         
         # Views
         'views/alumni_view.xml',
+        'views/alumni_mailing_view.xml',
         # 'views/alumni_group_view.xml',  # TODO: Create
         # 'views/alumni_event_view.xml',  # TODO: Create
         # 'views/alumni_job_view.xml',  # TODO: Create
         # 'views/alumni_portal_templates.xml',  # TODO: Create
-        # 'views/alumni_website_templates.xml',  # TODO: Create
+        'views/alumni_website_templates.xml',
         
         # Reports (TODO: Create these files)
         # 'report/alumni_report.xml',
@@ -45,7 +48,7 @@
         
         # Wizards (TODO: Create these files)
         # 'wizard/convert_to_alumni_wizard_view.xml',
-        # 'wizard/alumni_bulk_email_wizard_view.xml',
+        'wizard/alumni_bulk_email_wizard_view.xml',
         
         # Menus
         'menus/alumni_menu.xml',
@@ -12,17 +12,27 @@ from odoo.http import request
 
 class AlumniWebsite(http.Controller):
 
+    def _prepare_listing_values(self, model_name, search='', after=None):
+        """Values of a searchable listing page, read with keyset pagination.
+
+        Only the ids and write dates of the page are read by the search: when
+        its rendered fragment is cached under ``cache_key``, the records are
+        not read at all.
+        """
+        Model = request.env[model_name].sudo()
+        search = (search or '').strip()
+        after = int(after) if str(after or '').isdigit() else None
+        page = Model._get_directory_page(search=search, after=after)
+        return {
+            'search': search,
+            'page': page,
+            'cache_key': (page['cache_key'], search, after),
+        }
+
     @http.route(['/alumni'], type='http', auth='public', website=True)
-    def alumni_directory(self, **kw):
+    def alumni_directory(self, search='', after=None, **kw):
         """Alumni directory page"""
-        alumni_records = request.env['op.alumni'].sudo().search([
-            ('state', '=', 'active'),
-            ('is_published', '=', True)
-        ])
-        
-        values = {
-            'alumni_records': alumni_records,
-        }
+        values = self._prepare_listing_values('op.alumni', search, after)
         return request.render('motakamel_alumni.alumni_directory', values)
 
     @http.route(['/alumni/<int:alumni_id>'], type='http', auth='public', website=True)
@@ -39,16 +49,9 @@ class AlumniWebsite(http.Controller):
         return request.render('motakamel_alumni.alumni_detail', values)
 
     @http.route(['/alumni/events'], type='http', auth='public', website=True)
-    def alumni_events(self, **kw):
+    def alumni_events(self, search='', after=None, **kw):
         """Alumni events listing"""
-        events = request.env['op.alumni.event'].sudo().search([
-            ('state', 'in', ['published', 'registration_open']),
-            ('is_published', '=', True)
-        ], order='event_date desc')
-        
-        values = {
-            'events': events,
-        }
+        values = self._prepare_listing_values('op.alumni.event', search, after)
         return request.render('motakamel_alumni.alumni_events_list', values)
 
     @http.route(['/alumni/events/<int:event_id>'], type='http', auth='public', website=True)
@@ -65,16 +68,9 @@ class AlumniWebsite(http.Controller):
         return request.render('motakamel_alumni.alumni_event_detail', values)
 
     @http.route(['/alumni/jobs'], type='http', auth='public', website=True)
-    def alumni_jobs(self, **kw):
+    def alumni_jobs(self, search='', after=None, **kw):
         """Alumni jobs listing"""
-        jobs = request.env['op.alumni.job'].sudo().search([
-            ('state', '=', 'published'),
-            ('is_published', '=', True)
-        ], order='create_date desc')
-        
-        values = {
-            'jobs': jobs,
-        }
+        values = self._prepare_listing_values('op.alumni.job', search, after)
         return request.render('motakamel_alumni.alumni_jobs_list', values)
 
     @http.route(['/alumni/jobs/<int:job_id>'], type='http', auth='public', website=True)
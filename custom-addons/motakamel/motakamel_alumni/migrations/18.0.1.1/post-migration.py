@@ -0,0 +1,13 @@
+# -*- coding: utf-8 -*-
+
+import logging
+from odoo import api, SUPERUSER_ID
+
+_logger = logging.getLogger(__name__)
+
+
+def migrate(cr, version):
+    """Counters are now stored and maintained incrementally, fill them in once."""
+    env = api.Environment(cr, SUPERUSER_ID, {})
+    env['op.alumni'].action_rebuild_counters()
+    _logger.info('Rebuilt the stored alumni, event and job counters')
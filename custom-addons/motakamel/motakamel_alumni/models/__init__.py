@@ -6,10 +6,13 @@
 #
 ##############################################################################
 
+from . import alumni_counter
+from . import alumni_directory
 from . import alumni
 from . import alumni_group
 from . import alumni_event
 from . import alumni_job
 from . import student
 from . import res_config_settings
-
+from . import alumni_mailing
+from . import mail_mail
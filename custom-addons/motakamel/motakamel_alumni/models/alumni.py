@@ -14,9 +14,13 @@ from datetime import datetime
 class OpAlumni(models.Model):
     _name = 'op.alumni'
     _description = 'Alumni'
-    _inherit = ['mail.thread', 'mail.activity.mixin', 'website.published.mixin']
+    _inherit = ['mail.thread', 'mail.activity.mixin', 'website.published.mixin',
+                'op.alumni.directory.mixin', 'op.alumni.counter.mixin']
     _rec_name = 'name'
     _order = 'graduation_date desc, id desc'
+    _directory_search_fields = ('name', 'graduation_year', 'current_company',
+                                'current_designation', 'industry', 'skills')
+    _directory_sort_field = 'graduation_date'
 
     # Basic Information
     name = fields.Char('Name', required=True, tracking=True, compute='_compute_name', store=True)
@@ -87,6 +91,7 @@ class OpAlumni(models.Model):
     current_designation = fields.Char('Current Designation', tracking=True)
     industry = fields.Char('Industry')
     work_experience_years = fields.Integer('Years of Experience')
+    skills = fields.Text('Skills')
     
     linkedin_url = fields.Char('LinkedIn Profile')
     website = fields.Char('Personal Website')
@@ -106,11 +111,11 @@ class OpAlumni(models.Model):
         'alumni_id', 
         'Event Registrations'
     )
-    event_count = fields.Integer('Events Attended', compute='_compute_event_count')
+    event_count = fields.Integer('Events Attended', readonly=True, copy=False)
     
     # Jobs Posted
     job_ids = fields.One2many('op.alumni.job', 'posted_by', 'Jobs Posted')
-    job_count = fields.Integer('Jobs Posted', compute='_compute_job_count')
+    job_count = fields.Integer('Jobs Posted', readonly=True, copy=False)
     
     # Engagement
     last_contact_date = fields.Date('Last Contact Date')
@@ -162,17 +167,33 @@ class OpAlumni(models.Model):
             else:
                 alumni.graduation_year = ''
     
-    @api.depends('event_registration_ids')
-    def _compute_event_count(self):
-        for alumni in self:
-            alumni.event_count = len(alumni.event_registration_ids.filtered(
-                lambda r: r.state == 'attended'
-            ))
+    def _get_counter_values(self):
+        attended = self.env['op.alumni.event.registration']._read_group(
+            [('state', '=', 'attended')], ['alumni_id'], ['__count'])
+        jobs = self.env['op.alumni.job']._read_group([], ['posted_by'], ['__count'])
+        return {
+            'event_count': {alumni.id: count for alumni, count in attended},
+            'job_count': {alumni.id: count for alumni, count in jobs},
+        }
     
-    @api.depends('job_ids')
-    def _compute_job_count(self):
-        for alumni in self:
-            alumni.job_count = len(alumni.job_ids)
+    @api.model
+    def action_rebuild_counters(self):
+        """Rebuild the stored counters of alumni, events and jobs in bulk"""
+        for model_name in ('op.alumni', 'op.alumni.event', 'op.alumni.job'):
+            self.env[model_name].sudo()._rebuild_counters()
+        return {
+            'type': 'ir.actions.client',
+            'tag': 'display_notification',
+            'params': {
+                'title': _('Success'),
+                'message': _('Alumni, event and job counters rebuilt.'),
+                'type': 'success',
+                'sticky': False,
+            }
+        }
+    
+    def _get_directory_domain(self):
+        return super()._get_directory_domain() + [('state', '=', 'active')]
     
     def action_activate(self):
         """Activate alumni record"""
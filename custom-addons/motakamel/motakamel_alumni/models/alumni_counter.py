@@ -0,0 +1,118 @@
+# -*- coding: utf-8 -*-
+##############################################################################
+#
+#    OpenEduCat Inc
+#    Copyright (C) 2009-TODAY OpenEduCat Inc(<https://www.openeducat.org>).
+#
+##############################################################################
+
+from collections import Counter, defaultdict
+
+from odoo import models, api
+from odoo.tools import SQL
+
+
+class OpAlumniCounterMixin(models.AbstractModel):
+    """Stored counters maintained incrementally by the counted records."""
+    _name = 'op.alumni.counter.mixin'
+    _description = 'Alumni Stored Counters'
+
+    def _increment_counter(self, fname, deltas):
+        """Add ``deltas`` ({record id: delta}) to the counter ``fname``.
+
+        The counters are incremented in the database with one UPDATE, so
+        concurrent changes of the same counter do not overwrite each other.
+        """
+        deltas = {record_id: delta for record_id, delta in deltas.items() if record_id and delta}
+        if not deltas:
+            return
+        self.flush_model([fname])
+        self.env.cr.execute(SQL(
+            """UPDATE %(table)s
+                  SET %(column)s = COALESCE(%(column)s, 0) + v.delta
+                 FROM unnest(%(ids)s::int[], %(deltas)s::int[]) AS v(id, delta)
+                WHERE %(table)s.id = v.id""",
+            table=SQL.identifier(self._table),
+            column=SQL.identifier(fname),
+            ids=list(deltas),
+            deltas=list(deltas.values()),
+        ))
+        self.invalidate_model([fname])
+
+    def _set_counter(self, fname, values):
+        """Set the counter ``fname`` of all records from ``values`` ({record id: value}),
+        the records missing from ``values`` are reset to zero."""
+        self.flush_model([fname])
+        self.env.cr.execute(SQL(
+            """UPDATE %(table)s t
+                  SET %(column)s = COALESCE(v.value, 0)
+                 FROM %(table)s t2
+            LEFT JOIN unnest(%(ids)s::int[], %(values)s::int[]) AS v(id, value) ON v.id = t2.id
+                WHERE t.id = t2.id
+                  AND t.%(column)s IS DISTINCT FROM COALESCE(v.value, 0)""",
+            table=SQL.identifier(self._table),
+            column=SQL.identifier(fname),
+            ids=list(values),
+            values=list(values.values()),
+        ))
+        self.invalidate_model([fname])
+
+    def _get_counter_values(self):
+        """Return the exact values of the counters, {field name: {record id: value}}.
+
+        Models inheriting this mixin read them with grouped queries.
+        """
+        return {}
+
+    @api.model
+    def _rebuild_counters(self):
+        """Recompute all the counters of the model in bulk."""
+        for fname, values in self._get_counter_values().items():
+            self._set_counter(fname, values)
+
+
+class OpAlumniCountedMixin(models.AbstractModel):
+    """Records counted in the stored counters of other records.
+
+    The counters are incremented on creation, decremented on deletion and
+    moved when a field changing what a record counts in is written.
+    """
+    _name = 'op.alumni.counted.mixin'
+    _description = 'Alumni Counted Record'
+
+    # Fields changing the counters a record counts in
+    _counter_trigger_fields = ()
+
+    def _get_counter_contributions(self):
+        """Return a Counter of the counters the records count in, keyed by
+        (model name, counter field, record id)."""
+        return Counter()
+
+    def _update_counters(self, before, after):
+        deltas = defaultdict(dict)
+        for (model_name, fname, record_id), delta in (Counter(after) - before).items():
+            deltas[model_name, fname][record_id] = delta
+        for (model_name, fname, record_id), delta in (Counter(before) - after).items():
+            deltas[model_name, fname][record_id] = -delta
+        for (model_name, fname), record_deltas in deltas.items():
+            self.env[model_name].sudo()._increment_counter(fname, record_deltas)
+
+    @api.model_create_multi
+    def create(self, vals_list):
+        records = super().create(vals_list)
+        records._update_counters(Counter(), records._get_counter_contributions())
+        return records
+
+    def write(self, vals):
+        if not self._counter_trigger_fields or not set(self._counter_trigger_fields) & set(vals):
+            return super().write(vals)
+        before = self._get_counter_contributions()
+        res = super().write(vals)
+        self._update_counters(before, self._get_counter_contributions())
+        return res
+
+    def unlink(self):
+        before = self._get_counter_contributions()
+        res = super().unlink()
+        self._update_counters(before, Counter())
+        return res
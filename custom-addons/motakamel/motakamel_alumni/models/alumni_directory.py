@@ -0,0 +1,115 @@
+# -*- coding: utf-8 -*-
+##############################################################################
+#
+#    OpenEduCat Inc
+#    Copyright (C) 2009-TODAY OpenEduCat Inc(<https://www.openeducat.org>).
+#
+##############################################################################
+
+import re
+
+from odoo import models, tools
+from odoo.osv import expression
+from odoo.tools import SQL
+
+# Records shown per page of the public listings
+DIRECTORY_PAGE_SIZE = 24
+
+WORD_RE = re.compile(r'\w+', re.UNICODE)
+
+
+class OpAlumniDirectoryMixin(models.AbstractModel):
+    """Full-text search and keyset pagination of the public alumni listings.
+
+    Models inheriting this mixin set the columns indexed for search and the
+    column the listing is sorted on, newest first. Pages are read with the
+    last record of the previous page as cursor instead of an offset, so
+    every page costs the same whatever its position in the listing.
+    """
+    _name = 'op.alumni.directory.mixin'
+    _description = 'Alumni Directory Listing'
+
+    # Stored columns of the full-text search document
+    _directory_search_fields = ()
+    # Stored column the listing is sorted on, descending, then by id
+    _directory_sort_field = None
+
+    def init(self):
+        super().init()
+        if not self._directory_search_fields:
+            return
+        tools.create_index(
+            self._cr, f'{self._table}_directory_search_idx', self._table,
+            [self._get_directory_document()], method='gin')
+        tools.create_index(
+            self._cr, f'{self._table}_directory_order_idx', self._table,
+            [f'"{self._directory_sort_field}" DESC', 'id DESC'],
+            where='is_published')
+
+    def _get_directory_document(self, table=None):
+        """Return the SQL expression of the full-text search document.
+
+        The same expression is used by the GIN index and by the search, so
+        PostgreSQL can answer the search from the index. The ``simple``
+        configuration lowercases words without stemming, which suits names
+        written in any language.
+        """
+        prefix = f'"{table}".' if table else ''
+        columns = " || ' ' || ".join(
+            f"coalesce({prefix}\"{fname}\", '')" for fname in self._directory_search_fields)
+        return f"to_tsvector('simple', {columns})"
+
+    def _get_directory_domain(self):
+        """Domain of the records listed on the website."""
+        return [('is_published', '=', True)]
+
+    def _get_directory_order(self):
+        return f'{self._directory_sort_field} desc, id desc'
+
+    def _get_directory_page(self, search=None, after=None, limit=DIRECTORY_PAGE_SIZE):
+        """Return one page of the listing and the cursor of the next page.
+
+        :param search: words the records must contain, the last one may be
+            the beginning of a word
+        :param after: id of the last record of the previous page
+        :return: dictionary with the ``records`` of the page, the
+            ``next_cursor``, False on the last page, and the ``cache_key``
+            of the rendered page
+        """
+        domain = self._get_directory_domain()
+        last = self.browse(after).exists() if after else self.browse()
+        if last:
+            fname = self._directory_sort_field
+            value = last[fname]
+            domain = expression.AND([domain, [
+                '|', (fname, '<', value),
+                '&', (fname, '=', value), ('id', '<', last.id),
+            ]])
+        query = self._search(domain, limit=limit + 1, order=self._get_directory_order())
+        words = WORD_RE.findall(search or '')
+        if words:
+            query.add_where(SQL(
+                f"{self._get_directory_document(self._table)} @@ to_tsquery('simple', %s)",
+                ' & '.join(f'{word}:*' for word in words),
+            ))
+        rows = self.env.execute_query(query.select(
+            self._field_to_sql(self._table, 'id', query),
+            self._field_to_sql(self._table, 'write_date', query),
+        ))
+        records = self.browse([row[0] for row in rows[:limit]])
+        next_cursor = len(rows) > limit and records[-1].id
+        return {
+            'records': records,
+            'next_cursor': next_cursor,
+            'cache_key': self._get_directory_cache_key(rows[:limit], next_cursor),
+        }
+
+    def _get_directory_cache_key(self, rows, next_cursor):
+        """Return the key of a rendered page from its ``(id, write_date)`` rows.
+
+        Rendered listing fragments are cached under this key. It changes
+        whenever a record of the page is created, modified, deleted or moved
+        out of the page, even by a transaction which started before the page
+        was rendered and so wrote an older write_date.
+        """
+        return (self._name, tuple(rows), next_cursor)
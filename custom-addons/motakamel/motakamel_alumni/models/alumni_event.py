@@ -6,6 +6,8 @@
 #
 ##############################################################################
 
+from collections import Counter
+
 from odoo import models, fields, api, _
 from odoo.exceptions import ValidationError
 from datetime import datetime
@@ -14,8 +16,11 @@ from datetime import datetime
 class OpAlumniEvent(models.Model):
     _name = 'op.alumni.event'
     _description = 'Alumni Event'
-    _inherit = ['mail.thread', 'mail.activity.mixin', 'website.published.mixin']
+    _inherit = ['mail.thread', 'mail.activity.mixin', 'website.published.mixin',
+                'op.alumni.directory.mixin', 'op.alumni.counter.mixin']
     _order = 'event_date desc'
+    _directory_search_fields = ('name', 'description', 'venue')
+    _directory_sort_field = 'event_date'
 
     name = fields.Char('Event Name', required=True, tracking=True)
     event_number = fields.Char(
@@ -70,8 +75,8 @@ class OpAlumniEvent(models.Model):
     
     # Registrations
     registration_ids = fields.One2many('op.alumni.event.registration', 'event_id', 'Registrations')
-    registered_count = fields.Integer('Registered', compute='_compute_registration_stats', store=True)
-    attended_count = fields.Integer('Attended', compute='_compute_registration_stats', store=True)
+    registered_count = fields.Integer('Registered', readonly=True, copy=False)
+    attended_count = fields.Integer('Attended', readonly=True, copy=False)
     
     # Organizer
     organizer_id = fields.Many2one('res.users', 'Organizer', default=lambda self: self.env.user)
@@ -104,15 +109,27 @@ class OpAlumniEvent(models.Model):
             else:
                 event.duration = 0.0
     
-    @api.depends('registration_ids', 'registration_ids.state')
-    def _compute_registration_stats(self):
-        for event in self:
-            event.registered_count = len(event.registration_ids.filtered(
-                lambda r: r.state in ['registered', 'attended']
-            ))
-            event.attended_count = len(event.registration_ids.filtered(
-                lambda r: r.state == 'attended'
-            ))
+    def unlink(self):
+        # Registrations are deleted through the ORM to update the alumni counters
+        self.registration_ids.unlink()
+        return super(OpAlumniEvent, self).unlink()
+    
+    def _get_counter_values(self):
+        registrations = self.env['op.alumni.event.registration']._read_group(
+            [('state', 'in', ['registered', 'attended'])], ['event_id', 'state'], ['__count'])
+        registered = Counter()
+        attended = {}
+        for event, state, count in registrations:
+            registered[event.id] += count
+            if state == 'attended':
+                attended[event.id] = count
+        return {
+            'registered_count': dict(registered),
+            'attended_count': attended,
+        }
+    
+    def _get_directory_domain(self):
+        return super()._get_directory_domain() + [('state', 'in', ['published', 'registration_open'])]
     
     def action_publish(self):
         """Publish event"""
@@ -161,8 +178,9 @@ class OpAlumniEvent(models.Model):
 class OpAlumniEventRegistration(models.Model):
     _name = 'op.alumni.event.registration'
     _description = 'Alumni Event Registration'
-    _inherit = ['mail.thread']
+    _inherit = ['mail.thread', 'op.alumni.counted.mixin']
     _order = 'registration_date desc'
+    _counter_trigger_fields = ('event_id', 'alumni_id', 'state')
 
     event_id = fields.Many2one('op.alumni.event', 'Event', required=True, ondelete='cascade')
     alumni_id = fields.Many2one('op.alumni', 'Alumni', required=True, tracking=True)
@@ -204,6 +222,16 @@ class OpAlumniEventRegistration(models.Model):
          'Alumni already registered for this event!'),
     ]
     
+    def _get_counter_contributions(self):
+        contributions = Counter()
+        for registration in self:
+            if registration.state in ('registered', 'attended'):
+                contributions['op.alumni.event', 'registered_count', registration.event_id.id] += 1
+            if registration.state == 'attended':
+                contributions['op.alumni.event', 'attended_count', registration.event_id.id] += 1
+                contributions['op.alumni', 'event_count', registration.alumni_id.id] += 1
+        return contributions
+    
     def action_confirm(self):
         """Confirm registration"""
         self.state = 'confirmed'
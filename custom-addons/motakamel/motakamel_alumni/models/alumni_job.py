@@ -6,6 +6,8 @@
 #
 ##############################################################################
 
+from collections import Counter
+
 from odoo import models, fields, api, _
 from datetime import datetime, timedelta
 
@@ -13,8 +15,13 @@ from datetime import datetime, timedelta
 class OpAlumniJob(models.Model):
     _name = 'op.alumni.job'
     _description = 'Alumni Job Posting'
-    _inherit = ['mail.thread', 'mail.activity.mixin', 'website.published.mixin']
+    _inherit = ['mail.thread', 'mail.activity.mixin', 'website.published.mixin',
+                'op.alumni.directory.mixin', 'op.alumni.counter.mixin', 'op.alumni.counted.mixin']
     _order = 'create_date desc'
+    _directory_search_fields = ('name', 'company_name', 'location', 'description',
+                                'skills_required')
+    _directory_sort_field = 'create_date'
+    _counter_trigger_fields = ('posted_by', 'active')
 
     name = fields.Char('Job Title', required=True, tracking=True)
     job_number = fields.Char(
@@ -78,7 +85,7 @@ class OpAlumniJob(models.Model):
     
     # Applications
     application_ids = fields.One2many('op.alumni.job.application', 'job_id', 'Applications')
-    application_count = fields.Integer('Applications', compute='_compute_application_count')
+    application_count = fields.Integer('Applications', readonly=True, copy=False)
     
     # Status
     state = fields.Selection([
@@ -103,10 +110,19 @@ class OpAlumniJob(models.Model):
             return alumni.id if alumni else False
         return False
     
-    @api.depends('application_ids')
-    def _compute_application_count(self):
-        for job in self:
-            job.application_count = len(job.application_ids)
+    def _get_counter_contributions(self):
+        return Counter(
+            ('op.alumni', 'job_count', job.posted_by.id)
+            for job in self if job.active
+        )
+    
+    def _get_counter_values(self):
+        applications = self.env['op.alumni.job.application']._read_group(
+            [], ['job_id'], ['__count'])
+        return {'application_count': {job.id: count for job, count in applications}}
+    
+    def _get_directory_domain(self):
+        return super()._get_directory_domain() + [('state', '=', 'published')]
     
     def action_publish(self):
         """Publish job"""
@@ -139,8 +155,9 @@ class OpAlumniJob(models.Model):
 class OpAlumniJobApplication(models.Model):
     _name = 'op.alumni.job.application'
     _description = 'Alumni Job Application'
-    _inherit = ['mail.thread']
+    _inherit = ['mail.thread', 'op.alumni.counted.mixin']
     _order = 'application_date desc'
+    _counter_trigger_fields = ('job_id',)
 
     job_id = fields.Many2one('op.alumni.job', 'Job', required=True, ondelete='cascade')
     applicant_id = fields.Many2one('op.alumni', 'Applicant')
@@ -174,3 +191,9 @@ class OpAlumniJobApplication(models.Model):
          'You have already applied for this job!'),
     ]
 
+    
+    def _get_counter_contributions(self):
+        return Counter(
+            ('op.alumni.job', 'application_count', application.job_id.id)
+            for application in self
+        )
@@ -0,0 +1,258 @@
+# -*- coding: utf-8 -*-
+##############################################################################
+#
+#    OpenEduCat Inc
+#    Copyright (C) 2009-TODAY OpenEduCat Inc(<https://www.openeducat.org>).
+#
+##############################################################################
+
+import logging
+from datetime import timedelta
+
+from odoo import models, fields, api, tools, _
+from odoo.exceptions import UserError
+
+_logger = logging.getLogger(__name__)
+
+# Default number of emails sent per minute
+DEFAULT_RATE_LIMIT = 100
+# Default number of retries of a failed email
+DEFAULT_MAX_RETRIES = 3
+# Delay before a failed email is retried, multiplied by the retry number
+RETRY_DELAY_MINUTES = 5
+
+
+class OpAlumniMailing(models.Model):
+    _name = 'op.alumni.mailing'
+    _description = 'Alumni Mailing'
+    _inherit = ['mail.render.mixin', 'op.background.job.mixin']
+    _order = 'create_date desc, id desc'
+    _job_cron = 'motakamel_alumni.ir_cron_process_alumni_mailings'
+
+    # Emails are always rendered and queued in the background
+    BACKGROUND_THRESHOLD = 0
+    # Recipients rendered and queued per batch
+    CHUNK_SIZE = 500
+
+    subject = fields.Char('Subject', required=True, render_engine='inline_template')
+    body_html = fields.Html(
+        'Message',
+        required=True,
+        render_engine='qweb',
+        render_options={'post_process': True},
+        sanitize='email_outgoing',
+    )
+    email_from = fields.Char(
+        'From',
+        default=lambda self: self.env.user.email_formatted or self.env.company.email_formatted,
+    )
+    alumni_ids = fields.Many2many(
+        'op.alumni',
+        'op_alumni_mailing_rel',
+        'mailing_id',
+        'alumni_id',
+        'Recipients',
+    )
+    mail_ids = fields.One2many('mail.mail', 'alumni_mailing_id', 'Queued Emails')
+
+    state = fields.Selection([
+        ('draft', 'Draft'),
+        ('queued', 'Queued'),
+        ('running', 'Queuing'),
+        ('sending', 'Sending'),
+        ('done', 'Done'),
+        ('cancel', 'Cancelled'),
+    ], 'Status', default='draft', required=True, readonly=True)
+    rate_limit = fields.Integer(
+        'Emails per Minute',
+        default=lambda self: self._default_rate_limit(),
+        help="Maximum number of emails sent per minute (0 for no limit)"
+    )
+    max_retries = fields.Integer(
+        'Max Retries',
+        default=lambda self: self._default_max_retries(),
+        help="Number of times a failed email is sent again"
+    )
+    send_start_date = fields.Datetime('Sending Started', readonly=True)
+
+    # Delivery progress
+    total_count = fields.Integer('Recipients', readonly=True)
+    processed_count = fields.Integer('Queued', readonly=True)
+    sent_count = fields.Integer('Sent', readonly=True)
+    failed_count = fields.Integer('Failed', readonly=True)
+    queue_failed_count = fields.Integer('Not Queued', readonly=True)
+
+    def _default_rate_limit(self):
+        return int(self.env['ir.config_parameter'].sudo().get_param(
+            'motakamel_alumni.mailing_rate_limit', DEFAULT_RATE_LIMIT))
+
+    def _default_max_retries(self):
+        return int(self.env['ir.config_parameter'].sudo().get_param(
+            'motakamel_alumni.mailing_max_retries', DEFAULT_MAX_RETRIES))
+
+    def _compute_render_model(self):
+        for mailing in self:
+            mailing.render_model = 'op.alumni'
+
+    @api.depends('total_count', 'sent_count', 'failed_count')
+    def _compute_progress_percentage(self):
+        for mailing in self:
+            if mailing.total_count:
+                mailing.progress_percentage = (mailing.sent_count + mailing.failed_count) * 100.0 / mailing.total_count
+            else:
+                mailing.progress_percentage = 0.0
+
+    def action_queue(self):
+        """Queue the mailing; rendering and sending run in the background."""
+        for mailing in self:
+            if mailing.state != 'draft':
+                raise UserError(_('Only draft mailings can be sent.'))
+            recipients = mailing.alumni_ids.filtered('email')
+            if not recipients:
+                raise UserError(_('None of the selected alumni has an email address.'))
+            mailing.alumni_ids = [(6, 0, recipients.ids)]
+            mailing.action_start()
+        return True
+
+    def _prepare_start_vals(self):
+        vals = super()._prepare_start_vals()
+        vals.update({
+            'send_start_date': fields.Datetime.now(),
+            'sent_count': 0,
+            'failed_count': 0,
+            'queue_failed_count': 0,
+        })
+        return vals
+
+    def action_cancel(self):
+        """Stop the mailing and drop the emails that are not sent yet."""
+        self.env['mail.mail'].sudo().search([
+            ('alumni_mailing_id', 'in', self.ids),
+            ('state', 'in', ['outgoing', 'exception']),
+        ]).write({'state': 'cancel'})
+        self.write({'state': 'cancel'})
+        self._update_delivery_counters()
+        return True
+
+    @api.model
+    def _cron_process_mailings(self):
+        """Queue the emails of new mailings, then send and retry the due ones."""
+        self._cron_process_jobs()
+        mailings = self.search([('state', '=', 'sending')], order='id')
+        for mailing in mailings:
+            mailing._send_due_mails()
+            mailing._retry_failed_mails()
+            mailing._update_delivery_counters()
+            self.env.cr.commit()
+        # Emails scheduled later are sent by the next runs
+        if self.search_count([('state', 'in', ['queued', 'running', 'sending'])], limit=1):
+            self.env.ref(self._job_cron).sudo()._trigger(
+                fields.Datetime.now() + timedelta(minutes=1))
+        return len(mailings)
+
+    def _get_items(self):
+        return self.alumni_ids.sorted('id')
+
+    def _process_chunk(self, batch):
+        """Render a batch of recipients and create their emails in bulk.
+
+        Subjects and bodies of the whole batch are rendered with one call per
+        field. Each email gets a scheduled date honouring the rate limit, so
+        neither this job nor the standard mail queue sends faster than allowed.
+        """
+        subjects = self._render_field('subject', batch.ids)
+        bodies = self._render_field('body_html', batch.ids)
+        mail_values = []
+        for index, alumni in enumerate(batch, start=self.processed_count):
+            mail_values.append({
+                'subject': subjects[alumni.id],
+                'body_html': bodies[alumni.id],
+                'email_from': self.email_from,
+                'email_to': tools.formataddr((alumni.name or '', alumni.email)),
+                'model': 'op.alumni',
+                'res_id': alumni.id,
+                'alumni_mailing_id': self.id,
+                'scheduled_date': self._get_scheduled_date(index),
+                'auto_delete': True,
+            })
+        self.env['mail.mail'].sudo().create(mail_values)
+        _logger.info('Alumni mailing %s: queued %d of %d emails',
+                     self.id, self.processed_count + len(batch), self.total_count)
+        return {}
+
+    def _get_chunk_failure_vals(self, batch):
+        return {
+            'queue_failed_count': self.queue_failed_count + len(batch),
+            'failed_count': self.failed_count + len(batch),
+        }
+
+    def _finalize(self):
+        # All the emails are queued, the cron now sends them
+        self.state = 'sending'
+
+    def _get_scheduled_date(self, index):
+        """Return the send date of the ``index``-th email under the rate limit."""
+        if not self.rate_limit:
+            return False
+        start = self.send_start_date or fields.Datetime.now()
+        return start + timedelta(minutes=index // self.rate_limit)
+
+    def _send_due_mails(self):
+        """Send the emails that are due, at most one minute of the rate limit."""
+        self.ensure_one()
+        now = fields.Datetime.now()
+        due_mails = self.env['mail.mail'].sudo().search([
+            ('alumni_mailing_id', '=', self.id),
+            ('state', '=', 'outgoing'),
+            '|', ('scheduled_date', '=', False), ('scheduled_date', '<=', now),
+        ], limit=self.rate_limit or None, order='scheduled_date, id')
+        if due_mails:
+            # Emails are sent over one SMTP connection per mail server
+            due_mails.send(auto_commit=True, raise_exception=False)
+            _logger.info('Alumni mailing %s: sent %d emails', self.id, len(due_mails))
+
+    def _retry_failed_mails(self):
+        """Put failed emails back in the queue until their retries are exhausted."""
+        self.ensure_one()
+        failed_mails = self.env['mail.mail'].sudo().search([
+            ('alumni_mailing_id', '=', self.id),
+            ('state', '=', 'exception'),
+            ('alumni_mailing_retry_count', '<', self.max_retries),
+        ])
+        now = fields.Datetime.now()
+        for retry_count, mails in failed_mails.grouped('alumni_mailing_retry_count').items():
+            mails.write({
+                'state': 'outgoing',
+                'failure_type': False,
+                'failure_reason': False,
+                'alumni_mailing_retry_count': retry_count + 1,
+                'scheduled_date': now + timedelta(minutes=RETRY_DELAY_MINUTES * (retry_count + 1)),
+            })
+        if failed_mails:
+            _logger.info('Alumni mailing %s: %d failed emails queued again', self.id, len(failed_mails))
+
+    def _update_delivery_counters(self):
+        """Refresh sent and failed counters with one grouped query.
+
+        Sent emails are deleted by the mail queue, so the emails left are the
+        pending ones and the failed ones.
+        """
+        remaining = self.env['mail.mail'].sudo()._read_group(
+            [('alumni_mailing_id', 'in', self.ids)],
+            groupby=['alumni_mailing_id', 'state'],
+            aggregates=['__count'],
+        )
+        counts = {}
+        for mailing, state, count in remaining:
+            counts.setdefault(mailing.id, {})[state] = count
+        for mailing in self:
+            mailing_counts = counts.get(mailing.id, {})
+            pending = mailing_counts.get('outgoing', 0)
+            failed = mailing_counts.get('exception', 0) + mailing_counts.get('cancel', 0)
+            vals = {
+                'sent_count': max(mailing.processed_count - mailing.queue_failed_count - pending - failed, 0),
+                'failed_count': failed + mailing.queue_failed_count,
+            }
+            if mailing.state == 'sending' and not pending:
+                vals['state'] = 'done'
+            mailing.write(vals)
@@ -0,0 +1,21 @@
+# -*- coding: utf-8 -*-
+##############################################################################
+#
+#    OpenEduCat Inc
+#    Copyright (C) 2009-TODAY OpenEduCat Inc(<https://www.openeducat.org>).
+#
+##############################################################################
+
+from odoo import models, fields
+
+
+class MailMail(models.Model):
+    _inherit = 'mail.mail'
+
+    alumni_mailing_id = fields.Many2one(
+        'op.alumni.mailing',
+        'Alumni Mailing',
+        index='btree_not_null',
+        ondelete='set null',
+    )
+    alumni_mailing_retry_count = fields.Integer('Alumni Mailing Retries', default=0)
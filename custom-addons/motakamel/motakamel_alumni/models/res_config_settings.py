@@ -24,4 +24,17 @@ class ResConfigSettings(models.TransientModel):
         default=365,
         help="Number of days alumni can access portal (0 for unlimited)"
     )
-
+    
+    alumni_mailing_rate_limit = fields.Integer(
+        'Alumni Emails per Minute',
+        config_parameter='motakamel_alumni.mailing_rate_limit',
+        default=100,
+        help="Maximum number of alumni mailing emails sent per minute (0 for no limit)"
+    )
+    
+    alumni_mailing_max_retries = fields.Integer(
+        'Alumni Email Retries',
+        config_parameter='motakamel_alumni.mailing_max_retries',
+        default=3,
+        help="Number of times a failed alumni mailing email is sent again"
+    )
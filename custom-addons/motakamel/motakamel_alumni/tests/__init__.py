@@ -0,0 +1,11 @@
+# -*- coding: utf-8 -*-
+##############################################################################
+#
+#    OpenEduCat Inc
+#    Copyright (C) 2009-TODAY OpenEduCat Inc(<https://www.openeducat.org>).
+#
+##############################################################################
+
+from . import test_alumni_mailing
+from . import test_alumni_directory
+from . import test_alumni_counter
@@ -0,0 +1,29 @@
+# -*- coding: utf-8 -*-
+##############################################################################
+#
+#    OpenEduCat Inc
+#    Copyright (C) 2009-TODAY OpenEduCat Inc(<https://www.openeducat.org>).
+#
+##############################################################################
+
+from odoo.tests import TransactionCase
+
+
+class TestAlumniCommon(TransactionCase):
+
+    def setUp(self):
+        super(TestAlumniCommon, self).setUp()
+        self.op_alumni = self.env['op.alumni']
+        self.course = self.env['op.course'].create({
+            'name': 'Alumni Course',
+            'code': 'ALUMNICRS',
+        })
+
+    def _create_alumni(self, first_name, **vals):
+        return self.op_alumni.create(dict({
+            'first_name': first_name,
+            'last_name': 'Alumnus',
+            'email': '%s.alumnus@example.com' % first_name.lower(),
+            'course_id': self.course.id,
+            'graduation_date': '2020-06-30',
+        }, **vals))
@@ -0,0 +1,169 @@
+# -*- coding: utf-8 -*-
+##############################################################################
+#
+#    OpenEduCat Inc
+#    Copyright (C) 2009-TODAY OpenEduCat Inc(<https://www.openeducat.org>).
+#
+##############################################################################
+
+from .test_alumni_common import TestAlumniCommon
+
+
+class TestAlumniCounter(TestAlumniCommon):
+
+    def setUp(self):
+        super(TestAlumniCounter, self).setUp()
+        self.amal = self._create_alumni('Amal')
+        self.badr = self._create_alumni('Badr')
+        self.reunion = self._create_event('Reunion')
+        self.seminar = self._create_event('Seminar')
+
+    def _create_event(self, name):
+        return self.env['op.alumni.event'].create({
+            'name': name,
+            'event_type': 'reunion',
+            'event_date': '2030-05-01 18:00:00',
+            'venue': 'Main Hall',
+        })
+
+    def _create_job(self, name, alumni):
+        return self.env['op.alumni.job'].create({
+            'name': name,
+            'company_name': 'Motakamel',
+            'description': '<p>Join us</p>',
+            'job_type': 'full_time',
+            'experience_required': '2-5',
+            'location': 'Riyadh',
+            'posted_by': alumni.id,
+        })
+
+    def _assert_event_counters(self, event, registered, attended):
+        self.assertEqual(
+            (event.registered_count, event.attended_count),
+            (registered, attended), event.name)
+
+    def test_case_1_event_registrations(self):
+        Registration = self.env['op.alumni.event.registration']
+        registration = Registration.create({
+            'event_id': self.reunion.id,
+            'alumni_id': self.amal.id,
+            'state': 'registered',
+        })
+        Registration.create({
+            'event_id': self.reunion.id,
+            'alumni_id': self.badr.id,
+        })
+        self._assert_event_counters(self.reunion, 1, 0)
+
+        registration.action_mark_attended()
+        self._assert_event_counters(self.reunion, 1, 1)
+        self.assertEqual(self.amal.event_count, 1)
+
+        registration.event_id = self.seminar
+        self._assert_event_counters(self.reunion, 0, 0)
+        self._assert_event_counters(self.seminar, 1, 1)
+
+        registration.alumni_id = self.badr
+        self.assertEqual(self.amal.event_count, 0)
+        self.assertEqual(self.badr.event_count, 1)
+
+        registration.action_cancel()
+        self._assert_event_counters(self.seminar, 0, 0)
+        self.assertEqual(self.badr.event_count, 0)
+
+        registration.action_mark_attended()
+        registration.unlink()
+        self._assert_event_counters(self.seminar, 0, 0)
+        self.assertEqual(self.badr.event_count, 0)
+
+    def test_case_2_event_unlink(self):
+        self.env['op.alumni.event.registration'].create({
+            'event_id': self.reunion.id,
+            'alumni_id': self.amal.id,
+            'state': 'attended',
+        })
+        self.assertEqual(self.amal.event_count, 1)
+        self.reunion.unlink()
+        self.assertEqual(self.amal.event_count, 0)
+
+    def test_case_3_jobs(self):
+        job = self._create_job('Developer', self.amal)
+        self._create_job('Analyst', self.amal)
+        self.assertEqual(self.amal.job_count, 2)
+
+        job.posted_by = self.badr
+        self.assertEqual((self.amal.job_count, self.badr.job_count), (1, 1))
+
+        job.active = False
+        self.assertEqual(self.badr.job_count, 0)
+        job.active = True
+        self.assertEqual(self.badr.job_count, 1)
+
+        job.unlink()
+        self.assertEqual(self.badr.job_count, 0)
+
+    def test_case_4_job_applications(self):
+        developer = self._create_job('Developer', self.amal)
+        analyst = self._create_job('Analyst', self.amal)
+        applications = self.env['op.alumni.job.application'].create([{
+            'job_id': developer.id,
+            'applicant_name': name,
+            'applicant_email': '%s@example.com' % name.lower(),
+        } for name in ('Dana', 'Fadi')])
+        self.assertEqual(developer.application_count, 2)
+
+        applications[0].job_id = analyst
+        self.assertEqual(
+            (developer.application_count, analyst.application_count), (1, 1))
+
+        applications.unlink()
+        self.assertEqual(
+            (developer.application_count, analyst.application_count), (0, 0))
+
+    def test_case_5_rebuild_counters(self):
+        Registration = self.env['op.alumni.event.registration']
+        Registration.create([{
+            'event_id': event.id,
+            'alumni_id': alumni.id,
+            'state': state,
+        } for event, alumni, state in [
+            (self.reunion, self.amal, 'attended'),
+            (self.reunion, self.badr, 'registered'),
+            (self.seminar, self.amal, 'attended'),
+            (self.seminar, self.badr, 'cancelled'),
+        ]])
+        job = self._create_job('Developer', self.badr)
+        self.env['op.alumni.job.application'].create({
+            'job_id': job.id,
+            'applicant_name': 'Dana',
+            'applicant_email': 'dana@example.com',
+        })
+
+        # Corrupt the stored counters, as after a bulk SQL import
+        self.env.flush_all()
+        for table, columns in (
+                ('op_alumni', ('event_count', 'job_count')),
+                ('op_alumni_event', ('registered_count', 'attended_count')),
+                ('op_alumni_job', ('application_count',))):
+            self.env.cr.execute('UPDATE %s SET %s' % (table, ', '.join(
+                '%s = 42' % column for column in columns)))
+        self.env.invalidate_all()
+
+        self.op_alumni.action_rebuild_counters()
+        for alumni in self.amal | self.badr:
+            self.assertEqual(alumni.event_count, Registration.search_count([
+                ('alumni_id', '=', alumni.id), ('state', '=', 'attended')]))
+            self.assertEqual(
+                alumni.job_count,
+                self.env['op.alumni.job'].search_count([
+                    ('posted_by', '=', alumni.id)]))
+        for event in self.reunion | self.seminar:
+            self.assertEqual(event.registered_count, Registration.search_count([
+                ('event_id', '=', event.id),
+                ('state', 'in', ['registered', 'attended'])]))
+            self.assertEqual(event.attended_count, Registration.search_count([
+                ('event_id', '=', event.id), ('state', '=', 'attended')]))
+        self.assertEqual(job.application_count, 1)
+        self.assertEqual(
+            (self.amal.event_count, self.badr.event_count), (2, 0))
+        self._assert_event_counters(self.reunion, 2, 1)
@@ -0,0 +1,85 @@
+# -*- coding: utf-8 -*-
+##############################################################################
+#
+#    OpenEduCat Inc
+#    Copyright (C) 2009-TODAY OpenEduCat Inc(<https://www.openeducat.org>).
+#
+##############################################################################
+
+from .test_alumni_common import TestAlumniCommon
+
+
+class TestAlumniDirectory(TestAlumniCommon):
+
+    def setUp(self):
+        super(TestAlumniDirectory, self).setUp()
+        self.alumni = self.op_alumni.browse()
+        # Several alumni share each graduation date, so pages end on ties
+        for index, name in enumerate(('Amal', 'Badr', 'Dana', 'Fadi', 'Hala',
+                                      'Jana', 'Karim')):
+            self.alumni |= self._create_alumni(
+                name, graduation_date='202%s-06-30' % (index % 2))
+        self.alumni.write({'state': 'active', 'is_published': True})
+        self._create_alumni('Hidden')
+
+    def test_case_1_keyset_pages(self):
+        expected = self.op_alumni.search(
+            self.op_alumni._get_directory_domain(),
+            order=self.op_alumni._get_directory_order())
+        self.assertTrue(self.alumni <= expected)
+
+        pages, after = [], None
+        while True:
+            page = self.op_alumni._get_directory_page(after=after, limit=3)
+            self.assertLessEqual(len(page['records']), 3)
+            pages.append(page['records'])
+            after = page['next_cursor']
+            if not after:
+                break
+        listed = self.op_alumni.concat(*pages)
+        self.assertEqual(listed.ids, expected.ids)
+        self.assertEqual(len(pages), -(-len(expected) // 3))
+
+    def test_case_2_search_skills(self):
+        self.alumni[2].skills = 'Kubernetes, PostgreSQL'
+        self.alumni[5].skills = 'Accounting'
+        for search in ('kubernetes', 'Postgre', 'dana kuber'):
+            page = self.op_alumni._get_directory_page(search=search)
+            self.assertEqual(page['records'], self.alumni[2], search)
+        self.assertFalse(self.op_alumni._get_directory_page(
+            search='kubernetes accounting')['records'])
+
+    def test_case_3_cache_key(self):
+        def cache_key():
+            return self.op_alumni._get_directory_page(limit=100)['cache_key']
+
+        # Records written by earlier transactions, the last one a day ago
+        self.env.flush_all()
+        self.env.cr.execute(
+            "UPDATE op_alumni SET write_date = write_date - interval '2 day'")
+        self.env.cr.execute(
+            "UPDATE op_alumni SET write_date = write_date + interval '1 day' "
+            "WHERE id = %s", [self.alumni[1].id])
+        self.op_alumni.invalidate_model(['write_date'])
+        key = cache_key()
+        self.assertEqual(cache_key(), key)
+
+        # A transaction started before the last write commits after it: its
+        # write_date is older than the newest one and no record is added
+        self.alumni[0].current_company = 'Motakamel'
+        self.env.flush_all()
+        self.env.cr.execute(
+            "UPDATE op_alumni SET write_date = now() at time zone 'UTC' - interval '36 hour' "
+            "WHERE id = %s", [self.alumni[0].id])
+        self.op_alumni.invalidate_model(['write_date'])
+        written_key = cache_key()
+        self.assertNotEqual(written_key, key)
+
+        created = self._create_alumni('Latif')
+        created.write({'state': 'active', 'is_published': True})
+        self.env.flush_all()
+        created_key = cache_key()
+        self.assertNotEqual(created_key, written_key)
+
+        created.unlink()
+        self.assertNotEqual(cache_key(), created_key)
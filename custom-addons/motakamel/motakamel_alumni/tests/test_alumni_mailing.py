@@ -0,0 +1,102 @@
+# -*- coding: utf-8 -*-
+##############################################################################
+#
+#    OpenEduCat Inc
+#    Copyright (C) 2009-TODAY OpenEduCat Inc(<https://www.openeducat.org>).
+#
+##############################################################################
+
+from datetime import timedelta
+
+from .test_alumni_common import TestAlumniCommon
+
+
+class TestAlumniMailing(TestAlumniCommon):
+
+    def setUp(self):
+        super(TestAlumniMailing, self).setUp()
+        self.alumni = self.op_alumni.browse()
+        for name in ('Amal', 'Badr', 'Dana', 'Fadi', 'Hala'):
+            self.alumni |= self._create_alumni(name)
+        self.patch(self.env.cr, 'commit', lambda: None)
+
+    def _queue_mailing(self, **vals):
+        mailing = self.env['op.alumni.mailing'].create(dict({
+            'subject': 'Reunion {{ object.first_name }}',
+            'body_html': '<p>Dear <t t-out="object.name"/></p>',
+            'email_from': 'office@example.com',
+            'alumni_ids': [(6, 0, self.alumni.ids)],
+            'rate_limit': 2,
+            'max_retries': 2,
+        }, **vals))
+        mailing.action_queue()
+        self.assertEqual(mailing.state, 'queued')
+        mailing._cron_process_jobs()
+        return mailing
+
+    def _get_mails(self, mailing):
+        return self.env['mail.mail'].sudo().search(
+            [('alumni_mailing_id', '=', mailing.id)], order='res_id')
+
+    def test_case_1_rate_limit(self):
+        mailing = self._queue_mailing()
+        self.assertEqual(mailing.state, 'sending')
+        self.assertEqual(mailing.processed_count, 5)
+        mails = self._get_mails(mailing)
+        self.assertEqual(len(mails), 5)
+        self.assertEqual(mails.mapped('subject'), [
+            'Reunion %s' % alumni.first_name
+            for alumni in self.alumni.sorted('id')])
+        # Two emails per minute, from the time the mailing was queued
+        start = mailing.send_start_date
+        self.assertEqual(
+            [mail.scheduled_date - start for mail in mails],
+            [timedelta(minutes=minutes) for minutes in (0, 0, 1, 1, 2)])
+
+    def test_case_2_no_rate_limit(self):
+        mailing = self._queue_mailing(rate_limit=0)
+        self.assertFalse(any(self._get_mails(mailing).mapped('scheduled_date')))
+
+    def test_case_3_retry(self):
+        mailing = self._queue_mailing()
+        mails = self._get_mails(mailing)
+        mails.write({'state': 'exception', 'failure_reason': 'Timeout'})
+        mails[:2].write({'alumni_mailing_retry_count': 2})
+
+        mailing._retry_failed_mails()
+        self.assertEqual(mails[:2].mapped('state'), ['exception'] * 2)
+        self.assertEqual(mails[2:].mapped('state'), ['outgoing'] * 3)
+        self.assertEqual(mails[2:].mapped('alumni_mailing_retry_count'), [1] * 3)
+        self.assertFalse(any(mails[2:].mapped('failure_reason')))
+        self.assertTrue(all(
+            mail.scheduled_date > mailing.send_start_date for mail in mails[2:]))
+
+        # Exhausted retries are counted as failed, the others are pending
+        mailing._update_delivery_counters()
+        self.assertEqual(mailing.failed_count, 2)
+        self.assertEqual(mailing.sent_count, 0)
+        self.assertEqual(mailing.state, 'sending')
+
+    def test_case_4_delivery_counters(self):
+        mailing = self._queue_mailing()
+        mails = self._get_mails(mailing)
+        # Sent emails are deleted by the mail queue
+        mails[:3].unlink()
+        mails[3].write({'state': 'exception'})
+        mailing._update_delivery_counters()
+        self.assertEqual(mailing.sent_count, 3)
+        self.assertEqual(mailing.failed_count, 1)
+        self.assertEqual(mailing.progress_percentage, 80.0)
+        self.assertEqual(mailing.state, 'sending')
+
+        mails[4].unlink()
+        mailing._update_delivery_counters()
+        self.assertEqual(mailing.sent_count, 4)
+        self.assertEqual(mailing.state, 'done')
+
+    def test_case_5_cancel(self):
+        mailing = self._queue_mailing()
+        mailing.action_cancel()
+        self.assertEqual(mailing.state, 'cancel')
+        self.assertEqual(set(self._get_mails(mailing).mapped('state')), {'cancel'})
+        self.assertEqual(mailing.failed_count, 5)
@@ -17,30 +17,60 @@ class AlumniBulkEmailWizard(models.TransientModel):
     subject = fields.Char('Subject', required=True)
     body = fields.Html('Message', required=True)
     
+    # Delivery progress of the queued mailing
+    mailing_id = fields.Many2one('op.alumni.mailing', 'Mailing', readonly=True)
+    mailing_state = fields.Selection(related='mailing_id.state', string='Mailing Status')
+    total_count = fields.Integer(related='mailing_id.total_count')
+    queued_count = fields.Integer(related='mailing_id.processed_count')
+    sent_count = fields.Integer(related='mailing_id.sent_count')
+    failed_count = fields.Integer(related='mailing_id.failed_count')
+    progress_percentage = fields.Float(related='mailing_id.progress_percentage')
+    
+    @api.model
+    def default_get(self, fields_list):
+        res = super(AlumniBulkEmailWizard, self).default_get(fields_list)
+        if self.env.context.get('active_model') == 'op.alumni' and 'alumni_ids' in fields_list:
+            res['alumni_ids'] = [(6, 0, self.env.context.get('active_ids', []))]
+        return res
+    
     def action_send_email(self):
-        """Send bulk email to selected alumni"""
+        """Queue a bulk mailing to the selected alumni.
+        
+        The emails are rendered, queued and sent by a background job under
+        the configured rate limit, so large mailings no longer block the
+        user's request and failed emails are retried.
+        """
         self.ensure_one()
         
-        mail_template = self.env['mail.template'].create({
-            'name': 'Alumni Bulk Email',
-            'model_id': self.env['ir.model']._get('op.alumni').id,
+        mailing = self.env['op.alumni.mailing'].create({
             'subject': self.subject,
             'body_html': self.body,
-            'email_from': self.env.user.email or self.env.company.email,
+            'alumni_ids': [(6, 0, self.alumni_ids.ids)],
         })
+        mailing.action_queue()
+        self.mailing_id = mailing
         
-        for alumni in self.alumni_ids:
-            if alumni.email:
-                mail_template.send_mail(alumni.id, force_send=True)
-        
+        # Reopen the wizard, which now shows the delivery progress
+        return self.action_refresh_progress()
+    
+    def action_refresh_progress(self):
+        """Reload the wizard to show the current delivery progress."""
+        self.ensure_one()
         return {
-            'type': 'ir.actions.client',
-            'tag': 'display_notification',
-            'params': {
-                'title': _('Success'),
-                'message': _('Emails sent successfully to %s alumni') % len(self.alumni_ids),
-                'type': 'success',
-                'sticky': False,
-            }
+            'type': 'ir.actions.act_window',
+            'name': _('Alumni Bulk Email'),
+            'res_model': self._name,
+            'res_id': self.id,
+            'view_mode': 'form',
+            'target': 'new',
+        }
+    
+    def action_open_mailing(self):
+        """Open the mailing, to follow its progress after the wizard is closed."""
+        self.ensure_one()
+        return {
+            'type': 'ir.actions.act_window',
+            'res_model': 'op.alumni.mailing',
+            'res_id': self.mailing_id.id,
+            'view_mode': 'form',
         }
-
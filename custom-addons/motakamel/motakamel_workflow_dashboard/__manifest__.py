@@ -20,7 +20,7 @@
 
 {
     'name': 'Motakamel Workflow Dashboard',
-    'version': '18.0.1.0',
+    'version': '18.0.1.1',
     'license': 'LGPL-3',
     'category': 'Education',
     'sequence': 1,
@@ -52,6 +52,7 @@
         'data/workflow_administration_data.xml',
         'data/workflow_parent_data.xml',
         'data/workflow_module_mapping_data.xml',
+        'data/ir_cron_data.xml',
         'views/workflow_views.xml',
         'views/workflow_hub_view.xml',
         'views/workflow_menu.xml',
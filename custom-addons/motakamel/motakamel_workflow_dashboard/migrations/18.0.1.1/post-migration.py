@@ -0,0 +1,33 @@
+# -*- coding: utf-8 -*-
+
+import logging
+from odoo import api, SUPERUSER_ID
+
+_logger = logging.getLogger(__name__)
+
+# Records of the student lifecycle stages, an empty date field reads the
+# entry date from the tracked state changes
+STAGE_MAPPINGS = {
+    'stage_inquiry': ('op.admission', 'draft', 'application_date'),
+    'stage_admission': ('op.admission', 'submit,confirm,pending', False),
+    'stage_registration': ('op.admission', 'admission', False),
+    'stage_enrollment': ('op.admission', 'done', 'admission_date'),
+    'stage_academic_progress': ('op.student.course', 'running', 'create_date'),
+    'stage_graduation': ('op.student.course', 'finished', False),
+}
+
+
+def migrate(cr, version):
+    """The stage data is noupdate, write the record mappings of the analytics."""
+    env = api.Environment(cr, SUPERUSER_ID, {})
+    for xmlid, (res_model, state_values, date_field) in STAGE_MAPPINGS.items():
+        stage = env.ref('motakamel_workflow_dashboard.%s' % xmlid, raise_if_not_found=False)
+        if not stage:
+            continue
+        stage.write({
+            'res_model': res_model,
+            'state_field': 'state',
+            'state_values': state_values,
+            'date_field': date_field,
+        })
+    _logger.info('Mapped the student lifecycle stages to their records')
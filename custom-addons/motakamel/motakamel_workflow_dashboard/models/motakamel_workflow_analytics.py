@@ -18,8 +18,24 @@
 #
 ###############################################################################
 
+import logging
+from collections import defaultdict
+from datetime import timedelta
+
 from odoo import models, fields, api
-from datetime import datetime, timedelta
+from odoo.tools import SQL
+
+_logger = logging.getLogger(__name__)
+
+# Period over which the records entering a stage are counted as throughput,
+# matching the interval of the analytics cron
+THROUGHPUT_PERIOD = timedelta(days=1)
+# Number of refreshes averaged on each side of the trend comparison
+TREND_WINDOW = 3
+# Relative change of the throughput above which the trend is not stable
+TREND_THRESHOLD = 0.1
+# Age of the oldest analytics points read for the trend
+TREND_HISTORY_DAYS = 90
 
 
 class MotakamelWorkflowAnalytics(models.Model):
@@ -31,8 +47,11 @@ class MotakamelWorkflowAnalytics(models.Model):
     stage_id = fields.Many2one('motakamel.workflow.stage', string='Stage', required=True, ondelete='cascade')
     record_count = fields.Integer(string='Record Count', default=0)
     avg_duration = fields.Float(string='Average Duration (hours)', default=0.0)
+    throughput = fields.Integer(string='Throughput', default=0,
+                                help='Records that entered the stage during the last day')
     bottlenecks = fields.Text(string='Bottlenecks')
     last_updated = fields.Datetime(string='Last Updated', default=fields.Datetime.now)
+    point_ids = fields.One2many('motakamel.workflow.analytics.point', 'analytics_id', string='History')
     
     # Computed fields
     efficiency_score = fields.Float(string='Efficiency Score', compute='_compute_efficiency_score')
@@ -51,36 +70,151 @@ class MotakamelWorkflowAnalytics(models.Model):
             else:
                 record.efficiency_score = 0
     
-    @api.depends('last_updated', 'record_count')
+    @api.depends('point_ids.throughput')
     def _compute_trend(self):
+        """Compare the throughput of the latest refreshes with the refreshes before them"""
+        points = self.env['motakamel.workflow.analytics.point'].search([
+            ('analytics_id', 'in', self._origin.ids),
+            ('date', '>=', fields.Datetime.now() - timedelta(days=TREND_HISTORY_DAYS)),
+        ], order='date desc, id desc')
+        throughputs = defaultdict(list)
+        for point in points:
+            throughputs[point.analytics_id.id].append(point.throughput)
         for record in self:
-            # Simple trend calculation based on recent activity
-            if record.last_updated:
-                days_since_update = (datetime.now() - record.last_updated).days
-                if days_since_update < 1:
-                    record.trend = 'improving'
-                elif days_since_update < 7:
-                    record.trend = 'stable'
-                else:
-                    record.trend = 'declining'
+            history = throughputs[record._origin.id][:2 * TREND_WINDOW]
+            recent, previous = history[:TREND_WINDOW], history[TREND_WINDOW:]
+            if not recent or not previous:
+                record.trend = 'stable'
+                continue
+            recent_avg = sum(recent) / len(recent)
+            previous_avg = sum(previous) / len(previous)
+            if recent_avg > previous_avg * (1 + TREND_THRESHOLD):
+                record.trend = 'improving'
+            elif recent_avg < previous_avg * (1 - TREND_THRESHOLD):
+                record.trend = 'declining'
             else:
                 record.trend = 'stable'
 
+    def _read_stage_statistics(self, model_name, state_field, date_field, states, since, now):
+        """Read the statistics of the records of ``model_name`` in ``states``
+        with one query grouped by state.
+
+        :return: dict {state: (count, total dwell hours, entered since ``since``)}
+        """
+        Model = self.env[model_name]
+        query = Model._search([(state_field, 'in', states)])
+        state_sql = Model._field_to_sql(Model._table, state_field, query)
+        if date_field:
+            # Records without an entry date entered the stage when created
+            date_sql = SQL("COALESCE(%s, %s)",
+                           Model._field_to_sql(Model._table, date_field, query),
+                           Model._field_to_sql(Model._table, 'create_date', query))
+        else:
+            date_sql = self._state_change_date_sql(Model, state_field, query)
+        rows = self.env.execute_query(SQL(
+            """SELECT state, COUNT(*),
+                      COALESCE(SUM(EXTRACT(EPOCH FROM (%(now)s - entry_date))), 0)::float / 3600.0,
+                      COUNT(*) FILTER (WHERE entry_date > %(since)s)
+                 FROM (SELECT %(state)s AS state, %(date)s AS entry_date
+                         FROM %(from)s
+                        WHERE %(where)s) AS stage_records
+             GROUP BY state""",
+            state=state_sql,
+            date=date_sql,
+            now=now,
+            since=since,
+            **{'from': query.from_clause, 'where': query.where_clause},
+        ))
+        return {state: (count, hours, entered) for state, count, hours, entered in rows}
+
+    def _state_change_date_sql(self, Model, state_field, query):
+        """Return the SQL of the date of the last tracked change of
+        ``state_field``, i.e. the date the records entered their current state.
+        Records which never changed state entered it when they were created.
+        """
+        field = self.env['ir.model.fields']._get(Model._name, state_field)
+        return SQL(
+            """COALESCE((SELECT MAX(message.date)
+                         FROM mail_tracking_value tracking
+                         JOIN mail_message message ON message.id = tracking.mail_message_id
+                        WHERE tracking.field_id = %s
+                          AND message.model = %s
+                          AND message.res_id = %s), %s)""",
+            field.id,
+            Model._name,
+            Model._field_to_sql(Model._table, 'id', query),
+            Model._field_to_sql(Model._table, 'create_date', query),
+        )
+
+    def _check_stage_mapping(self, stage):
+        """Return whether the records of ``stage`` can be analysed"""
+        if not stage._get_records_domain():
+            return False
+        Model = self.env[stage.res_model]
+        state_field = stage.state_field or 'state'
+        for fname in filter(None, (state_field, stage.date_field)):
+            field = Model._fields.get(fname)
+            if not field or not field.store:
+                _logger.warning("Stage %s: field %s is not a stored field of %s", stage.name, fname, stage.res_model)
+                return False
+        if not stage.date_field and not Model._fields[state_field].tracking:
+            _logger.warning("Stage %s: field %s of %s is not tracked and no entry date field is set",
+                            stage.name, state_field, stage.res_model)
+            return False
+        return True
+
+    def _refresh_analytics(self):
+        """Refresh the analytics from the records of their stages.
+
+        Stages backed by the same model are read together with one query
+        grouped by state, and every refresh stores an analytics point.
+        """
+        now = fields.Datetime.now()
+        groups = defaultdict(lambda: self.browse())
+        for analytics in self:
+            stage = analytics.stage_id
+            if self._check_stage_mapping(stage):
+                groups[stage.res_model, stage.state_field or 'state', stage.date_field or False] |= analytics
+
+        point_vals = []
+        for (model_name, state_field, date_field), group in groups.items():
+            states = sorted({value for stage in group.stage_id for value in stage._get_state_values()})
+            statistics = self._read_stage_statistics(
+                model_name, state_field, date_field, states, now - THROUGHPUT_PERIOD, now)
+            for analytics in group:
+                count = hours = entered = 0
+                for state in analytics.stage_id._get_state_values():
+                    state_count, state_hours, state_entered = statistics.get(state, (0, 0.0, 0))
+                    count += state_count
+                    hours += state_hours
+                    entered += state_entered
+                vals = {
+                    'record_count': count,
+                    'avg_duration': round(hours / count, 2) if count else 0.0,
+                    'throughput': entered,
+                    'last_updated': now,
+                }
+                analytics.write(vals)
+                point_vals.append({
+                    'analytics_id': analytics.id,
+                    'date': now,
+                    'record_count': vals['record_count'],
+                    'avg_duration': vals['avg_duration'],
+                    'throughput': vals['throughput'],
+                })
+        self.env['motakamel.workflow.analytics.point'].create(point_vals)
+        return True
+
     def action_refresh_analytics(self):
         """Refresh analytics data"""
-        self.ensure_one()
-        # This would typically query actual data from related models
-        # For now, we'll simulate some data
-        self.record_count = self.env['op.student'].search_count([]) if hasattr(self.env, 'op.student') else 0
-        self.avg_duration = 24.0  # Simulated average duration
-        self.last_updated = fields.Datetime.now()
+        self._refresh_analytics()
         
         return {
             'type': 'ir.actions.client',
             'tag': 'display_notification',
             'params': {
                 'title': 'Analytics Updated',
-                'message': f'Analytics refreshed for {self.stage_id.name}',
+                'message': f'Analytics refreshed for {", ".join(self.stage_id.mapped("name"))}',
                 'type': 'success',
             }
         }
@@ -88,12 +222,14 @@ class MotakamelWorkflowAnalytics(models.Model):
     def action_view_records(self):
         """View records in this stage"""
         self.ensure_one()
-        # This would open the relevant model based on the stage
-        # For now, we'll open a generic view
+        domain = self.stage_id._get_records_domain()
+        if not domain:
+            return False
         return {
             'type': 'ir.actions.act_window',
             'name': f'{self.stage_id.name} Records',
-            'res_model': 'op.student' if hasattr(self.env, 'op.student') else 'res.partner',
+            'res_model': self.stage_id.res_model,
+            'domain': domain,
             'view_mode': 'list,form',
             'target': 'current',
         }
@@ -101,20 +237,27 @@ class MotakamelWorkflowAnalytics(models.Model):
     @api.model
     def update_all_analytics(self):
         """Update analytics for all workflows"""
-        workflows = self.env['motakamel.workflow'].search([])
-        for workflow in workflows:
-            for stage in workflow.stage_ids:
-                analytics = self.search([
-                    ('workflow_id', '=', workflow.id),
-                    ('stage_id', '=', stage.id)
-                ], limit=1)
-                
-                if not analytics:
-                    analytics = self.create({
-                        'workflow_id': workflow.id,
-                        'stage_id': stage.id,
-                    })
-                
-                analytics.action_refresh_analytics()
+        stages = self.env['motakamel.workflow.stage'].search([])
+        analytics = self.search([('stage_id', 'in', stages.ids)])
+        missing = stages - analytics.stage_id
+        analytics |= self.create([{
+            'workflow_id': stage.workflow_id.id,
+            'stage_id': stage.id,
+        } for stage in missing])
+        analytics._refresh_analytics()
         
         return True
+
+
+class MotakamelWorkflowAnalyticsPoint(models.Model):
+    _name = 'motakamel.workflow.analytics.point'
+    _description = 'Motakamel Workflow Analytics Point'
+    _order = 'date desc, id desc'
+
+    analytics_id = fields.Many2one('motakamel.workflow.analytics', string='Analytics', required=True,
+                                   ondelete='cascade', index=True)
+    stage_id = fields.Many2one(related='analytics_id.stage_id', store=True)
+    date = fields.Datetime(string='Date', required=True, default=fields.Datetime.now, index=True)
+    record_count = fields.Integer(string='Record Count')
+    avg_duration = fields.Float(string='Average Duration (hours)')
+    throughput = fields.Integer(string='Throughput')
@@ -42,6 +42,14 @@ class MotakamelWorkflowStage(models.Model):
                                     'from_stage_id', 'to_stage_id', string='Next Stages')
     required_fields = fields.Text(string='Required Fields', help='JSON string of required fields')
     active = fields.Boolean(string='Active', default=True)
+
+    # Records of the stage, used by the analytics
+    res_model = fields.Char(string='Model', help='Technical name of the model holding the records of this stage, e.g. op.admission')
+    state_field = fields.Char(string='State Field', default='state', help='Field of the model holding the state of the records')
+    state_values = fields.Char(string='State Values', help='Comma-separated list of the states of the records in this stage')
+    date_field = fields.Char(string='Entry Date Field',
+                             help='Date field of the model set when a record enters the stage, used for dwell times and throughput. '
+                                  'Leave empty to use the date of the last tracked change of the state field')
     
     # Computed fields
     transition_count = fields.Integer(string='Transition Count', compute='_compute_transition_count')
@@ -54,12 +62,27 @@ class MotakamelWorkflowStage(models.Model):
     
     @api.depends('workflow_id', 'workflow_id.analytics_ids')
     def _compute_record_count(self):
+        analytics = self.env['motakamel.workflow.analytics'].search([
+            ('stage_id', 'in', self.ids),
+        ], order='id desc')
+        count_by_stage = {}
+        for record in analytics:
+            count_by_stage.setdefault((record.workflow_id.id, record.stage_id.id), record.record_count)
         for record in self:
-            analytics = self.env['motakamel.workflow.analytics'].search([
-                ('workflow_id', '=', record.workflow_id.id),
-                ('stage_id', '=', record.id)
-            ], limit=1)
-            record.record_count = analytics.record_count if analytics else 0
+            record.record_count = count_by_stage.get((record.workflow_id.id, record.id), 0)
+
+    def _get_state_values(self):
+        """Return the list of states of the records in this stage"""
+        self.ensure_one()
+        return [value.strip() for value in (self.state_values or '').split(',') if value.strip()]
+
+    def _get_records_domain(self):
+        """Return the domain of the records in this stage, False if the stage is not mapped"""
+        self.ensure_one()
+        values = self._get_state_values()
+        if not self.res_model or self.res_model not in self.env or not values:
+            return False
+        return [(self.state_field or 'state', 'in', values)]
 
     def action_open_stage_modules(self):
         """Open modules related to this stage"""
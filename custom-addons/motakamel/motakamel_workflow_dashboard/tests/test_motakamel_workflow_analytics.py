@@ -18,6 +18,9 @@
 #
 ###############################################################################
 
+from datetime import timedelta
+
+from odoo import fields
 from odoo.tests.common import TransactionCase
 from odoo.exceptions import ValidationError
 
@@ -389,3 +392,141 @@ class TestMotakamelWorkflowAnalytics(TransactionCase):
         self.assertEqual(len(bottlenecks), 1)
         self.assertEqual(bottlenecks[0], analytics2)
         self.assertEqual(bottlenecks[0].bottleneck_reason, 'Complex processing')
+
+    def test_analytics_refresh_from_stage_records(self):
+        """Test analytics are computed from the records mapped to the stages"""
+        workflow = self.Workflow.create({
+            'name': 'Test Workflow',
+            'description': 'Test workflow',
+        })
+        stage_contact, stage_address = self.WorkflowStage.create([{
+            'name': 'Contacts',
+            'workflow_id': workflow.id,
+            'sequence': 10,
+            'res_model': 'res.partner',
+            'state_field': 'type',
+            'state_values': 'contact',
+            'date_field': 'create_date',
+        }, {
+            'name': 'Addresses',
+            'workflow_id': workflow.id,
+            'sequence': 20,
+            'res_model': 'res.partner',
+            'state_field': 'type',
+            'state_values': 'invoice, delivery',
+            'date_field': 'create_date',
+        }])
+        Partner = self.env['res.partner']
+        counts = {
+            state: Partner.search_count([('type', '=', state)])
+            for state in ('contact', 'invoice', 'delivery')
+        }
+        Partner.create([
+            {'name': 'Contact', 'type': 'contact'},
+            {'name': 'Invoice', 'type': 'invoice'},
+            {'name': 'Delivery', 'type': 'delivery'},
+        ])
+
+        self.WorkflowAnalytics.update_all_analytics()
+
+        analytics = self.WorkflowAnalytics.search([('workflow_id', '=', workflow.id)])
+        contact = analytics.filtered(lambda a: a.stage_id == stage_contact)
+        address = analytics.filtered(lambda a: a.stage_id == stage_address)
+        self.assertEqual(contact.record_count, counts['contact'] + 1)
+        self.assertEqual(address.record_count, counts['invoice'] + counts['delivery'] + 2)
+        self.assertGreaterEqual(address.throughput, 2)
+        self.assertEqual(len(contact.point_ids), 1)
+        self.assertEqual(contact.point_ids.record_count, contact.record_count)
+
+    def test_analytics_trend_from_throughput(self):
+        """Test the trend compares the throughput of the latest refreshes"""
+        workflow = self.Workflow.create({
+            'name': 'Test Workflow',
+            'description': 'Test workflow',
+        })
+        stage = self.WorkflowStage.create({
+            'name': 'Test Stage',
+            'workflow_id': workflow.id,
+            'sequence': 10,
+        })
+        analytics = self.WorkflowAnalytics.create({
+            'workflow_id': workflow.id,
+            'stage_id': stage.id,
+        })
+        self.assertEqual(analytics.trend, 'stable')
+
+        now = fields.Datetime.now()
+        self.env['motakamel.workflow.analytics.point'].create([{
+            'analytics_id': analytics.id,
+            'date': now - timedelta(days=day),
+            'throughput': throughput,
+        } for day, throughput in enumerate([20, 18, 22, 10, 9, 11])])
+        self.assertEqual(analytics.trend, 'improving')
+
+    def test_analytics_unmapped_stage(self):
+        """Test stages without a backing model are left untouched"""
+        workflow = self.Workflow.create({
+            'name': 'Test Workflow',
+            'description': 'Test workflow',
+        })
+        stage = self.WorkflowStage.create({
+            'name': 'Test Stage',
+            'workflow_id': workflow.id,
+            'sequence': 10,
+        })
+        analytics = self.WorkflowAnalytics.create({
+            'workflow_id': workflow.id,
+            'stage_id': stage.id,
+            'record_count': 5,
+        })
+        analytics.action_refresh_analytics()
+        self.assertEqual(analytics.record_count, 5)
+        self.assertFalse(analytics.point_ids)
+        self.assertFalse(analytics.action_view_records())
+
+    def test_analytics_entry_date_from_state_tracking(self):
+        """Test stages without entry date field use the last tracked state change"""
+        workflow = self.Workflow.create({
+            'name': 'Test Workflow',
+            'description': 'Test workflow',
+        })
+        stage_tracked, stage_created = self.WorkflowStage.create([{
+            'name': 'Graduation',
+            'workflow_id': workflow.id,
+            'res_model': 'op.student.course',
+            'state_values': 'finished',
+            'date_field': False,
+        }, {
+            'name': 'Graduation By Creation',
+            'workflow_id': workflow.id,
+            'res_model': 'op.student.course',
+            'state_values': 'finished',
+            'date_field': 'create_date',
+        }])
+        student = self.env['op.student'].create({
+            'first_name': 'Tracked',
+            'last_name': 'Student',
+            'name': 'Tracked Student',
+            'gender': 'm',
+        })
+        student_course = self.env['op.student.course'].create({
+            'student_id': student.id,
+            'course_id': self.env.ref('openeducat_core.op_course_1').id,
+        })
+        self.env.flush_all()
+        self.env.cr.execute(
+            "UPDATE op_student_course SET create_date = create_date - interval '10 day' WHERE id = %s",
+            [student_course.id])
+        student_course.invalidate_recordset(['create_date'])
+        student_course.state = 'finished'
+        self.env.flush_all()
+        self.env.cr.precommit.run()
+
+        self.WorkflowAnalytics.update_all_analytics()
+
+        analytics = self.WorkflowAnalytics.search([('workflow_id', '=', workflow.id)])
+        tracked = analytics.filtered(lambda a: a.stage_id == stage_tracked)
+        created = analytics.filtered(lambda a: a.stage_id == stage_created)
+        self.assertEqual(tracked.record_count, created.record_count)
+        self.assertEqual(tracked.throughput, created.throughput + 1)
+        self.assertLess(tracked.avg_duration, created.avg_duration)
@@ -33,7 +33,9 @@
         'security/op_security.xml',
         'security/ir.model.access.csv',
         'data/activity_type_data.xml',
+        'data/ir_cron_data.xml',
         'wizard/student_migrate_wizard_view.xml',
+        'views/student_migration_view.xml',
         'views/activity_view.xml',
         'views/activity_type_view.xml',
         'views/student_view.xml',
@@ -21,3 +21,4 @@
 from . import activity
 from . import activity_type
 from . import student
+from . import student_migration
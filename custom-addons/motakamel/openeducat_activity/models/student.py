@@ -35,6 +35,6 @@ class OpStudent(models.Model):
         return action
 
     def _compute_count(self):
+        counts = self._count_related('op.activity', 'student_id')
         for record in self:
-            record.activity_count = self.env['op.activity'].search_count(
-                [('student_id', 'in', self.ids)])
+            record.activity_count = counts.get(record.id, 0)
@@ -0,0 +1,117 @@
+###############################################################################
+#
+#    OpenEduCat Inc
+#    Copyright (C) 2009-TODAY OpenEduCat Inc(<https://www.openeducat.org>).
+#
+#    This program is free software: you can redistribute it and/or modify
+#    it under the terms of the GNU Lesser General Public License as
+#    published by the Free Software Foundation, either version 3 of the
+#    License, or (at your option) any later version.
+#
+#    This program is distributed in the hope that it will be useful,
+#    but WITHOUT ANY WARRANTY; without even the implied warranty of
+#    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#    GNU Lesser General Public License for more details.
+#
+#    You should have received a copy of the GNU Lesser General Public License
+#    along with this program.  If not, see <http://www.gnu.org/licenses/>.
+#
+###############################################################################
+
+
+from odoo import _, fields, models
+
+
+class OpStudentMigration(models.Model):
+    _name = "op.student.migration"
+    _inherit = ["op.background.job.mixin"]
+    _description = "Student Migration"
+    _job_cron = 'openeducat_activity.ir_cron_process_student_migration'
+
+    # Number of course lines migrated per batch
+    CHUNK_SIZE = 500
+
+    name = fields.Char(
+        'Name', required=True, readonly=True,
+        default=lambda self: _('Migration %s') % fields.Datetime.now())
+    date = fields.Date('Date', required=True, default=fields.Date.context_today)
+    course_from_id = fields.Many2one('op.course', 'From Course', required=True)
+    course_to_id = fields.Many2one('op.course', 'To Course')
+    batch_id = fields.Many2one('op.batch', 'To Batch')
+    optional_sub = fields.Boolean("Optional Subjects")
+    course_completed = fields.Boolean(string="Course Completed?")
+    faculty_id = fields.Many2one(
+        'op.faculty', string='Faculty',
+        default=lambda self: self.env['op.activity']._default_faculty())
+    student_ids = fields.Many2many(
+        'op.student', 'op_student_migration_student_rel',
+        'migration_id', 'student_id', string='Student(s)')
+    student_course_ids = fields.Many2many(
+        'op.student.course', 'op_student_migration_student_course_rel',
+        'migration_id', 'student_course_id', string='Migrated Courses',
+        readonly=True)
+
+    def _prepare_start_vals(self):
+        """The course lines leaving the from course are all found up front,
+        the chunks then migrate them in batches."""
+        vals = super(OpStudentMigration, self)._prepare_start_vals()
+        student_courses = self.env['op.student.course'].search([
+            ('student_id', 'in', self.student_ids.ids),
+            ('course_id', '=', self.course_from_id.id),
+        ])
+        vals['student_course_ids'] = [(6, 0, student_courses.ids)]
+        return vals
+
+    def _get_items(self):
+        return self.student_course_ids.sorted('id')
+
+    def _process_chunk(self, student_courses):
+        self._migrate(student_courses)
+
+    def _get_activity_description(self):
+        self.ensure_one()
+        if self.course_completed:
+            return _('Migration From {} to Completed Course'.format(
+                self.course_from_id.name))
+        return _('Migration from {} to {}'.format(
+            self.course_from_id.name, self.course_to_id.name))
+
+    def _migrate(self, student_courses):
+        """Finish ``student_courses`` and, unless the course is completed,
+        enroll their students in the to course with batched creates."""
+        self.ensure_one()
+        student_courses.write({'state': 'finished'})
+        act_type = self.env.ref('openeducat_activity.op_activity_type_3')
+        description = self._get_activity_description()
+        self.env['op.activity'].create([{
+            'student_id': student_course.student_id.id,
+            'faculty_id': self.faculty_id.id,
+            'type_id': act_type.id,
+            'date': self.date,
+            'description': description,
+        } for student_course in student_courses])
+        if self.course_completed:
+            return
+
+        course = self.course_to_id
+        subjects = course.subject_ids
+        self.env['op.student.course'].create([{
+            'student_id': student_course.student_id.id,
+            'course_id': course.id,
+            'batch_id': self.batch_id.id,
+            'subject_ids': [(6, 0, subjects.ids)],
+        } for student_course in student_courses])
+        compulsory_subjects = subjects.filtered(
+            lambda s: s.subject_type == 'compulsory')
+        registrations = self.env['op.subject.registration'].create([{
+            'student_id': student_course.student_id.id,
+            'batch_id': self.batch_id.id,
+            'course_id': course.id,
+            'min_unit_load': course.min_unit_load or 0.0,
+            'max_unit_load': course.max_unit_load or 0.0,
+            'state': 'draft',
+            'compulsory_subject_ids': [(6, 0, compulsory_subjects.ids)],
+        } for student_course in student_courses])
+        if not self.optional_sub:
+            registrations.action_submitted()
+            registrations.action_approve()
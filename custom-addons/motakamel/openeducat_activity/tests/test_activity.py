@@ -20,6 +20,8 @@
 
 from logging import info
 
+from odoo.exceptions import ValidationError
+
 from .test_activity_common import TestActivityCommon
 
 
@@ -77,3 +79,113 @@ class TestStudentMigrateWizard(TestActivityCommon):
         })
         student_migrate.student_migrate_forward()
         student_migrate1.student_by_course()
+
+
+class TestStudentMigration(TestActivityCommon):
+
+    def setUp(self):
+        super(TestStudentMigration, self).setUp()
+        self.subject = self.env['op.subject'].create({
+            'name': 'Migration Subject',
+            'code': 'MIGSUB',
+        })
+        self.course_from, self.course_to = self.env['op.course'].create([{
+            'name': 'Migration Year 1',
+            'code': 'MIGY1',
+        }, {
+            'name': 'Migration Year 2',
+            'code': 'MIGY2',
+            'subject_ids': [(6, 0, self.subject.ids)],
+        }])
+        self.batch = self.env['op.batch'].create({
+            'name': 'Migration Batch',
+            'code': 'MIGB',
+            'course_id': self.course_to.id,
+            'start_date': '2030-01-01',
+            'end_date': '2030-12-31',
+        })
+        self.students = self.env['op.student'].create([{
+            'first_name': 'Migration',
+            'last_name': 'Student %s' % i,
+            'name': 'Migration Student %s' % i,
+            'gender': 'm',
+        } for i in range(5)])
+        self.env['op.student.course'].create([{
+            'student_id': student.id,
+            'course_id': self.course_from.id,
+        } for student in self.students])
+        self.patch(self.env.cr, 'commit', lambda: None)
+
+    def _create_migration(self, **vals):
+        return self.env['op.student.migration'].create(dict({
+            'course_from_id': self.course_from.id,
+            'course_to_id': self.course_to.id,
+            'batch_id': self.batch.id,
+            'student_ids': [(6, 0, self.students.ids)],
+        }, **vals))
+
+    def _assert_migrated(self):
+        courses = self.students.course_detail_ids
+        self.assertEqual(
+            set(courses.filtered(
+                lambda c: c.course_id == self.course_from).mapped('state')),
+            {'finished'})
+        new_courses = courses.filtered(lambda c: c.course_id == self.course_to)
+        self.assertEqual(new_courses.student_id, self.students)
+        self.assertEqual(new_courses.subject_ids, self.subject)
+        registrations = self.env['op.subject.registration'].search([
+            ('student_id', 'in', self.students.ids)])
+        self.assertEqual(len(registrations), 5)
+        self.assertEqual(set(registrations.mapped('state')), {'approved'})
+        self.assertEqual(registrations.compulsory_subject_ids, self.subject)
+        self.assertEqual(self.op_activity.search_count([
+            ('student_id', 'in', self.students.ids)]), 5)
+
+    def test_case_1_migrate(self):
+        migration = self._create_migration()
+        migration.action_start()
+        self.assertEqual(migration.total_count, 5)
+        self._assert_migrated()
+
+    def test_case_2_migrate_in_chunks(self):
+        # The course lines found at the start are migrated chunk by chunk
+        self.patch(type(self.env['op.student.migration']), 'CHUNK_SIZE', 2)
+        migration = self._create_migration()
+        migration.action_start()
+        self.assertEqual(migration.student_course_ids.student_id,
+                         self.students)
+        self._assert_migrated()
+
+    def test_case_3_course_completed(self):
+        migration = self._create_migration(
+            course_to_id=False, batch_id=False, course_completed=True)
+        migration.action_start()
+        self.assertEqual(
+            self.students.course_detail_ids.course_id, self.course_from)
+        self.assertEqual(self.op_activity.search_count([
+            ('student_id', 'in', self.students.ids)]), 5)
+
+    def test_case_4_wizard_errors(self):
+        parent = self.env['op.course'].create({
+            'name': 'Migration Parent',
+            'code': 'MIGP',
+        })
+        (self.course_from | self.course_to).write({'parent_id': parent.id})
+
+        def _migrate(migration, student_courses):
+            raise ValidationError('Course not found')
+        self.patch(type(self.env['op.student.migration']), '_migrate',
+                   _migrate)
+        wizard = self.op_student_migrate_wizard.create({
+            'course_from_id': self.course_from.id,
+            'course_to_id': self.course_to.id,
+            'batch_id': self.batch.id,
+            'student_ids': [(6, 0, self.students.ids)],
+        })
+
+        # The wizard stays open on the errors instead of closing silently
+        action = wizard.student_migrate_forward()
+        self.assertEqual(action['res_model'], 'op.student.migration')
+        migration = self.env['op.student.migration'].browse(action['res_id'])
+        self.assertEqual(migration.state, 'done')
+        self.assertIn('Course not found', migration.error_log)
@@ -79,63 +79,36 @@ class StudentMigrate(models.TransientModel):
                 raise ValidationError(
                     _("Can't migrate, Proceed for new admission"))
 
-    def student_migrate_forward(self):
-        act_type = self.env.ref('openeducat_activity.op_activity_type_3')
-        for record in self:
-            for student in record.student_ids:
-                if self.course_completed:
-                    for course_update in student.course_detail_ids:
-                        if course_update.course_id == record.course_from_id:
-                            course_update.state = 'finished'
-                            activity_vals = {
-                                'student_id': student.id,
-                                'type_id': act_type.id,
-                                'date': self.date,
-                                'description': _('Migration From {}'
-                                                 ' to Completed Course'.
-                                                 format(record.course_from_id.name)),
-                            }
-                            self.env['op.activity'].create(activity_vals)
-                else:
-                    for course_update in student.course_detail_ids:
-                        if course_update.course_id == self.course_from_id:
-                            course_update.state = 'finished'
-
-                            activity_vals = {
-                                'student_id': student.id,
-                                'type_id': act_type.id,
-                                'date': self.date,
-                                'description': _('Migration from {} to {}'
-                                                 .format(record.course_from_id.name,
-                                                         record.course_to_id.name))
-                            }
-                            self.env['op.activity'].create(activity_vals)
+    def _prepare_migration_vals(self):
+        self.ensure_one()
+        return {
+            'date': self.date,
+            'course_from_id': self.course_from_id.id,
+            'course_to_id': self.course_to_id.id,
+            'batch_id': self.batch_id.id,
+            'optional_sub': self.optional_sub,
+            'course_completed': self.course_completed,
+            'student_ids': [(6, 0, self.student_ids.ids)],
+        }
 
-                            student_course = self.env['op.student.course'].search(
-                                [('student_id', '=', student.id),
-                                 ('course_id', '=', record.course_from_id.id)])
-                            student_course.create({
-                                'student_id': student.id,
-                                'course_id': record.course_to_id.id,
-                                'batch_id': record.batch_id.id,
-                                'subject_ids': record.course_to_id.subject_ids.ids
-                            })
-
-                            reg_id = self.env['op.subject.registration'].create({
-                                'student_id': student.id,
-                                'batch_id': record.batch_id.id,
-                                'course_id':
-                                    record.course_to_id.id,
-                                'min_unit_load':
-                                    record.course_to_id.min_unit_load or 0.0,
-                                'max_unit_load':
-                                    record.course_to_id.max_unit_load or 0.0,
-                                'state': 'draft',
-                            })
-                            reg_id.get_subjects()
-                            if not record.optional_sub:
-                                reg_id.action_submitted()
-                                reg_id.action_approve()
+    def student_migrate_forward(self):
+        migrations = self.env['op.student.migration'].create([
+            record._prepare_migration_vals() for record in self])
+        for migration in migrations:
+            migration.action_start()
+        # Large promotions run in the background, show their progress, and
+        # show the errors of the promotions which failed for some students
+        to_show = migrations.filtered(
+            lambda m: m.state != 'done' or m.error_log)
+        if to_show:
+            return {
+                'type': 'ir.actions.act_window',
+                'res_model': 'op.student.migration',
+                'res_id': to_show[:1].id,
+                'view_mode': 'form',
+                'target': 'current',
+            }
+        return True
 
     @api.depends('course_from_id')
     def _compute_valid_to_courses(self):
@@ -42,6 +42,7 @@
         'report/report_admission_analysis.xml',
         'report/report_menu.xml',
         'wizard/admission_analysis_wizard_view.xml',
+        'wizard/admission_batch_enroll_wizard_view.xml',
         'menus/op_menu.xml',
     ],
     'demo': [
@@ -277,22 +277,39 @@ class OpAdmission(models.Model):
         for record in self:
             record.state = 'confirm'
 
-    def get_student_vals(self):
+    def _create_student_users(self):
+        """Create the portal users of the admitted students in one batch.
+
+        Returns a dictionary mapping the admission id to its new user.
+        Admissions whose login is already used get no user.
+        """
+        portal_group = self.env.ref('base.group_portal')
+        vals_list = [{
+            'name': student.name,
+            'login': student.email if student.email else student.application_number,  # noqa
+            'image_1920': student.image or False,
+            'is_student': True,
+            'company_id': student.company_id.id,
+            'groups_id': [(6, 0, portal_group.ids)],
+        } for student in self]
+        users_by_login, _skipped = self.env[
+            'res.users']._bulk_create_users(vals_list)
+        student_users = {}
+        for student, vals in zip(self, vals_list):
+            # pop: a login shared by several admissions goes to the first one
+            user = users_by_login.pop((vals['login'] or '').strip().lower(), None)
+            if user:
+                student_users[student.id] = user
+        return student_users
+
+    def get_student_vals(self, student_users=None):
         enable_create_student_user = self.env['ir.config_parameter'].get_param(
             'openeducat_admission.enable_create_student_user')
+        if enable_create_student_user and student_users is None:
+            # Only the values of the first admission are returned
+            student_users = self[:1]._create_student_users()
         for student in self:
-            student_user = False
-            if enable_create_student_user:
-                student_user = self.env['res.users'].create({
-                    'name': student.name,
-                    'login': student.email if student.email else student.application_number,  # noqa
-                    'image_1920': self.image or False,
-                    'is_student': True,
-                    'company_id': self.company_id.id,
-                    'groups_id': [
-                        (6, 0,
-                         [self.env.ref('base.group_portal').id])]
-                })
+            student_user = (student_users or {}).get(student.id, False)
             details = {
                 'name': student.name,
                 'phone': student.phone,
@@ -307,7 +324,7 @@ class OpAdmission(models.Model):
                 'image_1920': student.image,
                 'zip': student.zip,
             }
-            if enable_create_student_user:
+            if student_user:
                 student_user.partner_id.write(details)
             details.update({
                 'title': student.title and student.title.id or False,
@@ -336,90 +353,182 @@ class OpAdmission(models.Model):
             return details
 
     def enroll_student(self):
-        for record in self:
-            if record.register_id.max_count:
-                total_admission = self.env['op.admission'].search_count(
-                    [('register_id', '=', record.register_id.id),
-                     ('state', '=', 'done')])
-                if not total_admission < record.register_id.max_count:
-                    msg = 'Max Admission In Admission Register :- (%s)' % (
-                        record.register_id.max_count)
-                    raise ValidationError(_(msg))
-            if not record.student_id:
-                vals = record.get_student_vals()
-                if vals:
-                    record.student_id = student_id = self.env[
-                        'op.student'].create(vals).id
-                    record.partner_id = record.student_id.partner_id.id \
-                        if record else False
-
+        accepted, rejected = self._reserve_register_capacity()
+        if rejected:
+            msg = 'Max Admission In Admission Register :- (%s)' % (
+                rejected[0].register_id.max_count)
+            raise ValidationError(_(msg))
+        accepted._enroll_admissions()
+
+    def action_batch_enroll(self):
+        """Enroll the admissions that can be enrolled and report the others.
+
+        Returns one outcome per admission: a dictionary with the admission,
+        a status (``enrolled``, ``skipped`` or ``failed``) and a message.
+        """
+        outcomes = []
+        eligible = self.filtered(lambda r: r.state == 'admission')
+        for record in self - eligible:
+            outcomes.append({
+                'admission_id': record.id, 'status': 'skipped',
+                'message': _('Admission is not in the Admission Confirm stage.'),
+            })
+        accepted, rejected = eligible._reserve_register_capacity()
+        for record in rejected:
+            outcomes.append({
+                'admission_id': record.id, 'status': 'skipped',
+                'message': _('Admission register %s is full (%s).') % (
+                    record.register_id.name, record.register_id.max_count),
+            })
+        try:
+            with self.env.cr.savepoint():
+                accepted._enroll_admissions()
+            enrolled = accepted
+        except Exception as e:
+            _logger.info('Batch enrollment failed (%s), '
+                         'enrolling admissions one by one', e)
+            enrolled = self.browse()
+            for record in accepted:
+                try:
+                    with self.env.cr.savepoint():
+                        record._enroll_admissions()
+                    enrolled |= record
+                except Exception as error:
+                    outcomes.append({
+                        'admission_id': record.id, 'status': 'failed',
+                        'message': str(error),
+                    })
+        for record in enrolled:
+            outcomes.append({
+                'admission_id': record.id, 'status': 'enrolled',
+                'message': _('Enrolled as %s') % record.student_id.name,
+            })
+        return outcomes
+
+    def _reserve_register_capacity(self):
+        """Reserve seats of the admission registers for the admissions.
+
+        The register rows are updated first: a concurrent confirmation on
+        the same register waits for this transaction and then fails with a
+        serialization error (and is retried), so ``max_count`` can not be
+        overshot. The admissions already enrolled are counted with one
+        grouped query. Returns the admissions that fit and the others.
+        """
+        registers = self.register_id.filtered('max_count')
+        if not registers:
+            return self, self.browse()
+        self.env.cr.execute("""
+            UPDATE op_admission_register
+            SET write_date = (now() at time zone 'UTC')
+            WHERE id IN %s
+        """, (tuple(registers.ids),))
+        self.flush_model(['register_id', 'state'])
+        done_counts = dict(self._read_group(
+            [('register_id', 'in', registers.ids), ('state', '=', 'done')],
+            groupby=['register_id'], aggregates=['__count']))
+        remaining = {register: register.max_count - done_counts.get(register, 0)
+                     for register in registers}
+
+        accepted = rejected = self.browse()
+        for record in self.sorted('id'):
+            register = record.register_id
+            if register not in remaining:
+                accepted |= record
+            elif remaining[register] > 0:
+                remaining[register] -= 1
+                accepted |= record
             else:
-                student_id = record.student_id.id
-                record.student_id.write({
-                    'course_detail_ids': [[0, False, {
-                        'course_id':
-                            record.course_id and record.course_id.id or False,
-                        'batch_id':
-                            record.batch_id and record.batch_id.id or False,
-                        'fees_term_id': record.fees_term_id.id,
-                        'fees_start_date': record.fees_start_date,
-                        'product_id': record.register_id.product_id.id,
-                    }]],
-                })
-            if record.fees_term_id.fees_terms in ['fixed_days', 'fixed_date']:
-                val = []
-                product_id = record.register_id.product_id.id
-                for line in record.fees_term_id.line_ids:
-                    no_days = line.due_days
-                    per_amount = line.value
-                    amount = (per_amount * record.fees) / 100
-                    dict_val = {
-                        'fees_line_id': line.id,
-                        'amount': amount,
-                        'fees_factor': per_amount,
-                        'product_id': product_id,
-                        'discount': record.discount or record.fees_term_id.discount,
-                        'state': 'draft',
-                        'course_id': record.course_id and record.course_id.id or False,
-                        'batch_id': record.batch_id and record.batch_id.id or False,
-                    }
-                    if line.due_date:
-                        date = line.due_date
-                        dict_val.update({
-                            'date': date
-                        })
-                    elif self.fees_start_date:
-                        date = self.fees_start_date + relativedelta(
-                            days=no_days)
-                        dict_val.update({
-                            'date': date,
-                        })
-                    else:
-                        date_now = (datetime.today() + relativedelta(
-                            days=no_days)).date()
-                        dict_val.update({
-                            'date': date_now,
-                        })
-                    val.append([0, False, dict_val])
-                record.student_id.write({
-                    'fees_detail_ids': val
-                })
+                rejected |= record
+        return accepted, rejected
+
+    def _enroll_admissions(self):
+        """Create students, fee schedules and subject registrations in bulk."""
+        if not self:
+            return
+        new_admissions = self.filtered(lambda r: not r.student_id)
+        student_users = {}
+        if self.env['ir.config_parameter'].get_param(
+                'openeducat_admission.enable_create_student_user'):
+            student_users = new_admissions._create_student_users()
+
+        # Students of new applicants, with one batched create
+        students = self.env['op.student'].create([
+            record.get_student_vals(student_users)
+            for record in new_admissions])
+        for record, student in zip(new_admissions, students):
             record.write({
-                'nbr': 1,
-                'state': 'done',
-                'admission_date': fields.Date.today(),
-                'student_id': student_id,
-                'is_student': True,
-            })
-            reg_id = self.env['op.subject.registration'].create({
-                'student_id': student_id,
-                'batch_id': record.batch_id.id,
-                'course_id': record.course_id.id,
-                'min_unit_load': record.course_id.min_unit_load or 0.0,
-                'max_unit_load': record.course_id.max_unit_load or 0.0,
-                'state': 'draft',
+                'student_id': student.id,
+                'partner_id': student.partner_id.id,
             })
-            reg_id.get_subjects()
+
+        # Course details of applicants who already are students
+        existing_admissions = self - new_admissions
+        self.env['op.student.course'].create([{
+            'student_id': record.student_id.id,
+            'course_id': record.course_id and record.course_id.id or False,
+            'batch_id': record.batch_id and record.batch_id.id or False,
+            'fees_term_id': record.fees_term_id.id,
+            'fees_start_date': record.fees_start_date,
+            'product_id': record.register_id.product_id.id,
+        } for record in existing_admissions])
+
+        self.env['op.student.fees.details'].create(
+            self._get_fees_details_vals())
+
+        self.write({
+            'nbr': 1,
+            'state': 'done',
+            'admission_date': fields.Date.today(),
+            'is_student': True,
+        })
+
+        compulsory_subjects = {
+            course: course.subject_ids.filtered(
+                lambda s: s.subject_type == 'compulsory')
+            for course in self.course_id
+        }
+        self.env['op.subject.registration'].create([{
+            'student_id': record.student_id.id,
+            'batch_id': record.batch_id.id,
+            'course_id': record.course_id.id,
+            'min_unit_load': record.course_id.min_unit_load or 0.0,
+            'max_unit_load': record.course_id.max_unit_load or 0.0,
+            'state': 'draft',
+            'compulsory_subject_ids': [(6, 0, compulsory_subjects.get(
+                record.course_id, self.env['op.subject']).ids)],
+        } for record in self])
+
+    def _get_fees_details_vals(self):
+        """Return the fee schedule lines of the admissions' students."""
+        vals_list = []
+        for record in self:
+            if record.fees_term_id.fees_terms not in ['fixed_days', 'fixed_date']:
+                continue
+            product_id = record.register_id.product_id.id
+            for line in record.fees_term_id.line_ids:
+                no_days = line.due_days
+                per_amount = line.value
+                amount = (per_amount * record.fees) / 100
+                if line.due_date:
+                    date = line.due_date
+                elif record.fees_start_date:
+                    date = record.fees_start_date + relativedelta(days=no_days)
+                else:
+                    date = (datetime.today() + relativedelta(
+                        days=no_days)).date()
+                vals_list.append({
+                    'student_id': record.student_id.id,
+                    'fees_line_id': line.id,
+                    'amount': amount,
+                    'fees_factor': per_amount,
+                    'product_id': product_id,
+                    'discount': record.discount or record.fees_term_id.discount,
+                    'state': 'draft',
+                    'course_id': record.course_id and record.course_id.id or False,
+                    'batch_id': record.batch_id and record.batch_id.id or False,
+                    'date': date,
+                })
+        return vals_list
 
     def confirm_rejected(self):
         self.state = 'reject'
@@ -20,6 +20,8 @@
 
 import logging
 
+from odoo.exceptions import ValidationError
+
 from .test_admission_common import TestAdmissionCommon
 
 
@@ -96,6 +98,51 @@ class TestAdmission(TestAdmissionCommon):
             admission.open_student()
 
 
+class TestAdmissionBatchEnroll(TestAdmissionCommon):
+
+    def setUp(self):
+        super(TestAdmissionBatchEnroll, self).setUp()
+        self.register = self.env.ref(
+            'openeducat_admission.op_admission_register_3')
+        done_count = self.op_admission.search_count([
+            ('register_id', '=', self.register.id), ('state', '=', 'done')])
+        self.register.write({'min_count': 1, 'max_count': done_count + 2})
+        self.admissions = self.op_admission.create([{
+            'name': 'Batch %s' % i,
+            'first_name': 'Batch',
+            'last_name': 'Applicant %s' % i,
+            'birth_date': '2002-12-20',
+            'course_id': self.env.ref('openeducat_core.op_course_5').id,
+            'batch_id': self.env.ref('openeducat_core.op_batch_4').id,
+            'email': 'batch.applicant%s@example.com' % i,
+            'state': 'draft' if i == 3 else 'admission',
+            'gender': 'm',
+            'register_id': self.register.id,
+        } for i in range(4)])
+
+    def test_case_1_batch_enroll(self):
+        outcomes = self.admissions.action_batch_enroll()
+        statuses = {outcome['admission_id']: outcome['status']
+                    for outcome in outcomes}
+
+        self.assertEqual(len(outcomes), 4)
+        self.assertEqual(statuses[self.admissions[0].id], 'enrolled')
+        self.assertEqual(statuses[self.admissions[1].id], 'enrolled')
+        self.assertEqual(statuses[self.admissions[2].id], 'skipped')
+        self.assertEqual(statuses[self.admissions[3].id], 'skipped')
+        enrolled = self.admissions[:2]
+        self.assertEqual(enrolled.mapped('state'), ['done', 'done'])
+        self.assertTrue(all(enrolled.mapped('student_id')))
+        registrations = self.env['op.subject.registration'].search([
+            ('student_id', 'in', enrolled.student_id.ids)])
+        self.assertEqual(len(registrations), 2)
+
+    def test_case_2_register_full(self):
+        self.admissions[:2].enroll_student()
+        with self.assertRaises(ValidationError):
+            self.admissions[2].enroll_student()
+
+
 class TestAdmissionregister(TestAdmissionCommon):
 
     def setUp(self):
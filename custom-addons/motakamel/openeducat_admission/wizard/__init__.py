@@ -19,3 +19,4 @@
 ###############################################################################
 
 from . import admission_analysis_wizard
+from . import admission_batch_enroll_wizard
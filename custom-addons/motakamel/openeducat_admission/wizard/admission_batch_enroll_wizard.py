@@ -0,0 +1,84 @@
+###############################################################################
+#
+#    Edafa Inc
+#    Copyright (C) 2009-TODAY Edafa Inc(<https://www.edafa.org>).
+#
+#    This program is free software: you can redistribute it and/or modify
+#    it under the terms of the GNU Lesser General Public License as
+#    published by the Free Software Foundation, either version 3 of the
+#    License, or (at your option) any later version.
+#
+#    This program is distributed in the hope that it will be useful,
+#    but WITHOUT ANY WARRANTY; without even the implied warranty of
+#    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#    GNU Lesser General Public License for more details.
+#
+#    You should have received a copy of the GNU Lesser General Public License
+#    along with this program.  If not, see <http://www.gnu.org/licenses/>.
+#
+###############################################################################
+
+from odoo import _, api, fields, models
+
+
+class AdmissionBatchEnroll(models.TransientModel):
+    """ Batch Admission Confirmation Wizard """
+    _name = "admission.batch.enroll"
+    _description = "Batch Admission Confirmation Wizard"
+
+    admission_ids = fields.Many2many(
+        'op.admission', string='Admissions', required=True,
+        default=lambda self: self.env.context.get('active_ids', []))
+    line_ids = fields.One2many(
+        'admission.batch.enroll.line', 'wizard_id', 'Outcomes', readonly=True)
+    state = fields.Selection([
+        ('draft', 'Draft'),
+        ('done', 'Done')
+    ], 'Status', default='draft')
+    enrolled_count = fields.Integer(
+        'Enrolled', compute='_compute_outcome_counts')
+    skipped_count = fields.Integer(
+        'Skipped', compute='_compute_outcome_counts')
+    failed_count = fields.Integer(
+        'Failed', compute='_compute_outcome_counts')
+
+    @api.depends('line_ids.status')
+    def _compute_outcome_counts(self):
+        for wizard in self:
+            statuses = wizard.line_ids.mapped('status')
+            wizard.enrolled_count = statuses.count('enrolled')
+            wizard.skipped_count = statuses.count('skipped')
+            wizard.failed_count = statuses.count('failed')
+
+    def action_enroll(self):
+        self.ensure_one()
+        outcomes = self.admission_ids.action_batch_enroll()
+        self.write({
+            'state': 'done',
+            'line_ids': [(0, 0, outcome) for outcome in outcomes],
+        })
+        return {
+            'type': 'ir.actions.act_window',
+            'name': _('Batch Enrollment'),
+            'res_model': self._name,
+            'res_id': self.id,
+            'view_mode': 'form',
+            'target': 'new',
+        }
+
+
+class AdmissionBatchEnrollLine(models.TransientModel):
+    """ Outcome of one admission in a batch confirmation """
+    _name = "admission.batch.enroll.line"
+    _description = "Batch Admission Confirmation Outcome"
+    _order = "status, id"
+
+    wizard_id = fields.Many2one(
+        'admission.batch.enroll', 'Wizard', required=True, ondelete='cascade')
+    admission_id = fields.Many2one('op.admission', 'Admission', required=True)
+    status = fields.Selection([
+        ('enrolled', 'Enrolled'),
+        ('skipped', 'Skipped'),
+        ('failed', 'Failed')
+    ], 'Outcome', required=True)
+    message = fields.Char('Details')
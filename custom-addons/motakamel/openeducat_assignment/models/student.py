@@ -34,6 +34,6 @@ class OpStudent(models.Model):
         return action
 
     def _compute_count_assignment(self):
+        counts = self._count_related('op.assignment', 'allocation_ids')
         for record in self:
-            record.assignment_count = self.env['op.assignment'].search_count(
-                [('allocation_ids', 'in', self.ids)])
+            record.assignment_count = counts.get(record.id, 0)
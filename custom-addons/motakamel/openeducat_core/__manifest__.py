@@ -57,6 +57,9 @@
         'views/op_academic_term_view.xml',
         'views/program_view.xml',
         'views/program_level.xml',
+        'views/user_provisioning_view.xml',
+        'views/student_card_job_view.xml',
+        'views/subject_registration_approval_view.xml',
         'data/ir_cron_data.xml',
         'data/res_partner_data.xml',
         'data/sequence_student_bonafide.xml',
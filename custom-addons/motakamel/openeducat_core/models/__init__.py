@@ -18,6 +18,7 @@
 #
 ##############################################################################
 
+from . import base
 from . import batch
 from . import category
 from . import course
@@ -34,3 +35,7 @@ from . import student_portal
 from . import op_academic_term
 from . import op_academic_year
 from . import program
+from . import background_job
+from . import user_provisioning
+from . import student_card_job
+from . import subject_registration_approval
@@ -0,0 +1,172 @@
+###############################################################################
+#
+#    OpenEduCat Inc
+#    Copyright (C) 2009-TODAY OpenEduCat Inc(<https://www.openeducat.org>).
+#
+#    This program is free software: you can redistribute it and/or modify
+#    it under the terms of the GNU Lesser General Public License as
+#    published by the Free Software Foundation, either version 3 of the
+#    License, or (at your option) any later version.
+#
+#    This program is distributed in the hope that it will be useful,
+#    but WITHOUT ANY WARRANTY; without even the implied warranty of
+#    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#    GNU Lesser General Public License for more details.
+#
+#    You should have received a copy of the GNU Lesser General Public License
+#    along with this program.  If not, see <http://www.gnu.org/licenses/>.
+#
+###############################################################################
+
+
+import logging
+
+from odoo import _, api, fields, models
+
+_logger = logging.getLogger(__name__)
+
+
+class OpBackgroundJobMixin(models.AbstractModel):
+    """ Operation on many records, processed by chunks.
+
+    Small jobs are processed when they are started, larger ones are queued
+    for a cron which commits after each chunk, so the progress is visible
+    while the job runs and a failing chunk does not lose the others.
+
+    Inheriting models set the cron processing their jobs and implement
+    ``_get_items`` and ``_process_chunk``.
+    """
+    _name = "op.background.job.mixin"
+    _description = "Background Job"
+    _order = "id desc"
+
+    # Above this number of items, the job is processed in the background
+    BACKGROUND_THRESHOLD = 200
+    # Number of items processed per chunk
+    CHUNK_SIZE = 200
+    # XML id of the cron processing the queued jobs
+    _job_cron = None
+
+    state = fields.Selection([
+        ('draft', 'Draft'),
+        ('queued', 'Queued'),
+        ('running', 'Running'),
+        ('done', 'Done')
+    ], 'Status', default='draft', required=True, readonly=True)
+    total_count = fields.Integer('Total', readonly=True)
+    processed_count = fields.Integer('Processed', readonly=True)
+    progress_percentage = fields.Float(
+        'Progress (%)', compute='_compute_progress_percentage')
+    error_log = fields.Text('Errors', readonly=True)
+
+    @api.depends('total_count', 'processed_count')
+    def _compute_progress_percentage(self):
+        for job in self:
+            job.progress_percentage = (
+                job.processed_count * 100.0 / job.total_count
+                if job.total_count else 0.0)
+
+    def _get_items(self):
+        """ Return the items of the job, a recordset or a list, in
+        processing order. """
+        raise NotImplementedError()
+
+    def _process_chunk(self, chunk):
+        """ Process ``chunk``, a slice of the items, and return the values
+        to write on the job, such as its counters. """
+        raise NotImplementedError()
+
+    def _prepare_start_vals(self):
+        """ Return the values resetting the job when it is started. """
+        return {
+            'state': 'queued',
+            'processed_count': 0,
+            'error_log': False,
+        }
+
+    def _get_chunk_failure_vals(self, chunk):
+        """ Return the values to write on the job when ``chunk`` failed. """
+        return {}
+
+    def _finalize(self):
+        """ Called once all the items are processed. """
+
+    def _append_error_log(self, messages):
+        self.ensure_one()
+        return '\n'.join(filter(None, [self.error_log] + list(messages)))
+
+    def _queue(self):
+        """ Reset the job and count its items, to process them. """
+        self.ensure_one()
+        self.write(self._prepare_start_vals())
+        self.total_count = len(self._get_items())
+
+    def action_start(self):
+        """ Process the job now, or in the background when it is large. """
+        self.ensure_one()
+        self._queue()
+        if self.total_count > self.BACKGROUND_THRESHOLD:
+            self.env.ref(self._job_cron).sudo()._trigger()
+            return True
+        self._run()
+        return True
+
+    def _run(self, commit=False):
+        self.ensure_one()
+        self.state = 'running'
+        while self.state == 'running':
+            self._process_next_chunk()
+            if commit:
+                # Persist progress so it is visible while the job runs
+                self.env.cr.commit()
+
+    @api.model
+    def _cron_process_jobs(self):
+        """ Process the queued jobs, committing after each chunk. """
+        jobs = self.search([('state', 'in', ['queued', 'running'])], order='id')
+        for job in jobs:
+            try:
+                job._run(commit=True)
+            except Exception as e:
+                # Drop the failed chunk and end the job, so that it does not
+                # fail again on each run and block the jobs queued after it
+                self.env.cr.rollback()
+                message = _('Error processing the job: %s', e)
+                _logger.exception('%s %s: %s', job._name, job.id, message)
+                job.write({
+                    'state': 'done',
+                    'error_log': job._append_error_log([message]),
+                })
+                self.env.cr.commit()
+        return len(jobs)
+
+    def _process_next_chunk(self):
+        """ Process the next chunk of items in a savepoint, a failure is
+        logged on the job and the next chunks are processed. """
+        self.ensure_one()
+        start = self.processed_count
+        chunk = self._get_items()[start:start + self.CHUNK_SIZE]
+
+        vals = {'processed_count': start + len(chunk)}
+        try:
+            with self.env.cr.savepoint():
+                if chunk:
+                    vals.update(self._process_chunk(chunk) or {})
+        except Exception as e:
+            message = _('Error processing items %(first)s to %(last)s: '
+                        '%(error)s', first=start + 1,
+                        last=vals['processed_count'], error=e)
+            _logger.error('%s %s: %s', self._name, self.id, message)
+            vals.update(self._get_chunk_failure_vals(chunk))
+            vals['error_log'] = self._append_error_log([message])
+        if not chunk or vals['processed_count'] >= self.total_count:
+            vals['state'] = 'done'
+        self.write(vals)
+        if vals.get('state') == 'done':
+            try:
+                with self.env.cr.savepoint():
+                    self._finalize()
+            except Exception as e:
+                message = _('Error finalizing the job: %s', e)
+                _logger.error('%s %s: %s', self._name, self.id, message)
+                self.error_log = self._append_error_log([message])
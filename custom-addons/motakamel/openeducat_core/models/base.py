@@ -0,0 +1,46 @@
+###############################################################################
+#
+#    OpenEduCat Inc
+#    Copyright (C) 2009-TODAY OpenEduCat Inc(<https://www.openeducat.org>).
+#
+#    This program is free software: you can redistribute it and/or modify
+#    it under the terms of the GNU Lesser General Public License as
+#    published by the Free Software Foundation, either version 3 of the
+#    License, or (at your option) any later version.
+#
+#    This program is distributed in the hope that it will be useful,
+#    but WITHOUT ANY WARRANTY; without even the implied warranty of
+#    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#    GNU Lesser General Public License for more details.
+#
+#    You should have received a copy of the GNU Lesser General Public License
+#    along with this program.  If not, see <http://www.gnu.org/licenses/>.
+#
+###############################################################################
+
+from odoo import models
+from odoo.osv import expression
+
+
+class Base(models.AbstractModel):
+    _inherit = "base"
+
+    def _count_related(self, model_name, field_name, domain=None):
+        """ Count the ``model_name`` records linked to each record of
+        ``self`` through their ``field_name`` field.
+
+        Smart-button counters use it to count with one grouped query for
+        the whole recordset instead of one query per record. Many2many
+        fields are supported: a linked record is counted for each of the
+        records it is linked to.
+
+        :return: dictionary {record id: count}, records without linked
+            records are missing
+        """
+        ids = [record_id for record_id in self.ids if record_id]
+        if not ids:
+            return {}
+        groups = self.env[model_name]._read_group(
+            expression.AND([[(field_name, 'in', ids)], domain or []]),
+            [field_name], ['__count'])
+        return {record.id: count for record, count in groups}
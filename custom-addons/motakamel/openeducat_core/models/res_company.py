@@ -18,7 +18,7 @@
 #
 ###############################################################################
 
-from odoo import fields, models
+from odoo import api, fields, models
 
 
 class ResCompany(models.Model):
@@ -48,6 +48,43 @@ class ResUsers(models.Model):
                                       string="Number of Departments",
                                       default=_department_count)
 
+    @api.model
+    def _get_taken_logins(self, logins):
+        """Return the lower-cased logins among ``logins`` already in use.
+
+        Archived users are included, as their logins cannot be reused.
+        """
+        logins = list({login.lower() for login in logins if login})
+        if not logins:
+            return set()
+        self.flush_model(['login'])
+        self.env.cr.execute(
+            "SELECT lower(login) FROM res_users WHERE lower(login) IN %s",
+            (tuple(logins),))
+        return {row[0] for row in self.env.cr.fetchall()}
+
+    @api.model
+    def _bulk_create_users(self, vals_list):
+        """Create users with one batched create, skipping unusable logins.
+
+        Logins are checked against existing users with a single query and
+        deduplicated within ``vals_list``. Returns a dictionary mapping the
+        lower-cased login to the created user, and the list of skipped
+        logins (empty, already taken or duplicated).
+        """
+        taken = self._get_taken_logins([vals.get('login') for vals in vals_list])
+        to_create = []
+        skipped = []
+        for vals in vals_list:
+            login = (vals.get('login') or '').strip()
+            if not login or login.lower() in taken:
+                skipped.append(login)
+                continue
+            taken.add(login.lower())
+            to_create.append(dict(vals, login=login))
+        users = self.create(to_create) if to_create else self.browse()
+        return {user.login.lower(): user for user in users}, skipped
+
     def create_user(self, records, user_group=None):
         for rec in records:
             if not rec.user_id:
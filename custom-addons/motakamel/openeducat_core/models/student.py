@@ -38,7 +38,7 @@ class OpStudentCourse(models.Model):
     academic_term_id = fields.Many2one('op.academic.term', 'Terms')
     state = fields.Selection([('running', 'Running'),
                               ('finished', 'Finished')],
-                             string="Status", default="running")
+                             string="Status", default="running", tracking=True)
 
     _sql_constraints = [
         ('unique_name_roll_number_id',
@@ -135,16 +135,25 @@ class OpStudent(models.Model):
         }]
 
     def create_student_user(self):
-        user_group = self.env.ref("base.group_portal") or False
-        users_res = self.env['res.users']
-        for record in self:
-            if not record.user_id:
-                user_id = users_res.create({
-                    'name': record.name,
-                    'partner_id': record.partner_id.id,
-                    'login': record.email,
-                    'groups_id': user_group,
-                    'is_student': True,
-                    'tz': self._context.get('tz'),
-                })
-                record.user_id = user_id
+        """Create the portal users of the students with one batched create.
+
+        Returns a dictionary with the students that received a user and the
+        students skipped because they have no email or their login is taken.
+        """
+        user_group = self.env.ref("base.group_portal")
+        students = self.filtered(lambda s: not s.user_id)
+        users_by_login, _skipped = self.env['res.users']._bulk_create_users([{
+            'name': record.name,
+            'partner_id': record.partner_id.id,
+            'login': record.email,
+            'groups_id': [(6, 0, user_group.ids)],
+            'is_student': True,
+            'tz': self._context.get('tz'),
+        } for record in students])
+        created = self.browse()
+        for record in students:
+            user = users_by_login.get((record.email or '').strip().lower())
+            if user and user.partner_id == record.partner_id:
+                record.user_id = user
+                created |= record
+        return {'created': created, 'skipped': students - created}
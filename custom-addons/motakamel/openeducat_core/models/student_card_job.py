@@ -0,0 +1,123 @@
+###############################################################################
+#
+#    OpenEduCat Inc
+#    Copyright (C) 2009-TODAY OpenEduCat Inc(<https://www.openeducat.org>).
+#
+#    This program is free software: you can redistribute it and/or modify
+#    it under the terms of the GNU Lesser General Public License as
+#    published by the Free Software Foundation, either version 3 of the
+#    License, or (at your option) any later version.
+#
+#    This program is distributed in the hope that it will be useful,
+#    but WITHOUT ANY WARRANTY; without even the implied warranty of
+#    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#    GNU Lesser General Public License for more details.
+#
+#    You should have received a copy of the GNU Lesser General Public License
+#    along with this program.  If not, see <http://www.gnu.org/licenses/>.
+#
+###############################################################################
+
+from odoo import _, api, fields, models
+from odoo.tools.pdf import merge_pdf
+
+REPORTS = {
+    'idcard': 'openeducat_core.action_report_student_idcard',
+    'bonafide': 'openeducat_core.action_report_student_bonafide',
+}
+
+
+class OpStudentCardJob(models.Model):
+    _name = "op.student.card.job"
+    _inherit = ["op.background.job.mixin"]
+    _description = "Bulk Student Card Printing"
+    _job_cron = 'openeducat_core.ir_cron_process_student_card_job'
+
+    # Number of students rendered per wkhtmltopdf run
+    CHUNK_SIZE = 200
+
+    name = fields.Char(
+        'Name', required=True, readonly=True,
+        default=lambda self: _('Printing %s') % fields.Datetime.now())
+    report = fields.Selection([
+        ('idcard', 'Student ID Cards'),
+        ('bonafide', 'Bonafide Certificates'),
+    ], 'Document', default='idcard', required=True)
+    student_ids = fields.Many2many(
+        'op.student', 'op_student_card_job_student_rel',
+        'job_id', 'student_id', string='Students')
+    certificate_purpose = fields.Char('Certificate Purpose')
+    part_attachment_ids = fields.Many2many(
+        'ir.attachment', 'op_student_card_job_part_rel',
+        'job_id', 'attachment_id', string='Rendered Parts', readonly=True)
+    attachment_id = fields.Many2one(
+        'ir.attachment', 'Document', readonly=True)
+    datas = fields.Binary(related='attachment_id.datas', string='File')
+    file_name = fields.Char(related='attachment_id.name', string='File Name')
+
+    @api.model
+    def _action_print(self, students, report, **vals):
+        """Create and start a job printing ``report`` for ``students``."""
+        job = self.create(dict(vals, report=report, student_ids=[(6, 0, students.ids)]))
+        job.action_start()
+        return {
+            'type': 'ir.actions.act_window',
+            'res_model': self._name,
+            'res_id': job.id,
+            'view_mode': 'form',
+            'target': 'current',
+        }
+
+    def _queue(self):
+        # Documents of a previous run are rendered again
+        self.part_attachment_ids.unlink()
+        self.attachment_id.unlink()
+        return super(OpStudentCardJob, self)._queue()
+
+    def _get_items(self):
+        return self.student_ids.sorted('id')
+
+    def _process_chunk(self, students):
+        """Render the chunk of students as one PDF part."""
+        return {'part_attachment_ids': [(4, self._render_chunk(students).id)]}
+
+    def _finalize(self):
+        self._merge_parts()
+
+    def _get_report_data(self):
+        self.ensure_one()
+        if self.report == 'bonafide':
+            return {'purpose_display': self.certificate_purpose}
+        return {}
+
+    def _render_chunk(self, students):
+        """Render the documents of ``students`` with one wkhtmltopdf run."""
+        self.ensure_one()
+        content, dummy = self.env['ir.actions.report']._render_qweb_pdf(
+            REPORTS[self.report], students.ids, data=self._get_report_data())
+        return self.env['ir.attachment'].create({
+            'name': '%s-%s.pdf' % (self.name, self.processed_count + 1),
+            'type': 'binary',
+            'raw': content,
+            'res_model': self._name,
+            'res_id': self.id,
+            'mimetype': 'application/pdf',
+        })
+
+    def _merge_parts(self):
+        """Merge the rendered parts, in student order, into one document."""
+        self.ensure_one()
+        parts = self.part_attachment_ids.sorted('id')
+        if not parts:
+            return
+        content = parts.raw if len(parts) == 1 else merge_pdf(parts.mapped('raw'))
+        self.attachment_id = self.env['ir.attachment'].create({
+            'name': '%s - %s.pdf' % (
+                dict(self._fields['report'].selection)[self.report], self.name),
+            'type': 'binary',
+            'raw': content,
+            'res_model': self._name,
+            'res_id': self.id,
+            'mimetype': 'application/pdf',
+        })
+        parts.unlink()
@@ -60,25 +60,49 @@ class OpSubjectRegistration(models.Model):
     def action_reject(self):
         self.state = 'rejected'
 
-    def action_approve(self):
+    def _approve(self):
+        """ Approve the registrations and link their subjects to the course
+        of their students.
+
+        The student courses are read with one query and the registrations
+        with the same subjects are written together.
+
+        :return: the registrations whose course was not found on the student
+        """
+        student_courses = self.env['op.student.course'].search([
+            ('student_id', 'in', self.student_id.ids),
+            ('course_id', 'in', self.course_id.ids),
+        ], order='id')
+        course_by_student = {}
+        for student_course in student_courses:
+            course_by_student.setdefault(
+                (student_course.student_id, student_course.course_id),
+                student_course)
+        not_found = self.browse()
+        by_subjects = {}
         for record in self:
-            subject_ids = []
-            for sub in record.compulsory_subject_ids:
-                subject_ids.append(sub.id)
-            for sub in record.elective_subject_ids:
-                subject_ids.append(sub.id)
-            course_id = self.env['op.student.course'].search([
-                ('student_id', '=', record.student_id.id),
-                ('course_id', '=', record.course_id.id)
-            ], limit=1)
-            if course_id:
-                course_id.write({
-                    'subject_ids': [[6, 0, list(set(subject_ids))]]
-                })
-                record.state = 'approved'
-            else:
-                raise ValidationError(
-                    _("Course not found on student's admission!"))
+            student_course = course_by_student.get(
+                (record.student_id, record.course_id))
+            if not student_course:
+                not_found |= record
+                continue
+            subjects = record.compulsory_subject_ids | \
+                record.elective_subject_ids
+            courses, registrations = by_subjects.get(
+                subjects, (student_courses.browse(), self.browse()))
+            by_subjects[subjects] = (
+                courses | student_course, registrations | record)
+        for subjects, (courses, registrations) in by_subjects.items():
+            courses.write({'subject_ids': [(6, 0, subjects.ids)]})
+        (self - not_found).write({'state': 'approved'})
+        return not_found
+
+    def action_approve(self):
+        not_found = self._approve()
+        if not_found:
+            raise ValidationError(
+                _("Course not found on student's admission!") + '\n' +
+                ', '.join(not_found.mapped('name')))
 
     def action_submitted(self):
         self.state = 'submitted'
@@ -92,10 +116,9 @@ class OpSubjectRegistration(models.Model):
         return super(OpSubjectRegistration, self).create(vals_list)
 
     def get_subjects(self):
-        for record in self:
-            subject_ids = []
-            if record.course_id and record.course_id.subject_ids:
-                for subject in record.course_id.subject_ids:
-                    if subject.subject_type == 'compulsory':
-                        subject_ids.append(subject.id)
-            record.compulsory_subject_ids = [(6, 0, subject_ids)]
+        """ Set the compulsory subjects of the registrations, resolved once
+        per course. """
+        for course, registrations in self.grouped('course_id').items():
+            registrations.write({'compulsory_subject_ids': [(6, 0, (
+                course.subject_ids.filtered(
+                    lambda s: s.subject_type == 'compulsory').ids))]})
@@ -0,0 +1,91 @@
+###############################################################################
+#
+#    OpenEduCat Inc
+#    Copyright (C) 2009-TODAY OpenEduCat Inc(<https://www.openeducat.org>).
+#
+#    This program is free software: you can redistribute it and/or modify
+#    it under the terms of the GNU Lesser General Public License as
+#    published by the Free Software Foundation, either version 3 of the
+#    License, or (at your option) any later version.
+#
+#    This program is distributed in the hope that it will be useful,
+#    but WITHOUT ANY WARRANTY; without even the implied warranty of
+#    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#    GNU Lesser General Public License for more details.
+#
+#    You should have received a copy of the GNU Lesser General Public License
+#    along with this program.  If not, see <http://www.gnu.org/licenses/>.
+#
+###############################################################################
+
+
+import logging
+
+from odoo import _, api, fields, models
+
+_logger = logging.getLogger(__name__)
+
+
+class OpSubjectRegistrationApproval(models.Model):
+    _name = "op.subject.registration.approval"
+    _inherit = ["op.background.job.mixin"]
+    _description = "Bulk Subject Registration Approval"
+    _job_cron = 'openeducat_core.ir_cron_process_subject_registration_approval'
+
+    # Number of registrations approved per batch
+    CHUNK_SIZE = 500
+
+    name = fields.Char(
+        'Name', required=True, readonly=True,
+        default=lambda self: _('Approval %s') % fields.Datetime.now())
+    registration_ids = fields.Many2many(
+        'op.subject.registration', 'op_subject_registration_approval_rel',
+        'approval_id', 'registration_id', string='Registrations',
+        domain=[('state', '=', 'submitted')])
+    approved_count = fields.Integer('Approved', readonly=True)
+    failed_count = fields.Integer('Failed', readonly=True)
+
+    @api.model
+    def _action_approve(self, registrations):
+        """Create and start the approval of the submitted ``registrations``."""
+        approval = self.create({'registration_ids': [(6, 0, registrations.filtered(
+            lambda r: r.state == 'submitted').ids)]})
+        approval.action_start()
+        return {
+            'type': 'ir.actions.act_window',
+            'res_model': self._name,
+            'res_id': approval.id,
+            'view_mode': 'form',
+            'target': 'current',
+        }
+
+    def _prepare_start_vals(self):
+        vals = super(OpSubjectRegistrationApproval, self)._prepare_start_vals()
+        vals.update({
+            'approved_count': 0,
+            'failed_count': 0,
+        })
+        return vals
+
+    def _get_items(self):
+        return self.registration_ids.sorted('id')
+
+    def _process_chunk(self, chunk):
+        """Approve the chunk of registrations."""
+        # Registrations approved or rejected meanwhile are left untouched
+        registrations = chunk.filtered(lambda r: r.state == 'submitted')
+        not_found = registrations._approve()
+        vals = {
+            'approved_count': self.approved_count + len(registrations - not_found),
+            'failed_count': self.failed_count + len(not_found),
+        }
+        if not_found:
+            messages = [_("%s: Course not found on student's admission!") % (
+                registration.name) for registration in not_found]
+            _logger.error('\n'.join(messages))
+            vals['error_log'] = self._append_error_log(messages)
+        return vals
+
+    def _get_chunk_failure_vals(self, chunk):
+        return {'failed_count': self.failed_count + len(
+            chunk.filtered(lambda r: r.state == 'submitted'))}
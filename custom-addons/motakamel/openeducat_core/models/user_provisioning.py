@@ -0,0 +1,95 @@
+###############################################################################
+#
+#    OpenEduCat Inc
+#    Copyright (C) 2009-TODAY OpenEduCat Inc(<https://www.openeducat.org>).
+#
+#    This program is free software: you can redistribute it and/or modify
+#    it under the terms of the GNU Lesser General Public License as
+#    published by the Free Software Foundation, either version 3 of the
+#    License, or (at your option) any later version.
+#
+#    This program is distributed in the hope that it will be useful,
+#    but WITHOUT ANY WARRANTY; without even the implied warranty of
+#    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#    GNU Lesser General Public License for more details.
+#
+#    You should have received a copy of the GNU Lesser General Public License
+#    along with this program.  If not, see <http://www.gnu.org/licenses/>.
+#
+###############################################################################
+
+from odoo import _, fields, models
+
+
+class OpUserProvisioning(models.Model):
+    _name = "op.user.provisioning"
+    _inherit = ["op.background.job.mixin"]
+    _description = "Portal User Provisioning"
+    _job_cron = 'openeducat_core.ir_cron_process_user_provisioning'
+
+    name = fields.Char(
+        'Name', required=True, readonly=True,
+        default=lambda self: _('Provisioning %s') % fields.Datetime.now())
+    student_ids = fields.Many2many(
+        'op.student', 'op_user_provisioning_student_rel',
+        'provisioning_id', 'student_id', string='Students')
+    created_count = fields.Integer('Users Created', readonly=True)
+    skipped_count = fields.Integer('Skipped', readonly=True)
+    summary = fields.Text('Summary', readonly=True)
+    skipped_log = fields.Text('Skipped Records', readonly=True)
+
+    def _prepare_start_vals(self):
+        vals = super(OpUserProvisioning, self)._prepare_start_vals()
+        vals.update({
+            'created_count': 0,
+            'skipped_count': 0,
+            'summary': False,
+            'skipped_log': False,
+        })
+        return vals
+
+    def _get_items(self):
+        return self.student_ids.sorted('id')
+
+    def _process_chunk(self, students):
+        created, skipped = self._provision_chunk(students)
+        vals = {
+            'created_count': self.created_count + created,
+            'skipped_count': self.skipped_count + len(skipped),
+        }
+        if skipped:
+            vals['skipped_log'] = '\n'.join(
+                filter(None, [self.skipped_log] + skipped))
+        return vals
+
+    def _get_chunk_failure_vals(self, students):
+        return {'skipped_count': self.skipped_count + len(students)}
+
+    def _finalize(self):
+        self.summary = self._generate_summary()
+
+    def _provision_chunk(self, students):
+        """Create the portal users of ``students``.
+
+        Returns the number of users created and one line per skipped
+        record. Modules provisioning related people (e.g. parents) extend
+        this method.
+        """
+        result = students.create_student_user()
+        skipped = [
+            _('Student %s: no email or login already used') % student.name
+            for student in result['skipped']]
+        return len(result['created']), skipped
+
+    def _generate_summary(self):
+        self.ensure_one()
+        lines = [
+            _('Students processed: %s') % self.total_count,
+            _('Users created: %s') % self.created_count,
+            _('Skipped: %s') % self.skipped_count,
+        ]
+        if self.skipped_log:
+            lines += ['', _('Skipped records:'), self.skipped_log]
+        if self.error_log:
+            lines += ['', _('Errors:'), self.error_log]
+        return '\n'.join(lines)
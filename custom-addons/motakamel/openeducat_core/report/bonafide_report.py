@@ -7,8 +7,9 @@ class BonafideCertificateReport(models.AbstractModel):
 
     @api.model
     def _get_report_values(self, docids, data=None):
-        model = self.env.context.get('active_model')
-        docs = self.env[model].browse(self.env.context.get('active_ids'))
+        model = self.env.context.get('active_model') or 'op.student'
+        docs = self.env[model].browse(
+            docids or self.env.context.get('active_ids'))
 
         for student in docs:
             if not student.certificate_number:
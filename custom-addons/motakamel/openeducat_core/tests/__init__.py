@@ -21,3 +21,7 @@
 
 from . import test_core_common
 from . import test_core
+from . import test_background_job
+from . import test_user_provisioning
+from . import test_student_card_job
+from . import test_subject_registration_approval
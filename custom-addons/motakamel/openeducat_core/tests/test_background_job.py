@@ -0,0 +1,112 @@
+###############################################################################
+#
+#    OpenEduCat Inc
+#    Copyright (C) 2009-TODAY OpenEduCat Inc(<https://www.openeducat.org>).
+#
+#    This program is free software: you can redistribute it and/or modify
+#    it under the terms of the GNU Lesser General Public License as
+#    published by the Free Software Foundation, either version 3 of the
+#    License, or (at your option) any later version.
+#
+#    This program is distributed in the hope that it will be useful,
+#    but WITHOUT ANY WARRANTY; without even the implied warranty of
+#    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#    GNU Lesser General Public License for more details.
+#
+#    You should have received a copy of the GNU Lesser General Public License
+#    along with this program.  If not, see <http://www.gnu.org/licenses/>.
+#
+###############################################################################
+
+from .test_core_common import TestCoreCommon
+
+
+class TestBackgroundJob(TestCoreCommon):
+    """ Failures of op.background.job.mixin, through op.user.provisioning. """
+
+    def setUp(self):
+        super(TestBackgroundJob, self).setUp()
+        self.students = self.op_student.create([{
+            'first_name': 'Job',
+            'last_name': 'Student %s' % i,
+            'name': 'Job Student %s' % i,
+            'email': 'job.student%s@example.com' % i,
+            'gender': 'm',
+        } for i in range(5)])
+        self.job_model = type(self.env['op.user.provisioning'])
+        self.patch(self.job_model, 'BACKGROUND_THRESHOLD', 1)
+        self.patch(self.job_model, 'CHUNK_SIZE', 2)
+        self.patch(self.env.cr, 'commit', lambda: None)
+
+    def _create_job(self):
+        job = self.env['op.user.provisioning'].create({
+            'student_ids': [(6, 0, self.students.ids)],
+        })
+        job.action_start()
+        self.assertEqual(job.state, 'queued')
+        return job
+
+    def test_case_1_failing_chunk(self):
+        provision_chunk = self.job_model._provision_chunk
+
+        def _provision_chunk(job, students):
+            result = provision_chunk(job, students)
+            if self.students[2] in students:
+                raise ValueError('Mail server down')
+            return result
+        self.patch(self.job_model, '_provision_chunk', _provision_chunk)
+
+        job = self._create_job()
+        job._cron_process_jobs()
+
+        self.assertEqual(job.state, 'done')
+        self.assertEqual(job.processed_count, 5)
+        self.assertEqual(job.progress_percentage, 100.0)
+        # The users of the failed chunk are rolled back with its savepoint
+        self.assertEqual(self.students.filtered('user_id'),
+                         self.students[:2] | self.students[4])
+        self.assertEqual(job.created_count, 3)
+        # _get_chunk_failure_vals counts the whole chunk as skipped
+        self.assertEqual(job.skipped_count, 2)
+        self.assertEqual(
+            job.error_log, 'Error processing items 3 to 4: Mail server down')
+        # The job is finalized despite the failure
+        self.assertIn('Errors:', job.summary)
+
+    def test_case_2_failing_finalize(self):
+        def _finalize(job):
+            job.summary = 'Partial summary'
+            raise ValueError('Disk full')
+        self.patch(self.job_model, '_finalize', _finalize)
+
+        job = self._create_job()
+        job._cron_process_jobs()
+
+        self.assertEqual(job.state, 'done')
+        self.assertEqual(job.created_count, 5)
+        self.assertFalse(job.summary)
+        self.assertEqual(job.error_log, 'Error finalizing the job: Disk full')
+
+    def test_case_3_failing_job(self):
+        # A real rollback would drop the test data, the job is marked done
+        # on top of the current transaction instead
+        self.patch(self.env.cr, 'rollback', lambda: None)
+        first = self._create_job()
+        second = self._create_job()
+        process_next_chunk = self.job_model._process_next_chunk
+
+        def _process_next_chunk(job):
+            if job == first:
+                raise ValueError('Deadlock detected')
+            return process_next_chunk(job)
+        self.patch(self.job_model, '_process_next_chunk', _process_next_chunk)
+
+        self.assertEqual(first._cron_process_jobs(), 2)
+
+        self.assertEqual(first.state, 'done')
+        self.assertEqual(
+            first.error_log, 'Error processing the job: Deadlock detected')
+        # The jobs queued after a failed one are processed
+        self.assertEqual(second.state, 'done')
+        self.assertEqual(second.created_count, 5)
+        self.assertFalse(second.error_log)
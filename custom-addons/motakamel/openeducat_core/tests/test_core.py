@@ -128,3 +128,12 @@ class TestCore(TestCoreCommon):
         student = self.studnet_wizard.create(vals)
         student._get_students()
         student.create_user()
+
+    def test_case_11_count_related(self):
+        students = self.op_student.search([])
+        self.env.flush_all()
+        with self.assertQueryCount(1):
+            counts = students._count_related('op.student.course', 'student_id')
+        for student in students:
+            self.assertEqual(counts.get(student.id, 0),
+                             len(student.course_detail_ids))
@@ -0,0 +1,62 @@
+###############################################################################
+#
+#    OpenEduCat Inc
+#    Copyright (C) 2009-TODAY OpenEduCat Inc(<https://www.openeducat.org>).
+#
+#    This program is free software: you can redistribute it and/or modify
+#    it under the terms of the GNU Lesser General Public License as
+#    published by the Free Software Foundation, either version 3 of the
+#    License, or (at your option) any later version.
+#
+#    This program is distributed in the hope that it will be useful,
+#    but WITHOUT ANY WARRANTY; without even the implied warranty of
+#    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#    GNU Lesser General Public License for more details.
+#
+#    You should have received a copy of the GNU Lesser General Public License
+#    along with this program.  If not, see <http://www.gnu.org/licenses/>.
+#
+###############################################################################
+
+from ..models import student_card_job
+from .test_core_common import TestCoreCommon
+
+
+class TestStudentCardJob(TestCoreCommon):
+
+    def setUp(self):
+        super(TestStudentCardJob, self).setUp()
+        self.students = self.op_student.create([{
+            'first_name': 'Card',
+            'last_name': 'Student %s' % i,
+            'name': 'Card Student %s' % i,
+            'gender': 'm',
+        } for i in range(5)])
+        # Reports are rendered as HTML in tests, join the parts instead
+        self.patch(student_card_job, 'merge_pdf', b''.join)
+        self.patch(self.env.cr, 'commit', lambda: None)
+
+    def test_case_1_print_in_chunks(self):
+        self.patch(type(self.env['op.student.card.job']), 'CHUNK_SIZE', 2)
+        job = self.env['op.student.card.job'].create({
+            'report': 'idcard',
+            'student_ids': [(6, 0, self.students.ids)],
+        })
+        job.action_start()
+
+        # The parts of the chunks are merged into one report
+        self.assertFalse(job.part_attachment_ids)
+        content = job.attachment_id.raw.decode()
+        for student in self.students:
+            self.assertIn(student.name, content)
+
+    def test_case_2_bonafide(self):
+        job = self.env['op.student.card.job'].create({
+            'report': 'bonafide',
+            'certificate_purpose': 'Scholarship',
+            'student_ids': [(6, 0, self.students.ids)],
+        })
+        job.action_start()
+
+        self.assertIn('Scholarship', job.attachment_id.raw.decode())
+        self.assertTrue(all(self.students.mapped('certificate_number')))
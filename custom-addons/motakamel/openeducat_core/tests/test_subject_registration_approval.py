@@ -0,0 +1,97 @@
+###############################################################################
+#
+#    OpenEduCat Inc
+#    Copyright (C) 2009-TODAY OpenEduCat Inc(<https://www.openeducat.org>).
+#
+#    This program is free software: you can redistribute it and/or modify
+#    it under the terms of the GNU Lesser General Public License as
+#    published by the Free Software Foundation, either version 3 of the
+#    License, or (at your option) any later version.
+#
+#    This program is distributed in the hope that it will be useful,
+#    but WITHOUT ANY WARRANTY; without even the implied warranty of
+#    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#    GNU Lesser General Public License for more details.
+#
+#    You should have received a copy of the GNU Lesser General Public License
+#    along with this program.  If not, see <http://www.gnu.org/licenses/>.
+#
+###############################################################################
+
+
+from odoo.exceptions import ValidationError
+
+from .test_core_common import TestCoreCommon
+
+
+class TestSubjectRegistrationApproval(TestCoreCommon):
+
+    def setUp(self):
+        super(TestSubjectRegistrationApproval, self).setUp()
+        self.compulsory, self.elective = self.env['op.subject'].create([{
+            'name': 'Approval Compulsory',
+            'code': 'APPCOMP',
+            'subject_type': 'compulsory',
+        }, {
+            'name': 'Approval Elective',
+            'code': 'APPELEC',
+            'subject_type': 'elective',
+        }])
+        self.course = self.env['op.course'].create({
+            'name': 'Approval Course',
+            'code': 'APPCOURSE',
+            'subject_ids': [(6, 0, (self.compulsory | self.elective).ids)],
+        })
+        self.students = self.op_student.create([{
+            'first_name': 'Approval',
+            'last_name': 'Student %s' % i,
+            'name': 'Approval Student %s' % i,
+            'gender': 'm',
+        } for i in range(5)])
+        # The last student is not enrolled in the course
+        self.env['op.student.course'].create([{
+            'student_id': student.id,
+            'course_id': self.course.id,
+        } for student in self.students[:4]])
+        self.registrations = self.subject_registration.create([{
+            'student_id': student.id,
+            'course_id': self.course.id,
+            'state': 'submitted',
+        } for student in self.students])
+        self.registrations.get_subjects()
+        self.registrations[:2].write({
+            'elective_subject_ids': [(6, 0, self.elective.ids)]})
+        self.patch(self.env.cr, 'commit', lambda: None)
+
+    def test_case_1_get_subjects(self):
+        for registration in self.registrations:
+            self.assertEqual(registration.compulsory_subject_ids,
+                             self.compulsory)
+
+    def test_case_2_approve(self):
+        with self.assertRaises(ValidationError):
+            self.registrations.action_approve()
+        self.registrations[:4].action_approve()
+        self.assertEqual(set(self.registrations[:4].mapped('state')),
+                         {'approved'})
+        courses = self.students.course_detail_ids
+        self.assertEqual(courses.filtered(
+            lambda c: c.student_id in self.students[:2]).subject_ids,
+            self.compulsory | self.elective)
+        self.assertEqual(courses.filtered(
+            lambda c: c.student_id in self.students[2:4]).subject_ids,
+            self.compulsory)
+
+    def test_case_3_approval_chunks(self):
+        # The counters add up over the chunks of the approval
+        self.patch(type(self.env['op.subject.registration.approval']),
+                   'CHUNK_SIZE', 2)
+        action = self.env['op.subject.registration.approval']._action_approve(
+            self.registrations)
+        approval = self.env['op.subject.registration.approval'].browse(
+            action['res_id'])
+        self.assertEqual(approval.approved_count, 4)
+        self.assertEqual(approval.failed_count, 1)
+        self.assertIn(self.registrations[4].name, approval.error_log)
+        self.assertEqual(self.registrations.mapped('state'),
+                         ['approved'] * 4 + ['submitted'])
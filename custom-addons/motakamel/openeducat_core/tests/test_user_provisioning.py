@@ -0,0 +1,67 @@
+###############################################################################
+#
+#    OpenEduCat Inc
+#    Copyright (C) 2009-TODAY OpenEduCat Inc(<https://www.openeducat.org>).
+#
+#    This program is free software: you can redistribute it and/or modify
+#    it under the terms of the GNU Lesser General Public License as
+#    published by the Free Software Foundation, either version 3 of the
+#    License, or (at your option) any later version.
+#
+#    This program is distributed in the hope that it will be useful,
+#    but WITHOUT ANY WARRANTY; without even the implied warranty of
+#    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#    GNU Lesser General Public License for more details.
+#
+#    You should have received a copy of the GNU Lesser General Public License
+#    along with this program.  If not, see <http://www.gnu.org/licenses/>.
+#
+###############################################################################
+
+from .test_core_common import TestCoreCommon
+
+
+class TestUserProvisioning(TestCoreCommon):
+
+    def setUp(self):
+        super(TestUserProvisioning, self).setUp()
+        self.students = self.op_student.create([{
+            'first_name': 'Bulk',
+            'last_name': 'Student %s' % i,
+            'name': 'Bulk Student %s' % i,
+            'email': 'bulk.student%s@example.com' % i,
+            'gender': 'm',
+        } for i in range(3)])
+
+    def test_case_1_bulk_create_users(self):
+        self.env['res.users'].create({
+            'name': 'Taken Login',
+            'login': 'Bulk.Student2@example.com',
+        })
+        result = self.students.create_student_user()
+
+        self.assertEqual(result['created'], self.students[:2])
+        self.assertEqual(result['skipped'], self.students[2])
+        self.assertEqual(self.students[0].user_id.partner_id,
+                         self.students[0].partner_id)
+        self.assertFalse(self.students[2].user_id)
+
+    def test_case_2_duplicated_logins(self):
+        users_by_login, skipped = self.env['res.users']._bulk_create_users([
+            {'name': 'First', 'login': 'same.login@example.com'},
+            {'name': 'Second', 'login': 'Same.Login@example.com'},
+            {'name': 'No Login', 'login': False},
+        ])
+        self.assertEqual(list(users_by_login), ['same.login@example.com'])
+        self.assertEqual(len(skipped), 2)
+
+    def test_case_3_provisioning_summary(self):
+        provisioning = self.env['op.user.provisioning'].create({
+            'student_ids': [(6, 0, self.students.ids)],
+        })
+        provisioning.action_start()
+
+        self.assertEqual(provisioning.state, 'done')
+        self.assertEqual(provisioning.processed_count, 3)
+        self.assertTrue(all(self.students.mapped('user_id')))
+        self.assertIn('Students processed: 3', provisioning.summary)
@@ -56,6 +56,15 @@ class BonafideCertificateWizard(models.TransientModel):
         action['close_on_report_download'] = True
         return action
 
+    def action_print_in_background(self):
+        """Print the certificates of many students with a background job."""
+        students = self.student_ids
+        if not students:
+            raise UserError(_("No students selected for the certificate."))
+        return self.env['op.student.card.job']._action_print(
+            students, 'bonafide',
+            certificate_purpose=self._get_purpose_display())
+
     def _get_purpose_display(self):
         """Get the display text for the selected purpose."""
         purpose_mapping = {
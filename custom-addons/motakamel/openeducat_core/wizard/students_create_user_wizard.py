@@ -35,5 +35,15 @@ class WizardOpStudent(models.TransientModel):
 
     def create_user(self):
         active_ids = self.env.context.get('active_ids', []) or []
-        records = self.env['op.student'].browse(active_ids)
-        records.create_student_user()
+        records = self.env['op.student'].browse(active_ids) or self.student_ids
+        provisioning = self.env['op.user.provisioning'].create({
+            'student_ids': [(6, 0, records.ids)],
+        })
+        provisioning.action_start()
+        return {
+            'type': 'ir.actions.act_window',
+            'res_model': 'op.user.provisioning',
+            'res_id': provisioning.id,
+            'view_mode': 'form',
+            'target': 'current',
+        }
@@ -22,6 +22,7 @@ import datetime
 
 from odoo import _, api, fields, models
 from odoo.exceptions import ValidationError
+from odoo.osv import expression
 
 
 class OpExam(models.Model):
@@ -37,7 +38,8 @@ class OpExam(models.Model):
     batch_id = fields.Many2one(
         'op.batch', 'Batch', related='session_id.batch_id', store=True,
         readonly=True)
-    subject_id = fields.Many2one('op.subject', 'Subject', required=True)
+    subject_id = fields.Many2one('op.subject', 'Subject', required=True,
+                                 index=True)
     exam_code = fields.Char('Exam Code', size=16, required=True)
     attendees_line = fields.One2many(
         'op.exam.attendees', 'exam_id', 'Attendees', readonly=True)
@@ -117,9 +119,9 @@ class OpExam(models.Model):
         }
 
     def _compute_attendees_count(self):
+        counts = self._count_related("op.exam.attendees", "exam_id")
         for record in self:
-            record.attendees_count = self.env["op.exam.attendees"].search_count(
-                [("exam_id", "=", record.id)])
+            record.attendees_count = counts.get(record.id, 0)
 
     @api.depends('attendees_line', 'attendees_line.marks')
     def _compute_results_entered(self):
@@ -129,24 +131,53 @@ class OpExam(models.Model):
                 for attendee in record.attendees_line
             )
 
+    def _get_overlapping_exams(self):
+        """ Return the exams overlapping each exam on the same subject.
+
+        The exams are checked against each other and against the other exams
+        of their subjects with one query, fetching for every subject the exams
+        within the time span of the checked ones.
+
+        :return: dictionary {exam: overlapping exams}
+        """
+        exams = self.filtered(
+            lambda e: e.subject_id and e.start_time and e.end_time)
+        if not exams:
+            return {}
+        exams_by_subject = exams.grouped('subject_id')
+        candidates = self.search(expression.OR([[
+            ('subject_id', '=', subject.id),
+            ('start_time', '<', max(subject_exams.mapped('end_time'))),
+            ('end_time', '>', min(subject_exams.mapped('start_time'))),
+        ] for subject, subject_exams in exams_by_subject.items()]),
+            order='start_time, id')
+        candidates_by_subject = candidates.grouped('subject_id')
+        conflicts = {}
+        for subject, subject_exams in exams_by_subject.items():
+            subject_candidates = candidates_by_subject.get(subject, self.browse())
+            for exam in subject_exams:
+                overlapping = subject_candidates.filtered(
+                    lambda c: c != exam and c.start_time < exam.end_time
+                    and c.end_time > exam.start_time)
+                if overlapping:
+                    conflicts[exam] = overlapping
+        return conflicts
+
     @api.constrains('subject_id', 'start_time', 'end_time')
     def _check_overlapping_times(self):
-        for record in self:
-            if not record.subject_id or not record.start_time or not record.end_time:
-                continue
-
-            existing_exams = self.env['op.exam'].search([
-                ('subject_id', '=', record.subject_id.id),
-                ('id', '!=', record.id),
-                ('start_time', '<', record.end_time),
-                ('end_time', '>', record.start_time),
-            ])
-            if existing_exams:
-                raise ValidationError(_(
-                    'The exam time overlaps with an existing exam for the same '
-                    'subject : %s' %
-                    ', '.join(existing_exams.mapped('name'))
-                ))
+        conflicts = self._get_overlapping_exams()
+        messages = []
+        for exam, overlapping in conflicts.items():
+            # Report the conflicts between two checked exams only once
+            overlapping = overlapping.filtered(
+                lambda o: o not in conflicts or o.id > exam.id)
+            if overlapping:
+                messages.append('%s: %s' % (
+                    exam.name, ', '.join(overlapping.mapped('name'))))
+        if messages:
+            raise ValidationError(_(
+                'The exam time overlaps with an existing exam for the same '
+                'subject :\n%s', '\n'.join(messages)))
 
     def act_result_updated(self):
         self.ensure_one()
@@ -67,8 +67,9 @@ class OpExamSession(models.Model):
          'unique(exam_code)', 'Code should be unique per exam session!')]
 
     def _compute_exams_count(self):
+        counts = self._count_related('op.exam', 'session_id')
         for rec in self:
-            rec.exams_count = len(rec.exam_ids)
+            rec.exams_count = counts.get(rec.id, 0)
 
     @api.constrains('start_date', 'end_date')
     def _check_date_time(self):
@@ -84,6 +85,8 @@ class OpExamSession(models.Model):
         self.state = 'draft'
 
     def act_schedule(self):
+        # Validate the whole timetable of the sessions at once
+        self.exam_ids._check_overlapping_times()
         self.state = 'schedule'
 
     def act_held(self):
@@ -18,6 +18,9 @@
 #
 ###############################################################################
 import logging
+from datetime import datetime
+
+from odoo.exceptions import ValidationError
 
 from .test_exam_common import TestExamCommon
 
@@ -220,3 +223,68 @@ class TestRoomDistribution(TestExamCommon):
         room.schedule_exam()
 
         logging.info('computed total students')
+
+
+class TestExamCounters(TestExamCommon):
+
+    def setUp(self):
+        super(TestExamCounters, self).setUp()
+
+    def test_case_exam_counters_queries(self):
+        exams = self.op_exam.search([])
+        sessions = self.op_exam_session.search([])
+        self.env.flush_all()
+        with self.assertQueryCount(1):
+            attendees_counts = exams.mapped('attendees_count')
+        with self.assertQueryCount(1):
+            exams_counts = sessions.mapped('exams_count')
+        self.assertEqual(attendees_counts,
+                         [len(e.attendees_line) for e in exams])
+        self.assertEqual(exams_counts, [len(s.exam_ids) for s in sessions])
+
+
+class TestExamOverlap(TestExamCommon):
+
+    def setUp(self):
+        super(TestExamOverlap, self).setUp()
+        self.subject = self.env['op.subject'].create({
+            'name': 'Overlap Subject',
+            'code': 'OVERLAP',
+        })
+
+    def _prepare_exam(self, code, start_hour, end_hour):
+        return {
+            'name': 'Exam %s' % code,
+            'exam_code': code,
+            'subject_id': self.subject.id,
+            'start_time': datetime(2030, 1, 7, start_hour),
+            'end_time': datetime(2030, 1, 7, end_hour),
+            'total_marks': 100,
+            'min_marks': 40,
+        }
+
+    def test_case_overlap_batch(self):
+        exams = self.op_exam.create([
+            self._prepare_exam('OVL1', 8, 10),
+            self._prepare_exam('OVL2', 10, 12),
+        ])
+        self.assertFalse(exams._get_overlapping_exams())
+
+        with self.assertRaises(ValidationError) as error:
+            self.op_exam.create([
+                self._prepare_exam('OVL3', 9, 11),
+                self._prepare_exam('OVL4', 13, 15),
+                self._prepare_exam('OVL5', 14, 16),
+            ])
+        message = str(error.exception)
+        self.assertIn('Exam OVL3: Exam OVL1, Exam OVL2', message)
+        self.assertIn('Exam OVL4: Exam OVL5', message)
+        self.assertNotIn('Exam OVL5: Exam OVL4', message)
+
+    def test_case_overlap_queries(self):
+        exams = self.op_exam.create([
+            self._prepare_exam('OVQ%s' % hour, hour, hour + 1)
+            for hour in range(8, 14)])
+        self.env.flush_all()
+        with self.assertQueryCount(1):
+            self.assertFalse(exams._get_overlapping_exams())
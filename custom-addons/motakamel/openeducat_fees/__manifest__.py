@@ -32,6 +32,7 @@
     'data': [
         'security/op_security.xml',
         'security/ir.model.access.csv',
+        'data/ir_cron_data.xml',
         'report/report_menu.xml',
         'report/fees_analysis_report_view.xml',
         'wizard/fees_detail_report_wizard_view.xml',
@@ -40,6 +41,7 @@
         'views/student_view.xml',
         'views/course_view.xml',
         'views/fees_element_view.xml',
+        'views/fees_invoice_run_view.xml',
     ],
     'images': [
         'static/description/openeducat-fees_banner.jpg',
@@ -22,3 +22,4 @@ from . import fees_terms
 from . import fees_element
 from . import course
 from . import student
+from . import fees_invoice_run
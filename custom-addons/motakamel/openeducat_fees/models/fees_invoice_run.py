@@ -0,0 +1,126 @@
+##############################################################################
+#
+#    OpenEduCat Inc
+#    Copyright (C) 2009-TODAY OpenEduCat Inc(<https://www.openeducat.org>).
+#
+#    This program is free software: you can redistribute it and/or modify
+#    it under the terms of the GNU Lesser General Public License as
+#    published by the Free Software Foundation, either version 3 of the
+#    License, or (at your option) any later version.
+#
+#    This program is distributed in the hope that it will be useful,
+#    but WITHOUT ANY WARRANTY; without even the implied warranty of
+#    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#    GNU Lesser General Public License for more details.
+#
+#    You should have received a copy of the GNU Lesser General Public License
+#    along with this program.  If not, see <http://www.gnu.org/licenses/>.
+#
+##############################################################################
+
+
+import logging
+
+from odoo import _, api, fields, models
+
+_logger = logging.getLogger(__name__)
+
+
+class OpFeesInvoiceRun(models.Model):
+    _name = "op.fees.invoice.run"
+    _inherit = ["op.background.job.mixin"]
+    _description = "Fees Invoicing Run"
+    _job_cron = 'openeducat_fees.ir_cron_process_fees_invoice_run'
+
+    # Number of students invoiced per transaction
+    CHUNK_SIZE = 200
+
+    name = fields.Char(
+        'Name', required=True, readonly=True,
+        default=lambda self: _('Invoicing %s') % fields.Date.today())
+    date = fields.Date(
+        'Due Date', required=True, default=fields.Date.context_today,
+        help='Fees due on or before this date are invoiced.')
+    fees_detail_ids = fields.Many2many(
+        'op.student.fees.details', 'op_fees_invoice_run_fees_rel',
+        'run_id', 'fees_detail_id', string='Fees', readonly=True)
+    student_ids = fields.Many2many(
+        'op.student', 'op_fees_invoice_run_student_rel',
+        'run_id', 'student_id', string='Students', readonly=True)
+    invoice_ids = fields.Many2many(
+        'account.move', 'op_fees_invoice_run_move_rel',
+        'run_id', 'move_id', string='Invoices', readonly=True)
+    invoice_count = fields.Integer('Invoices Created', readonly=True)
+    failed_count = fields.Integer('Failed Fees', readonly=True)
+
+    def _get_fees_domain(self):
+        self.ensure_one()
+        return [
+            ('state', '=', 'draft'),
+            ('invoice_id', '=', False),
+            ('date', '<=', self.date),
+        ]
+
+    def _prepare_start_vals(self):
+        """ Find the fees due by the run date, with one query. """
+        vals = super(OpFeesInvoiceRun, self)._prepare_start_vals()
+        fees = self.env['op.student.fees.details'].search(
+            self._get_fees_domain(), order='student_id, id')
+        vals.update({
+            'fees_detail_ids': [(6, 0, fees.ids)],
+            'student_ids': [(6, 0, fees.student_id.ids)],
+            'invoice_ids': [(5, 0, 0)],
+            'invoice_count': 0,
+            'failed_count': 0,
+        })
+        return vals
+
+    def action_view_invoices(self):
+        self.ensure_one()
+        action = self.env['ir.actions.act_window']._for_xml_id(
+            'account.action_move_out_invoice_type')
+        action['domain'] = [('id', 'in', self.invoice_ids.ids)]
+        action['context'] = {'default_move_type': 'out_invoice'}
+        return action
+
+    @api.model
+    def _cron_invoice_due_fees(self):
+        """ Scheduled invoicing of all the fees due today. """
+        run = self.create({})
+        run._queue()
+        if not run.total_count:
+            run.unlink()
+        return self._cron_process_jobs()
+
+    def _get_items(self):
+        return self.student_ids.sorted('id')
+
+    def _get_chunk_fees(self, students):
+        # Fees invoiced or cancelled since the run started are skipped
+        return self.env['op.student.fees.details'].search(
+            self._get_fees_domain() + [
+                ('id', 'in', self.fees_detail_ids.ids),
+                ('student_id', 'in', students.ids),
+            ])
+
+    def _process_chunk(self, students):
+        """ Invoice the due fees of the chunk of students. """
+        invoices, errors = self._get_chunk_fees(students)._create_invoices()
+        vals = {
+            'invoice_ids': [(4, invoice.id) for invoice in invoices],
+            'invoice_count': self.invoice_count + len(invoices),
+            'failed_count': self.failed_count + len(errors),
+        }
+        if errors:
+            messages = [
+                _('%(student)s - %(product)s: %(error)s',
+                  student=record.student_id.name,
+                  product=record.product_id.name, error=error)
+                for record, error in errors.items()]
+            _logger.error('\n'.join(messages))
+            vals['error_log'] = self._append_error_log(messages)
+        return vals
+
+    def _get_chunk_failure_vals(self, students):
+        return {'failed_count': self.failed_count + len(
+            self._get_chunk_fees(students))}
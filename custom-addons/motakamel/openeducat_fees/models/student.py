@@ -18,6 +18,8 @@
 #
 ##############################################################################
 
+from collections import defaultdict
+
 from odoo import _, api, fields, models
 from odoo.exceptions import UserError
 
@@ -71,17 +73,13 @@ class OpStudentFeesDetails(models.Model):
         'res.currency', string='Currency', compute='_compute_currency_id',
         default=lambda self: self.env.user.company_id.currency_id.id)
 
-    def get_invoice(self):
-        """ Create invoice for fee payment process of student """
-        inv_obj = self.env['account.move']
-        partner_id = self.student_id.partner_id
-        # student = self.student_id
-        account_id = False
+    def _prepare_invoice_line_vals(self, elements):
+        """ Return the invoice lines of the fees, one per fees element of its
+        term line, or a single line of the fees product. """
+        self.ensure_one()
         product = self.product_id
-        if product.property_account_income_id:
-            account_id = product.property_account_income_id.id
-        if not account_id:
-            account_id = product.categ_id.property_account_income_categ_id.id
+        account_id = product.property_account_income_id.id or \
+            product.categ_id.property_account_income_categ_id.id
         if not account_id:
             raise UserError(
                 _('There is no income account defined for this product: "%s".'
@@ -90,41 +88,76 @@ class OpStudentFeesDetails(models.Model):
         if self.amount <= 0.00:
             raise UserError(
                 _('The value of the deposit amount must be positive.'))
-        else:
-            amount = self.amount
-            name = product.name
-        element_id = self.env['op.fees.element'].search([
-            ('fees_terms_line_id', '=', self.fees_line_id.id)])
-        invoice_line_list = []
-        if element_id:
-            for records in element_id:
-                invoice_line_list.append((0, 0, {
-                    'name': records.product_id.name,
-                    'account_id': account_id,
-                    'price_unit': records.value * self.amount / 100,
-                    'quantity': 1.0,
-                    'discount': self.discount or False,
-                    'product_uom_id': records.product_id.uom_id.id,
-                    'product_id': records.product_id.id,
-                }))
-        else:
-            invoice_line_list.append((0, 0, {
-                'name': name,
+        if elements:
+            return [(0, 0, {
+                'name': element.product_id.name,
                 'account_id': account_id,
-                'price_unit': amount,
+                'price_unit': element.value * self.amount / 100,
                 'quantity': 1.0,
                 'discount': self.discount or False,
-                'product_uom_id': product.uom_id.id,
-                'product_id': product.id
-            }))
-        invoice = inv_obj.create({
-            'move_type': 'out_invoice',
-            'partner_id': partner_id.id,
-            'invoice_line_ids': invoice_line_list,
-        })
-        invoice._compute_tax_totals()
-        self.state = 'invoice'
-        self.invoice_id = invoice.id
+                'product_uom_id': element.product_id.uom_id.id,
+                'product_id': element.product_id.id,
+            }) for element in elements]
+        return [(0, 0, {
+            'name': product.name,
+            'account_id': account_id,
+            'price_unit': self.amount,
+            'quantity': 1.0,
+            'discount': self.discount or False,
+            'product_uom_id': product.uom_id.id,
+            'product_id': product.id
+        })]
+
+    def _create_invoices(self):
+        """ Invoice the fees with one invoice per student and company.
+
+        The fees elements are read with one query and the invoices of each
+        company are created together. The fees which can not be invoiced
+        are left untouched and returned with their error message.
+
+        :return: tuple (invoices, {fees record: error message})
+        """
+        elements_by_line = self.env['op.fees.element'].search([
+            ('fees_terms_line_id', 'in', self.fees_line_id.ids),
+        ]).grouped('fees_terms_line_id')
+        errors = {}
+        to_invoice = defaultdict(dict)
+        for fees in self:
+            try:
+                line_vals = fees._prepare_invoice_line_vals(
+                    elements_by_line.get(fees.fees_line_id))
+            except UserError as e:
+                errors[fees] = e.args[0]
+                continue
+            student_fees = to_invoice[fees.company_id].setdefault(
+                fees.student_id, [])
+            student_fees.append((fees, line_vals))
+
+        invoices = self.env['account.move']
+        for company, by_student in to_invoice.items():
+            company_invoices = self.env['account.move'].with_company(
+                company or self.env.company).create([{
+                    'move_type': 'out_invoice',
+                    'partner_id': student.partner_id.id,
+                    'invoice_line_ids': [
+                        line for fees, line_vals in student_fees
+                        for line in line_vals],
+                } for student, student_fees in by_student.items()])
+            for student_fees, invoice in zip(
+                    by_student.values(), company_invoices):
+                self.browse().union(*[fees for fees, line_vals in student_fees]).write({
+                    'state': 'invoice',
+                    'invoice_id': invoice.id,
+                })
+            invoices |= company_invoices
+        invoices._compute_tax_totals()
+        return invoices, errors
+
+    def get_invoice(self):
+        """ Create invoice for fee payment process of student """
+        invoices, errors = self._create_invoices()
+        if errors:
+            raise UserError('\n'.join(errors.values()))
         return True
 
     def action_get_invoice(self):
@@ -159,9 +192,9 @@ class OpStudent(models.Model):
 
     @api.depends('fees_detail_ids')
     def _compute_fees_details(self):
+        counts = self._count_related('op.student.fees.details', 'student_id')
         for fees in self:
-            fees.fees_details_count = self.env['op.student.fees.details'].search_count(
-                [('student_id', '=', self.id)])
+            fees.fees_details_count = counts.get(fees.id, 0)
 
     def action_view_invoice(self):
         '''
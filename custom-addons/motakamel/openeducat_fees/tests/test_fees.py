@@ -18,8 +18,11 @@
 #
 ###############################################################################
 
+from datetime import timedelta
 from logging import info
 
+from odoo import fields
+
 from .test_fees_common import TestFeesCommon
 
 
@@ -79,3 +82,81 @@ class TestFeesTerms(TestFeesCommon):
         })
         info('  Details Of Fees Terms :.....')
         return terms
+
+
+class TestFeesDetailsCount(TestFeesCommon):
+
+    def setUp(self):
+        super(TestFeesDetailsCount, self).setUp()
+
+    def test_case_fees_details_count_queries(self):
+        students = self.op_student.search([])
+        self.env.flush_all()
+        with self.assertQueryCount(1):
+            counts = students.mapped('fees_details_count')
+        self.assertEqual(counts, [len(s.fees_detail_ids) for s in students])
+
+
+class TestFeesInvoiceRun(TestFeesCommon):
+
+    def setUp(self):
+        super(TestFeesInvoiceRun, self).setUp()
+        account = self.env['account.account'].search([
+            ('account_type', '=', 'income')], limit=1)
+        if not account:
+            self.skipTest('No income account defined.')
+        product = self.env['product.product'].create({
+            'name': 'Term Fees',
+            'property_account_income_id': account.id,
+        })
+        self.student_1 = self.env.ref('openeducat_core.op_student_1')
+        self.student_2 = self.env.ref('openeducat_core.op_student_2')
+        # Leave the demo fees out of the runs
+        self.op_student_fees.search([('state', '=', 'draft')]).write({
+            'state': 'cancel'})
+        today = fields.Date.today()
+        self.fees = self.op_student_fees.create([{
+            'student_id': student.id,
+            'product_id': product.id,
+            'amount': amount,
+            'date': today + timedelta(days=days),
+            'state': 'draft',
+        } for student, amount, days in [
+            (self.student_1, 1000, -1),
+            (self.student_1, 500, 0),
+            (self.student_2, 700, -3),
+            (self.student_2, 0, -3),
+            (self.student_1, 300, 10),
+        ]])
+        self.patch(self.env.cr, 'commit', lambda: None)
+
+    def test_case_invoice_run(self):
+        run = self.env['op.fees.invoice.run'].create({})
+        run.action_start()
+
+        self.assertEqual(run.state, 'done')
+        self.assertEqual(run.total_count, 2)
+        self.assertEqual(run.invoice_count, 2)
+        self.assertEqual(run.failed_count, 1)
+        self.assertIn('must be positive', run.error_log)
+        invoice = self.fees[0].invoice_id
+        self.assertEqual(self.fees[1].invoice_id, invoice)
+        self.assertEqual(invoice.partner_id, self.student_1.partner_id)
+        self.assertEqual(len(invoice.invoice_line_ids), 2)
+        self.assertEqual(self.fees[2].invoice_id.partner_id,
+                         self.student_2.partner_id)
+        self.assertEqual(run.invoice_ids, self.fees[:3].invoice_id)
+        self.assertFalse(self.fees[3].invoice_id)
+        self.assertFalse(self.fees[4].invoice_id)
+        self.assertEqual(self.fees[:3].mapped('state'), ['invoice'] * 3)
+        self.assertEqual(self.fees[3:].mapped('state'), ['draft'] * 2)
+
+    def test_case_invoice_run_scheduled(self):
+        # The counters add up over the chunks of the scheduled run
+        self.patch(type(self.env['op.fees.invoice.run']), 'CHUNK_SIZE', 1)
+        self.env['op.fees.invoice.run']._cron_invoice_due_fees()
+        run = self.env['op.fees.invoice.run'].search([], limit=1,
+                                                     order='id desc')
+        self.assertEqual(run.invoice_count, 2)
+        self.assertEqual(run.failed_count, 1)
+        self.assertEqual(run.invoice_ids, self.fees[:3].invoice_id)
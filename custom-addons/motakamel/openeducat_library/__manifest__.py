@@ -40,6 +40,7 @@
         'data/custom_paperformat.xml',
         'data/media_queue_sequence.xml',
         'data/action_rule_data.xml',
+        'data/ir_cron_data.xml',
         'data/product_demo.xml',
         'report/report_media_barcode.xml',
         'report/report_library_card_barcode.xml',
@@ -20,6 +20,7 @@
 
 from . import account_invoice
 from . import author
+from . import circulation
 from . import faculty
 from . import library
 from . import media
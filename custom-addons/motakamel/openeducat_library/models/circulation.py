@@ -0,0 +1,188 @@
+###############################################################################
+#
+#    OpenEduCat Inc
+#    Copyright (C) 2009-TODAY OpenEduCat Inc(<https://www.openeducat.org>).
+#
+#    This program is free software: you can redistribute it and/or modify
+#    it under the terms of the GNU Lesser General Public License as
+#    published by the Free Software Foundation, either version 3 of the
+#    License, or (at your option) any later version.
+#
+#    This program is distributed in the hope that it will be useful,
+#    but WITHOUT ANY WARRANTY; without even the implied warranty of
+#    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#    GNU Lesser General Public License for more details.
+#
+#    You should have received a copy of the GNU Lesser General Public License
+#    along with this program.  If not, see <http://www.gnu.org/licenses/>.
+#
+###############################################################################
+
+from datetime import timedelta
+
+from odoo import _, api, fields, models
+from odoo.exceptions import UserError
+from odoo.tools import SQL
+
+
+class OpLibraryCirculation(models.AbstractModel):
+    """ Circulation desk API: issue and return baskets of scanned media units.
+
+    Every call processes the whole basket in one transaction and returns
+    one result per scanned barcode, as a dictionary with the keys
+    ``barcode``, ``status`` ('issued', 'returned' or 'error'),
+    ``message``, ``media_unit_id`` and ``movement_id``.
+    """
+    _name = "op.library.circulation"
+    _description = "Library Circulation Desk"
+
+    def _lock(self, records):
+        """ Lock the rows of ``records`` until the end of the transaction,
+        so desks working on the same units or card wait for each other. """
+        if records:
+            self.env.cr.execute(SQL(
+                "SELECT id FROM %s WHERE id = ANY(%s) ORDER BY id "
+                "FOR NO KEY UPDATE",
+                SQL.identifier(records._table), sorted(records.ids)))
+            records.invalidate_recordset()
+
+    def _get_units_by_barcode(self, barcodes):
+        """ Find the scanned units with one exact, indexed barcode lookup. """
+        units = self.env['op.media.unit'].search([('barcode', 'in', barcodes)])
+        self._lock(units)
+        return {unit.barcode: unit for unit in units}
+
+    def _prepare_results(self, barcodes):
+        """ Return the unique barcodes to process and the results of the
+        duplicated scans. """
+        unique_barcodes, results = [], []
+        for barcode in barcodes:
+            barcode = (barcode or '').strip()
+            if barcode in unique_barcodes:
+                results.append(self._result(
+                    barcode, 'error', _('Scanned more than once.')))
+            elif barcode:
+                unique_barcodes.append(barcode)
+        return unique_barcodes, results
+
+    def _result(self, barcode, status, message='', unit=None, movement=None):
+        return {
+            'barcode': barcode,
+            'status': status,
+            'message': message,
+            'media_unit_id': unit.id if unit else False,
+            'movement_id': movement.id if movement else False,
+        }
+
+    @api.model
+    def issue_media_units(self, library_card_id, barcodes, issued_date=None):
+        """ Issue the media units scanned at the desk to a library card.
+
+        :param library_card_id: id of the library card borrowing the units
+        :param barcodes: list of scanned media unit barcodes
+        :param issued_date: issue date, today by default
+        :return: list of per-barcode results
+        """
+        card = self.env['op.library.card'].browse(library_card_id).exists()
+        if not card:
+            raise UserError(_('Library card not found.'))
+        # Serialize the issues of a card so its media limit holds
+        self._lock(card)
+        issued_date = fields.Date.to_date(issued_date) or fields.Date.today()
+        return_date = issued_date + timedelta(
+            days=card.library_card_type_id.duration)
+        person = card.student_id if card.type == 'student' \
+            else card.faculty_id
+
+        unique_barcodes, results = self._prepare_results(barcodes)
+        units_by_barcode = self._get_units_by_barcode(unique_barcodes)
+        remaining = card.library_card_type_id.allow_media - \
+            self.env['op.media.movement'].search_count([
+                ('library_card_id', '=', card.id),
+                ('state', '=', 'issue')])
+
+        to_issue = []
+        for barcode in unique_barcodes:
+            unit = units_by_barcode.get(barcode)
+            if not unit:
+                results.append(self._result(
+                    barcode, 'error', _('Unknown barcode.')))
+            elif unit.state != 'available':
+                results.append(self._result(
+                    barcode, 'error',
+                    _("Media unit can not be issued because it's already: "
+                      "%s") % dict(unit._fields['state'].selection).get(
+                        unit.state), unit))
+            elif remaining <= 0:
+                results.append(self._result(
+                    barcode, 'error',
+                    _('Maximum Number of media allowed for %s is : %s') % (
+                        person.name,
+                        card.library_card_type_id.allow_media), unit))
+            else:
+                remaining -= 1
+                to_issue.append((barcode, unit))
+
+        movements = self.env['op.media.movement'].create([{
+            'media_id': unit.media_id.id,
+            'media_unit_id': unit.id,
+            'type': card.type,
+            'student_id': card.student_id.id or False,
+            'faculty_id': card.faculty_id.id or False,
+            'library_card_id': card.id,
+            'issued_date': issued_date,
+            'return_date': return_date,
+            'partner_id': person.partner_id.id or False,
+            'state': 'issue',
+        } for barcode, unit in to_issue])
+        self.env['op.media.unit'].union(
+            *[unit for barcode, unit in to_issue]).write({'state': 'issue'})
+        for (barcode, unit), movement in zip(to_issue, movements):
+            results.append(self._result(
+                barcode, 'issued', unit=unit, movement=movement))
+        return results
+
+    @api.model
+    def return_media_units(self, barcodes, return_date=None):
+        """ Return the media units scanned at the desk.
+
+        :param barcodes: list of scanned media unit barcodes
+        :param return_date: actual return date, today by default
+        :return: list of per-barcode results, returned items also have the
+            ``penalty`` of their movement
+        """
+        return_date = fields.Date.to_date(return_date) or fields.Date.today()
+        unique_barcodes, results = self._prepare_results(barcodes)
+        units_by_barcode = self._get_units_by_barcode(unique_barcodes)
+        movements = self.env['op.media.movement'].search([
+            ('media_unit_id', 'in',
+             [unit.id for unit in units_by_barcode.values()]),
+            ('state', '=', 'issue')])
+        movement_by_unit = {
+            movement.media_unit_id.id: movement for movement in movements}
+
+        to_return = []
+        for barcode in unique_barcodes:
+            unit = units_by_barcode.get(barcode)
+            movement = unit and movement_by_unit.get(unit.id)
+            if not unit:
+                results.append(self._result(
+                    barcode, 'error', _('Unknown barcode.')))
+            elif unit.state != 'issue' or not movement:
+                results.append(self._result(
+                    barcode, 'error',
+                    _("Media Unit can not be returned because it's already: "
+                      "%s") % dict(unit._fields['state'].selection).get(
+                        unit.state), unit))
+            else:
+                to_return.append((barcode, unit, movement))
+
+        self.env['op.media.movement'].union(
+            *[movement for barcode, unit, movement in to_return]
+        ).return_media(return_date)
+        for barcode, unit, movement in to_return:
+            result = self._result(
+                barcode, 'returned', unit=unit, movement=movement)
+            result['penalty'] = movement.penalty
+            results.append(result)
+        return results
@@ -18,10 +18,14 @@
 #
 ###############################################################################
 
+import logging
 from datetime import datetime, timedelta
 
 from odoo import _, api, fields, models
 from odoo.exceptions import UserError, ValidationError
+from odoo.tools import SQL
+
+_logger = logging.getLogger(__name__)
 
 
 def days_between(to_date, from_date):
@@ -55,6 +59,9 @@ class OpMediaMovement(models.Model):
     return_date = fields.Date('Due Date', required=True)
     actual_return_date = fields.Date('Actual Return Date')
     penalty = fields.Float('Penalty')
+    is_overdue = fields.Boolean('Overdue', readonly=True, index=True,
+                                copy=False)
+    overdue_days = fields.Integer('Overdue Days', readonly=True, copy=False)
     partner_id = fields.Many2one(
         'res.partner', 'Person', tracking=True)
     reserver_name = fields.Char('Person Name', size=256)
@@ -132,7 +139,11 @@ class OpMediaMovement(models.Model):
         for record in self:
             if not return_date:
                 return_date = fields.Date.today()
-            record.actual_return_date = return_date
+            record.write({
+                'actual_return_date': return_date,
+                'is_overdue': False,
+                'overdue_days': 0,
+            })
             record.calculate_penalty()
             if record.penalty > 0.0:
                 record.state = 'return'
@@ -156,36 +167,115 @@ class OpMediaMovement(models.Model):
                 penalty_amt = penalty_days * x.penalty_amt_per_day
             record.write({'penalty': penalty_amt})
 
+    def _get_penalty_product_account(self):
+        product = self.env.ref('openeducat_library.op_product_7')
+        account_id = product.property_account_income_id.id or \
+            product.categ_id.property_account_income_categ_id.id
+        if not account_id:
+            raise UserError(
+                _('There is no income account defined for this \
+                product: "%s". You may have to install a chart of \
+                account from Accounting app, settings \
+                menu.') % (product.name,))
+        return product, account_id
+
+    def _get_penalty_partner(self):
+        self.ensure_one()
+        return self.partner_id or self.student_id.partner_id or \
+            self.faculty_id.partner_id
+
     def create_penalty_invoice(self):
-        for rec in self:
-            account_id = False
-            product = self.env.ref('openeducat_library.op_product_7')
-            if product.id:
-                account_id = product.property_account_income_id.id
-            if not account_id:
-                account_id = \
-                    product.categ_id.property_account_income_categ_id.id
-            if not account_id:
-                raise UserError(
-                    _('There is no income account defined for this \
-                    product: "%s". You may have to install a chart of \
-                    account from Accounting app, settings \
-                    menu.') % (product.name,))
-
-            invoice = self.env['account.move'].create({
-                'partner_id': rec.student_id.partner_id.id,
-                'move_type': 'out_invoice',
-                'invoice_date': fields.Date.today(),
-            })
-            line_values = {'name': product.name,
-                           'account_id': account_id,
-                           'price_unit': rec.penalty,
-                           'quantity': 1.0,
-                           'discount': 0.0,
-                           'product_uom_id': product.uom_id.id,
-                           'product_id': product.id, }
-            invoice.write({'invoice_line_ids': [(0, 0, line_values)]})
-
-            invoice._compute_tax_totals()
-            #           invoice.action_invoice_open()
-            self.invoice_id = invoice.id
+        """ Invoice the penalties, with one invoice per partner. """
+        movements = self.filtered(lambda m: m.penalty > 0 and not m.invoice_id)
+        if not movements:
+            return self.env['account.move']
+        product, account_id = self._get_penalty_product_account()
+        invoices = self.env['account.move']
+        for company, company_movements in \
+                movements.grouped('company_id').items():
+            by_partner = {}
+            for movement in company_movements:
+                partner = movement._get_penalty_partner()
+                by_partner[partner] = by_partner.get(
+                    partner, self.browse()) | movement
+            company_invoices = self.env['account.move'].with_company(
+                company or self.env.company).create([{
+                    'partner_id': partner.id,
+                    'move_type': 'out_invoice',
+                    'invoice_date': fields.Date.today(),
+                    'invoice_line_ids': [(0, 0, {
+                        'name': '%s - %s' % (product.name,
+                                             movement.media_id.name),
+                        'account_id': account_id,
+                        'price_unit': movement.penalty,
+                        'quantity': 1.0,
+                        'discount': 0.0,
+                        'product_uom_id': product.uom_id.id,
+                        'product_id': product.id,
+                    }) for movement in partner_movements],
+                } for partner, partner_movements in by_partner.items()])
+            for partner_movements, invoice in zip(
+                    by_partner.values(), company_invoices):
+                partner_movements.write({'invoice_id': invoice.id})
+            invoices |= company_invoices
+        return invoices
+
+    @api.model
+    def _update_overdue_movements(self):
+        """ Flag the overdue movements and accrue their penalties.
+
+        All issued movements past their due date are updated with a single
+        UPDATE computing the penalty from the card type daily amount. """
+        today = fields.Date.context_today(self)
+        self.flush_model()
+        self.env['op.library.card'].flush_model(['library_card_type_id'])
+        self.env['op.library.card.type'].flush_model(['penalty_amt_per_day'])
+        self.env.cr.execute(SQL("""
+            UPDATE op_media_movement m
+               SET is_overdue = TRUE,
+                   overdue_days = %(today)s - m.return_date,
+                   penalty = (%(today)s - m.return_date)
+                             * COALESCE(t.penalty_amt_per_day, 0)
+              FROM op_library_card c
+              JOIN op_library_card_type t ON t.id = c.library_card_type_id
+             WHERE c.id = m.library_card_id
+               AND m.state = 'issue'
+               AND m.return_date < %(today)s
+        """, today=today))
+        overdue_count = self.env.cr.rowcount
+        # Movements returned or extended meanwhile are no longer overdue
+        self.env.cr.execute(SQL("""
+            UPDATE op_media_movement
+               SET is_overdue = FALSE, overdue_days = 0
+             WHERE is_overdue
+               AND (state != 'issue' OR return_date >= %(today)s)
+        """, today=today))
+        self.invalidate_model(['is_overdue', 'overdue_days', 'penalty'])
+        return overdue_count
+
+    @api.model
+    def _cron_process_overdue_movements(self):
+        """ Nightly overdue detection and penalty invoicing.
+
+        The overdue flags are committed first, then the penalties of each
+        partner are invoiced in their own savepoint: an invoicing error is
+        logged and leaves the other partners and the flags untouched. """
+        overdue_count = self._update_overdue_movements()
+        self.env.cr.commit()
+        to_invoice = self.search([
+            ('state', '=', 'return'),
+            ('penalty', '>', 0),
+            ('invoice_id', '=', False)])
+        invoices = self.env['account.move']
+        for partner, movements in to_invoice.grouped(
+                lambda m: m._get_penalty_partner()).items():
+            try:
+                with self.env.cr.savepoint():
+                    invoices |= movements.create_penalty_invoice()
+            except Exception as e:
+                _logger.error('Library overdue run: penalties of %s '
+                              'not invoiced: %s', partner.name, e)
+        _logger.info('Library overdue run: %s overdue movements, '
+                     '%s penalty invoices created',
+                     overdue_count, len(invoices))
+        return True
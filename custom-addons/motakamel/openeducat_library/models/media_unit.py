@@ -59,9 +59,11 @@ class OpMediaUnit(models.Model):
         args = args or []
         recs = self.browse()
         if name:
+            # Scanned barcodes are found with an exact, indexed lookup
             recs = self.search(
-                [('name', operator, name)] + args, limit=limit)
+                [('barcode', '=', name)] + args, limit=limit)
         if not recs:
             recs = self.search(
-                [('barcode', operator, name)] + args, limit=limit)
+                ['|', ('name', operator, name), ('barcode', operator, name)]
+                + args, limit=limit)
         return [(res.id, res.display_name) for res in recs]
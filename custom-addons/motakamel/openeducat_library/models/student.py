@@ -31,10 +31,9 @@ class OpStudent(models.Model):
 
     @api.depends('media_movement_lines')
     def _compute_media_movement_lines(self):
+        counts = self._count_related('op.media.movement', 'student_id')
         for media in self:
-            media.media_movement_lines_count = \
-                self.env['op.media.movement'].search_count(
-                    [('student_id', '=', self.id)])
+            media.media_movement_lines_count = counts.get(media.id, 0)
 
     def count_media_movement_lines(self):
         return {
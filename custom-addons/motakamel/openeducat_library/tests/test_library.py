@@ -19,8 +19,12 @@
 ###############################################################################
 
 import time
+from datetime import timedelta
 from logging import info
 
+from odoo import fields
+from odoo.exceptions import UserError
+
 from .test_library_common import TestLibraryCommon
 
 
@@ -219,3 +223,136 @@ class TestWizardReturn(TestLibraryCommon):
                 self.env.ref('openeducat_library.op_media_unit_2').id,
         })
         return_wizard.do_return()
+
+
+class TestCirculation(TestLibraryCommon):
+
+    def setUp(self):
+        super(TestCirculation, self).setUp()
+        self.circulation = self.env['op.library.circulation']
+        card_type = self.op_library_card_type.create({
+            'name': 'Desk Card Type',
+            'allow_media': 2,
+            'duration': 10,
+            'penalty_amt_per_day': 5.0,
+        })
+        self.card = self.op_library_card.create({
+            'partner_id': self.env.ref('openeducat_core.op_res_partner_1').id,
+            'library_card_type_id': card_type.id,
+            'type': 'student',
+        })
+        self.units = self.op_media_unit.create([{
+            'name': 'Desk Unit %s' % i,
+            'media_id': self.env.ref('openeducat_library.op_media_1').id,
+        } for i in range(3)])
+
+    def test_case_issue_basket(self):
+        barcodes = self.units.mapped('barcode')
+        results = self.circulation.issue_media_units(
+            self.card.id, barcodes + [barcodes[0], 'UNKNOWN'])
+        status = {}
+        for result in results:
+            status.setdefault(result['status'], []).append(result['barcode'])
+        self.assertEqual(status['issued'], barcodes[:2])
+        self.assertEqual(len(status['error']), 3)
+        self.assertEqual(self.units[:2].mapped('state'), ['issue', 'issue'])
+        self.assertEqual(self.units[2].state, 'available')
+
+    def test_case_return_basket(self):
+        barcodes = self.units.mapped('barcode')
+        self.circulation.issue_media_units(
+            self.card.id, barcodes[:1], issued_date='2024-01-01')
+        results = self.circulation.return_media_units(
+            barcodes[:2], return_date='2024-01-13')
+        returned = [r for r in results if r['status'] == 'returned']
+        self.assertEqual(len(returned), 1)
+        self.assertEqual(returned[0]['penalty'], 10.0)
+        self.assertEqual(self.units[0].state, 'available')
+        self.assertEqual(
+            [r['status'] for r in results if r['barcode'] == barcodes[1]],
+            ['error'])
+
+
+class TestOverdueMovement(TestLibraryCommon):
+
+    def setUp(self):
+        super(TestOverdueMovement, self).setUp()
+
+    def test_case_overdue_movement(self):
+        card = self.env.ref('openeducat_library.op_library_card_1')
+        unit = self.op_media_unit.create({
+            'name': 'Overdue Unit',
+            'media_id': self.env.ref('openeducat_library.op_media_1').id,
+        })
+        today = fields.Date.today()
+        movement = self.op_media_movement.create({
+            'media_id': unit.media_id.id,
+            'media_unit_id': unit.id,
+            'type': 'student',
+            'student_id': card.student_id.id,
+            'library_card_id': card.id,
+            'issued_date': today - timedelta(days=15),
+            'return_date': today - timedelta(days=5),
+            'state': 'issue',
+        })
+        self.op_media_movement._update_overdue_movements()
+        self.assertTrue(movement.is_overdue)
+        self.assertEqual(movement.overdue_days, 5)
+        self.assertEqual(
+            movement.penalty,
+            5 * card.library_card_type_id.penalty_amt_per_day)
+        movement.return_media(today)
+        self.assertFalse(movement.is_overdue)
+        self.op_media_movement._update_overdue_movements()
+        self.assertFalse(movement.is_overdue)
+
+    def test_case_overdue_cron_invoice_error(self):
+        card = self.env.ref('openeducat_library.op_library_card_1')
+        units = self.op_media_unit.create([{
+            'name': 'Overdue Cron Unit %s' % i,
+            'media_id': self.env.ref('openeducat_library.op_media_1').id,
+        } for i in range(2)])
+        today = fields.Date.today()
+        issued, returned = self.op_media_movement.create([{
+            'media_id': unit.media_id.id,
+            'media_unit_id': unit.id,
+            'type': 'student',
+            'student_id': card.student_id.id,
+            'library_card_id': card.id,
+            'issued_date': today - timedelta(days=15),
+            'return_date': today - timedelta(days=5),
+            'state': state,
+            'penalty': penalty,
+        } for unit, state, penalty in zip(units, ['issue', 'return'], [0, 10])])
+
+        def _get_penalty_product_account(movements):
+            raise UserError('No income account')
+        self.patch(type(self.op_media_movement),
+                   '_get_penalty_product_account',
+                   _get_penalty_product_account)
+        self.patch(self.env.cr, 'commit', lambda: None)
+
+        # Invoicing errors are logged, the overdue flags are kept
+        self.op_media_movement._cron_process_overdue_movements()
+        self.assertTrue(issued.is_overdue)
+        self.assertEqual(issued.overdue_days, 5)
+        self.assertFalse(returned.invoice_id)
+
+
+class TestMovementCount(TestLibraryCommon):
+
+    def setUp(self):
+        super(TestMovementCount, self).setUp()
+
+    def test_case_movement_count_queries(self):
+        students = self.env['op.student'].search([])
+        faculties = self.env['op.faculty'].search([])
+        self.env.flush_all()
+        with self.assertQueryCount(1):
+            student_counts = students.mapped('media_movement_lines_count')
+        with self.assertQueryCount(1):
+            faculty_counts = faculties.mapped('media_movement_lines_count')
+        self.assertEqual(student_counts,
+                         [len(s.media_movement_lines) for s in students])
+        self.assertEqual(faculty_counts,
+                         [len(f.media_movement_lines) for f in faculties])
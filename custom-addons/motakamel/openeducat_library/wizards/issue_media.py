@@ -62,11 +62,11 @@ class IssueMedia(models.TransientModel):
             days=self.library_card_id.library_card_type_id.duration)
 
     def check_max_issue(self, student_id, library_card_id):
-        media_movement_search = self.env["op.media.movement"].search(
+        issued_count = self.env["op.media.movement"].search_count(
             [('library_card_id', '=', library_card_id),
              ('student_id', '=', student_id),
              ('state', '=', 'issue')])
-        if len(media_movement_search) < self.env["op.library.card"].browse(
+        if issued_count < self.env["op.library.card"].browse(
                 library_card_id).library_card_type_id.allow_media:
             return True
         else:
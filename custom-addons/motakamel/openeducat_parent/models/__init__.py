@@ -20,3 +20,4 @@
 
 from . import parent
 from . import parent_relationship
+from . import user_provisioning
@@ -20,6 +20,7 @@
 
 from odoo import _, api, fields, models
 from odoo.exceptions import ValidationError
+from odoo.osv import expression
 
 
 class OpParent(models.Model):
@@ -50,72 +51,127 @@ class OpParent(models.Model):
 
     @api.model_create_multi
     def create(self, vals_list):
-        for vals in vals_list:
-            partner_id = vals.get('name')
-            parent_email = vals.get('email')
-            parent_mobile = vals.get('mobile')
-
-            if isinstance(partner_id, int):
-                partner = self.env['res.partner'].browse(partner_id)
-                if partner.exists():
-                    update_vals = {'is_parent': True}
-                    if parent_email and not partner.email:
-                        update_vals['email'] = parent_email
-                    if parent_mobile and not partner.mobile:
-                        update_vals['mobile'] = parent_mobile
-                    partner.write(update_vals)
-                    continue
-
-            parent_name = vals.get('name')
-            partner = self.env['res.partner'].search([
-                '|', '|',
-                ('name', '=', parent_name),
-                ('email', '=', parent_email),
-                ('mobile', '=', parent_mobile),
-            ], limit=1)
+        Partner = self.env['res.partner']
+        partner_ids = [vals['name'] for vals in vals_list
+                       if isinstance(vals.get('name'), int)]
+        existing_partners = Partner.browse(partner_ids).exists()
 
-            if partner:
-                update_vals = {'is_parent': True}
-                if parent_email and not partner.email:
-                    update_vals['email'] = parent_email
-                if parent_mobile and not partner.mobile:
-                    update_vals['mobile'] = parent_mobile
-                partner.write(update_vals)
+        lookup_vals = [vals for vals in vals_list
+                       if vals.get('name') not in existing_partners.ids]
+        matches = self._match_parent_partners(lookup_vals)
 
+        new_partner_vals = []
+        for vals in lookup_vals:
+            partner = matches.get(id(vals))
+            if partner:
                 vals['name'] = partner.id
             else:
-                new_partner = self.env['res.partner'].create({
-                    'name': parent_name,
-                    'email': parent_email,
-                    'mobile': parent_mobile,
-                    'is_parent': True,
-                })
-                vals['name'] = new_partner.id
-                vals['email'] = parent_email
-                vals['mobile'] = parent_mobile
+                new_partner_vals.append(vals)
+        new_partners = Partner.create([{
+            'name': vals.get('name'),
+            'email': vals.get('email'),
+            'mobile': vals.get('mobile'),
+            'is_parent': True,
+        } for vals in new_partner_vals])
+        for vals, partner in zip(new_partner_vals, new_partners):
+            vals['name'] = partner.id
+
+        # Flag the reused partners and fill in their missing contact details
+        reused_partners = existing_partners | Partner.browse(
+            [partner.id for partner in matches.values()])
+        reused_partners.filtered(lambda p: not p.is_parent).write(
+            {'is_parent': True})
+        for vals in vals_list:
+            partner = reused_partners.browse(vals['name'])
+            if partner not in reused_partners:
+                continue
+            update_vals = {}
+            if vals.get('email') and not partner.email:
+                update_vals['email'] = vals['email']
+            if vals.get('mobile') and not partner.mobile:
+                update_vals['mobile'] = vals['mobile']
+            if update_vals:
+                partner.write(update_vals)
 
         res = super(OpParent, self).create(vals_list)
+        res.filtered(lambda r: r.student_ids and r.name.user_id)._sync_child_users()
+        return res
 
-        for record in res:
-            if record.student_ids and record.name.user_id:
-                user_ids = [s.user_id.id for s in record.student_ids if s.user_id]
-                record.user_id.child_ids = [(6, 0, user_ids)]
+    @api.model
+    def _match_parent_partners(self, vals_list):
+        """Find the existing partners of new parents with a single search.
 
-            if record.name and not record.name.is_parent:
-                record.name.is_parent = True
+        A partner matches when its name, email or mobile is the one given.
+        Returns a dictionary mapping ``id(vals)`` to the first matching
+        partner in the partner order.
+        """
+        keys = {'name': set(), 'email': set(), 'mobile': set()}
+        for vals in vals_list:
+            for field_name, values in keys.items():
+                if vals.get(field_name):
+                    values.add(str(vals[field_name]))
+        domain = expression.OR([
+            [(field_name, 'in', list(values))]
+            for field_name, values in keys.items() if values
+        ])
+        if not domain:
+            return {}
+        partners = self.env['res.partner'].search(domain)
 
-        return res
+        # First partner (in search order) per field value
+        index = {field_name: {} for field_name in keys}
+        for position, partner in enumerate(partners):
+            for field_name, first in index.items():
+                if partner[field_name]:
+                    first.setdefault(partner[field_name], position)
+
+        matches = {}
+        for vals in vals_list:
+            positions = [
+                index[field_name][str(vals[field_name])]
+                for field_name in keys
+                if vals.get(field_name)
+                and str(vals[field_name]) in index[field_name]
+            ]
+            if positions:
+                matches[id(vals)] = partners[min(positions)]
+        return matches
+
+    def _sync_child_users(self):
+        """Link the users of the parents to the users of their students.
+
+        The child users of all parents are replaced with one DELETE and one
+        INSERT on the relation table instead of one write per parent.
+        """
+        children = {}
+        for parent in self.filtered('user_id'):
+            children.setdefault(parent.user_id.id, set()).update(
+                parent.student_ids.user_id.ids)
+        if not children:
+            return
+        Users = self.env['res.users']
+        Users.flush_model(['child_ids'])
+        self.env.cr.execute(
+            "DELETE FROM res_user_first_rel1 WHERE user_id IN %s",
+            (tuple(children),))
+        rows = [(user_id, child_id)
+                for user_id, child_ids in children.items()
+                for child_id in child_ids]
+        if rows:
+            self.env.cr.execute("""
+                INSERT INTO res_user_first_rel1 (user_id, res_user_second_rel1)
+                SELECT * FROM unnest(%s::int[], %s::int[])
+                ON CONFLICT DO NOTHING
+            """, ([row[0] for row in rows], [row[1] for row in rows]))
+        Users.invalidate_model(['child_ids'])
+        self.env.registry.clear_cache()
 
     def write(self, vals):
-        for rec in self:
-            res = super(OpParent, self).write(vals)
-            if vals.get('student_ids', False) and rec.name.user_id:
-                student_ids = rec.student_ids.browse(rec.student_ids.ids)
-                usr_ids = [student_id.user_id.id for student_id in student_ids
-                           if student_id.user_id]
-                rec.user_id.child_ids = [(6, 0, usr_ids)]
-            rec.env.registry.clear_cache()
-            return res
+        res = super(OpParent, self).write(vals)
+        if vals.get('student_ids', False):
+            self.filtered(lambda r: r.name.user_id)._sync_child_users()
+        self.env.registry.clear_cache()
+        return res
 
     def unlink(self):
         for record in self:
@@ -124,27 +180,51 @@ class OpParent(models.Model):
             return super(OpParent, self).unlink()
 
     def create_parent_user(self):
+        """Create the portal users of the parents, warning about the parents
+        skipped because their login is already used."""
+        skipped = self._create_parent_users()['skipped']
+        if not skipped:
+            return
+        return {
+            'type': 'ir.actions.client',
+            'tag': 'display_notification',
+            'params': {
+                'title': _('Users not created'),
+                'message': _('Login already used: %s') % ', '.join(
+                    skipped.mapped('name.name')),
+                'type': 'warning',
+                'sticky': True,
+            }
+        }
+
+    def _create_parent_users(self):
+        """Create the portal users of the parents with one batched create.
+
+        Returns a dictionary with the parents that received a user and the
+        parents skipped because their login is already used.
+        """
         template = self.env.ref('openeducat_parent.parent_template_user')
-        users_res = self.env['res.users']
-        for record in self:
-            if not record.name.email:
-                raise ValidationError(_('Update parent email id first.'))
-            if not record.name.user_id:
-                groups_id = template and template.groups_id or False
-                user_ids = [
-                    parent.user_id.id for
-                    parent in record.student_ids if parent.user_id]
-                user_id = users_res.create({
-                    'name': record.name.name,
-                    'partner_id': record.name.id,
-                    'login': record.name.email,
-                    'is_parent': True,
-                    'tz': self._context.get('tz'),
-                    'groups_id': groups_id,
-                    'child_ids': [(6, 0, user_ids)]
-                })
-                record.user_id = user_id
-                record.name.user_id = user_id
+        if self.filtered(lambda r: not r.name.email):
+            raise ValidationError(_('Update parent email id first.'))
+        parents = self.filtered(lambda r: not r.name.user_id)
+        groups = template and template.groups_id or self.env['res.groups']
+        users_by_login, _skipped = self.env['res.users']._bulk_create_users([{
+            'name': record.name.name,
+            'partner_id': record.name.id,
+            'login': record.name.email,
+            'is_parent': True,
+            'tz': self._context.get('tz'),
+            'groups_id': [(6, 0, groups.ids)],
+            'child_ids': [(6, 0, record.student_ids.user_id.ids)],
+        } for record in parents])
+        created = self.browse()
+        for record in parents:
+            user = users_by_login.get(record.name.email.strip().lower())
+            if user and user.partner_id == record.name:
+                record.user_id = user
+                record.name.user_id = user
+                created |= record
+        return {'created': created, 'skipped': parents - created}
 
     @api.model
     def get_import_templates(self):
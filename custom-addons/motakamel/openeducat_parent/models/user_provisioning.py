@@ -0,0 +1,47 @@
+###############################################################################
+#
+#    OpenEduCat Inc
+#    Copyright (C) 2009-TODAY OpenEduCat Inc(<https://www.openeducat.org>).
+#
+#    This program is free software: you can redistribute it and/or modify
+#    it under the terms of the GNU Lesser General Public License as
+#    published by the Free Software Foundation, either version 3 of the
+#    License, or (at your option) any later version.
+#
+#    This program is distributed in the hope that it will be useful,
+#    but WITHOUT ANY WARRANTY; without even the implied warranty of
+#    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#    GNU Lesser General Public License for more details.
+#
+#    You should have received a copy of the GNU Lesser General Public License
+#    along with this program.  If not, see <http://www.gnu.org/licenses/>.
+#
+###############################################################################
+
+from odoo import _, fields, models
+
+
+class OpUserProvisioning(models.Model):
+    _inherit = "op.user.provisioning"
+
+    include_parents = fields.Boolean(
+        'Include Parents', default=True,
+        help="Also create the users of the students' parents and link "
+             "them to their children")
+
+    def _provision_chunk(self, students):
+        created, skipped = super(OpUserProvisioning, self)._provision_chunk(
+            students)
+        if not self.include_parents:
+            return created, skipped
+        parents = students.parent_ids
+        no_email = parents.filtered(lambda p: not p.name.email)
+        skipped += [_('Parent %s: no email') % parent.name.name
+                    for parent in no_email]
+        result = (parents - no_email)._create_parent_users()
+        created += len(result['created'])
+        skipped += [_('Parent %s: login already used') % parent.name.name
+                    for parent in result['skipped']]
+        # Parents who already had a user get the new student users as children
+        parents.filtered('user_id')._sync_child_users()
+        return created, skipped
@@ -75,3 +75,61 @@ class TestParent(TestParentCommon):
         }
         self.subject_registration.create(vals)
         self.subject_registration.write(vals)
+
+    def test_case_4_bulk_parents(self):
+        partner = self.env['res.partner'].create({
+            'name': 'Existing Parent',
+            'email': 'existing.parent@example.com',
+        })
+        student = self.op_student.create({
+            'first_name': 'Child',
+            'last_name': 'Bulk',
+            'name': 'Child Bulk',
+            'email': 'child.bulk@example.com',
+            'gender': 'm',
+        })
+        student.create_student_user()
+        relationship = self.env.ref('openeducat_parent.op_parent_relationship_1')
+        parents = self.op_parent.create([{
+            'name': 'Existing Parent Renamed',
+            'email': 'existing.parent@example.com',
+            'mobile': '5550001',
+            'student_ids': [(6, 0, student.ids)],
+            'relationship_id': relationship.id,
+        }, {
+            'name': 'New Bulk Parent',
+            'email': 'new.bulk.parent@example.com',
+            'student_ids': [(6, 0, student.ids)],
+            'relationship_id': relationship.id,
+        }])
+
+        self.assertEqual(parents[0].name, partner)
+        self.assertEqual(partner.mobile, '5550001')
+        self.assertTrue(parents[1].name.is_parent)
+
+        result = parents._create_parent_users()
+        self.assertEqual(result['created'], parents)
+        self.assertEqual(parents[1].user_id.child_ids, student.user_id)
+
+    def test_case_5_parent_user_button(self):
+        relationship = self.env.ref('openeducat_parent.op_parent_relationship_1')
+        self.env['res.users'].create({
+            'name': 'Taken Login',
+            'login': 'taken.parent@example.com',
+        })
+        parents = self.op_parent.create([{
+            'name': 'Button Parent',
+            'email': 'button.parent@example.com',
+            'relationship_id': relationship.id,
+        }, {
+            'name': 'Taken Parent',
+            'email': 'taken.parent@example.com',
+            'relationship_id': relationship.id,
+        }])
+
+        self.assertIsNone(parents[0].create_parent_user())
+        self.assertTrue(parents[0].user_id)
+        action = parents[1].create_parent_user()
+        self.assertEqual(action['tag'], 'display_notification')
+        self.assertIn('Taken Parent', action['params']['message'])
+        self.assertFalse(parents[1].user_id)
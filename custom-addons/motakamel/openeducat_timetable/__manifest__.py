@@ -35,6 +35,7 @@
         'views/timing_view.xml',
         'views/faculty_view.xml',
         'views/res_config_setting_view.xml',
+        'views/timetable_report_job_view.xml',
         'report/report_timetable_student_generate.xml',
         'report/report_timetable_teacher_generate.xml',
         'report/report_menu.xml',
@@ -42,6 +43,7 @@
         'wizard/time_table_report.xml',
         'wizard/session_confirmation.xml',
         'views/timetable_templates.xml',
+        'data/ir_cron_data.xml',
         'menus/op_menu.xml',
     ],
     'demo': [
@@ -22,3 +22,4 @@ from . import faculty
 from . import timetable
 from . import timing
 from . import res_config_setting
+from . import timetable_report_job
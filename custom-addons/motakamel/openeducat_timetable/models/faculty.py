@@ -29,9 +29,9 @@ class OpFaculty(models.Model):
 
     @api.depends('session_ids')
     def _compute_session_details(self):
+        counts = self._count_related('op.session', 'faculty_id')
         for session in self:
-            session.session_count = self.env['op.session'].search_count(
-                [('faculty_id', '=', self.id)])
+            session.session_count = counts.get(session.id, 0)
 
     def count_sessions_details(self):
         return {
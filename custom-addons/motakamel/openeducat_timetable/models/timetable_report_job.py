@@ -0,0 +1,226 @@
+###############################################################################
+#
+#    OpenEduCat Inc
+#    Copyright (C) 2009-TODAY OpenEduCat Inc(<https://www.openeducat.org>).
+#
+#    This program is free software: you can redistribute it and/or modify
+#    it under the terms of the GNU Lesser General Public License as
+#    published by the Free Software Foundation, either version 3 of the
+#    License, or (at your option) any later version.
+#
+#    This program is distributed in the hope that it will be useful,
+#    but WITHOUT ANY WARRANTY; without even the implied warranty of
+#    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#    GNU Lesser General Public License for more details.
+#
+#    You should have received a copy of the GNU Lesser General Public License
+#    along with this program.  If not, see <http://www.gnu.org/licenses/>.
+#
+###############################################################################
+
+import hashlib
+from collections import defaultdict
+from datetime import datetime, time, timedelta
+
+from odoo import _, api, fields, models
+
+
+class OpTimetablePdf(models.Model):
+    _name = "op.timetable.pdf"
+    _description = "Rendered Timetable"
+    _order = "start_date desc, id desc"
+
+    batch_id = fields.Many2one(
+        'op.batch', 'Batch', ondelete='cascade', index=True)
+    faculty_id = fields.Many2one(
+        'op.faculty', 'Faculty', ondelete='cascade', index=True)
+    start_date = fields.Date('Start Date', required=True)
+    end_date = fields.Date('End Date', required=True)
+    session_key = fields.Char('Sessions Key', required=True, readonly=True)
+    attachment_id = fields.Many2one(
+        'ir.attachment', 'Attachment', ondelete='set null', readonly=True)
+    datas = fields.Binary(related='attachment_id.datas', string='File')
+    name = fields.Char(related='attachment_id.name', string='File Name')
+
+    @api.model
+    def _get_session_key(self, sessions):
+        """ Return a key changing whenever one of ``sessions`` is added,
+        modified or removed. """
+        write_dates = [fields.Datetime.to_string(d)
+                       for d in sessions.mapped('write_date')]
+        key = '%s|%s' % (sorted(sessions.ids), max(write_dates, default=''))
+        return hashlib.sha1(key.encode()).hexdigest()
+
+
+class OpTimetableReportJob(models.Model):
+    _name = "op.timetable.report.job"
+    _inherit = ["op.background.job.mixin"]
+    _description = "Bulk Timetable Rendering"
+    _job_cron = 'openeducat_timetable.ir_cron_process_timetable_report_job'
+
+    # Rendering is slow, the jobs are always processed in the background
+    BACKGROUND_THRESHOLD = 0
+    # Number of batches or faculties rendered per chunk
+    CHUNK_SIZE = 20
+
+    name = fields.Char(
+        'Name', required=True, readonly=True,
+        default=lambda self: _('Timetables %s') % fields.Datetime.now())
+    start_date = fields.Date(
+        'Start Date', required=True,
+        default=lambda self: fields.Date.today() - timedelta(
+            days=fields.Date.today().weekday()))
+    end_date = fields.Date(
+        'End Date', required=True,
+        default=lambda self: fields.Date.today() + timedelta(
+            days=6 - fields.Date.today().weekday()))
+    batch_ids = fields.Many2many(
+        'op.batch', 'op_timetable_report_job_batch_rel',
+        'job_id', 'batch_id', string='Batches')
+    faculty_ids = fields.Many2many(
+        'op.faculty', 'op_timetable_report_job_faculty_rel',
+        'job_id', 'faculty_id', string='Faculties')
+    rendered_count = fields.Integer('Rendered', readonly=True)
+    cached_count = fields.Integer('Up to Date', readonly=True)
+
+    def action_load_all(self):
+        """ Select all batches running and faculties teaching during the week. """
+        self.ensure_one()
+        self.write({
+            'batch_ids': [(6, 0, self.env['op.batch'].search([
+                ('start_date', '<=', self.end_date),
+                ('end_date', '>=', self.start_date)]).ids)],
+            'faculty_ids': [(6, 0, [
+                faculty.id for [faculty] in self.env['op.session']._read_group([
+                    ('start_datetime', '>=', self.start_date),
+                    ('start_datetime', '<', self.end_date + timedelta(days=1)),
+                ], ['faculty_id'])])],
+        })
+        return True
+
+    def action_view_timetables(self):
+        self.ensure_one()
+        action = self.env['ir.actions.act_window']._for_xml_id(
+            'openeducat_timetable.act_open_op_timetable_pdf_view')
+        action['domain'] = [
+            ('start_date', '=', self.start_date),
+            ('end_date', '=', self.end_date),
+            '|', ('batch_id', 'in', self.batch_ids.ids),
+            ('faculty_id', 'in', self.faculty_ids.ids)]
+        return action
+
+    def _prepare_start_vals(self):
+        vals = super(OpTimetableReportJob, self)._prepare_start_vals()
+        vals.update({
+            'rendered_count': 0,
+            'cached_count': 0,
+        })
+        return vals
+
+    def _get_items(self):
+        """ Return the batches and faculties to render, in processing order. """
+        self.ensure_one()
+        return [('batch', batch_id) for batch_id in sorted(self.batch_ids.ids)] + \
+            [('faculty', faculty_id) for faculty_id in sorted(self.faculty_ids.ids)]
+
+    def _process_chunk(self, chunk):
+        rendered, cached = self._render_chunk(chunk)
+        return {
+            'rendered_count': self.rendered_count + rendered,
+            'cached_count': self.cached_count + cached,
+        }
+
+    def _get_sessions(self, field_name, ids):
+        """ Return the sessions of the week of the given batches or faculties,
+        read with one search and grouped by record id. """
+        sessions = self.env['op.session'].search([
+            (field_name, 'in', ids),
+            ('start_datetime', '>=', datetime.combine(self.start_date, time.min)),
+            ('end_datetime', '<=', datetime.combine(self.end_date, time.max)),
+        ], order='start_datetime asc')
+        sessions_by_id = defaultdict(lambda: self.env['op.session'])
+        for session in sessions:
+            sessions_by_id[session[field_name].id] |= session
+        return sessions_by_id
+
+    def _render_chunk(self, chunk):
+        """ Render the timetables of ``chunk`` whose sessions changed since
+        they were last rendered.
+
+        The timetable of a batch is the same for all its students, so it is
+        rendered once and shared by all of them.
+
+        :return: number of timetables rendered and already up to date
+        """
+        Pdf = self.env['op.timetable.pdf']
+        rendered = cached = 0
+        for kind, field_name, model_name in (
+                ('batch', 'batch_id', 'op.batch'),
+                ('faculty', 'faculty_id', 'op.faculty')):
+            ids = [record_id for target, record_id in chunk if target == kind]
+            if not ids:
+                continue
+            sessions_by_id = self._get_sessions(field_name, ids)
+            existing = {pdf[field_name].id: pdf for pdf in Pdf.search([
+                (field_name, 'in', ids),
+                ('start_date', '=', self.start_date),
+                ('end_date', '=', self.end_date)])}
+            for record in self.env[model_name].browse(ids):
+                sessions = sessions_by_id[record.id]
+                key = Pdf._get_session_key(sessions)
+                pdf = existing.get(record.id)
+                if pdf and pdf.session_key == key and pdf.attachment_id:
+                    cached += 1
+                    continue
+                content = self._render_timetable(kind, record, sessions)
+                if not pdf:
+                    pdf = Pdf.create({
+                        field_name: record.id,
+                        'start_date': self.start_date,
+                        'end_date': self.end_date,
+                        'session_key': key,
+                    })
+                old_attachment = pdf.attachment_id
+                pdf.write({
+                    'session_key': key,
+                    'attachment_id': self.env['ir.attachment'].create({
+                        'name': _('Timetable %s %s.pdf') % (
+                            record.name, self.start_date),
+                        'type': 'binary',
+                        'raw': content,
+                        'res_model': pdf._name,
+                        'res_id': pdf.id,
+                        'mimetype': 'application/pdf',
+                    }).id,
+                })
+                old_attachment.unlink()
+                rendered += 1
+        return rendered, cached
+
+    def _render_timetable(self, kind, record, sessions):
+        """ Render the timetable PDF of a batch or faculty from its sessions. """
+        data = {
+            'start_date': fields.Date.to_string(self.start_date),
+            'end_date': fields.Date.to_string(self.end_date),
+        }
+        if kind == 'batch':
+            report = 'openeducat_timetable.report_student_timetable_generate'
+            data.update({
+                'state': 'student',
+                'course_id': (record.course_id.id, record.course_id.name),
+                'batch_id': (record.id, record.name),
+                'time_table_ids': sessions.ids,
+            })
+        else:
+            report = 'openeducat_timetable.report_teacher_timetable_generate'
+            data.update({
+                'state': 'faculty',
+                'faculty_id': (record.id, record.name),
+                'teacher_time_table_ids': sessions.ids,
+            })
+        # The report reads the record from the context, as when printed
+        # from the timetable report wizard
+        content, dummy = self.env['ir.actions.report'].with_context(
+            active_model=record._name, active_id=record.id,
+        )._render_qweb_pdf(report, data=data)
+        return content
@@ -30,31 +30,24 @@ class ReportTimetableStudentGenerate(models.AbstractModel):
     _name = "report.openeducat_timetable.report_timetable_student_generate"
     _description = "Timetable Student Report"
 
-    def _convert_to_local_timezone(self, time):
+    def _convert_to_local_timezone(self, time, timezone=None):
         '''
             Converts time as per local timezone.
         '''
         if time:
-            timezone = pytz.timezone(self._context['tz'] or 'UTC')
+            timezone = timezone or pytz.timezone(self._context['tz'] or 'UTC')
             utc_in_time = pytz.UTC.localize(fields.Datetime.from_string(time))
             local_time = utc_in_time.astimezone(timezone)
             return local_time
 
     def sort_tt(self, data_list):
-        main_list = []
-        f = []
+        periods = {}
         for d in data_list:
-            if d['period'] not in f:
-                f.append(d['period'])
-                main_list.append({
-                    'name': d['period'],
-                    'line': {d['day']: d}
-                })
-            else:
-                for m in main_list:
-                    if m['name'] == d['period']:
-                        m['line'][d['day']] = d
-        return main_list
+            periods.setdefault(d['period'], {
+                'name': d['period'],
+                'line': {},
+            })['line'][d['day']] = d
+        return list(periods.values())
 
     def get_heading(self):
         dayofWeek = [_(calendar.day_name[0]),
@@ -68,6 +61,7 @@ class ReportTimetableStudentGenerate(models.AbstractModel):
 
     def get_object(self, data):
         data_list = []
+        timezone = pytz.timezone(self._context.get('tz') or 'UTC')
         for timetable_obj in self.env['op.session'].browse(
                 data['time_table_ids']):
             oldDate = pytz.UTC.localize(
@@ -76,7 +70,7 @@ class ReportTimetableStudentGenerate(models.AbstractModel):
             timetable_data = {
                 'period': timetable_obj.timing,
                 'start_datetime': self._convert_to_local_timezone(
-                    timetable_obj.start_datetime).strftime(
+                    timetable_obj.start_datetime, timezone).strftime(
                     tools.DEFAULT_SERVER_DATETIME_FORMAT),
                 'day': str(day),
                 'subject': timetable_obj.subject_id.name,
@@ -30,12 +30,12 @@ class ReportTimeTableTeacherGenerate(models.AbstractModel):
     _name = "report.openeducat_timetable.report_timetable_teacher_generate"
     _description = "Timetable Teacher Report"
 
-    def _convert_to_local_timezone(self, time):
+    def _convert_to_local_timezone(self, time, timezone=None):
         '''
             Converts time as per local timezone.
         '''
         if time:
-            timezone = pytz.timezone(self._context['tz'] or 'UTC')
+            timezone = timezone or pytz.timezone(self._context['tz'] or 'UTC')
             utc_in_time = pytz.UTC.localize(fields.Datetime.from_string(time))
             local_time = utc_in_time.astimezone(timezone)
             return local_time
@@ -45,22 +45,17 @@ class ReportTimeTableTeacherGenerate(models.AbstractModel):
         return faculty_name.name
 
     def sort_tt(self, data_list):
-        main_list = []
-        f = []
+        periods = {}
         for d in data_list:
-            if d['period'] not in f:
-                f.append(d['period'])
-                main_list.append({
+            if d['period'] not in periods:
+                periods[d['period']] = {
                     'name': d['period'],
-                    'line': {d['day']: d},
+                    'line': {},
                     'peropd_time': ' To '.join([d['start_datetime'],
                                                 d['end_datetime']])
-                })
-            else:
-                for m in main_list:
-                    if m['name'] == d['period']:
-                        m['line'][d['day']] = d
-        return main_list
+                }
+            periods[d['period']]['line'][d['day']] = d
+        return list(periods.values())
 
     def get_heading(self):
         dayofWeek = [_(calendar.day_name[0]),
@@ -74,6 +69,7 @@ class ReportTimeTableTeacherGenerate(models.AbstractModel):
 
     def get_object(self, data):
         data_list = []
+        timezone = pytz.timezone(self._context.get('tz') or 'UTC')
         for timetable_obj in self.env['op.session'].browse(
                 data['teacher_time_table_ids']):
             oldDate = pytz.UTC.localize(
@@ -85,10 +81,10 @@ class ReportTimeTableTeacherGenerate(models.AbstractModel):
                 # timetable_obj.timing_id.minute +
                 # timetable_obj.timing_id.am_pm,
                 'start_datetime': self._convert_to_local_timezone(
-                    timetable_obj.start_datetime).strftime(
+                    timetable_obj.start_datetime, timezone).strftime(
                     tools.DEFAULT_SERVER_DATETIME_FORMAT),
                 'end_datetime': self._convert_to_local_timezone(
-                    timetable_obj.end_datetime).strftime(
+                    timetable_obj.end_datetime, timezone).strftime(
                     tools.DEFAULT_SERVER_DATETIME_FORMAT),
                 'day': str(day),
                 'subject': timetable_obj.subject_id.name,
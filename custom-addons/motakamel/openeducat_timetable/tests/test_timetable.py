@@ -19,6 +19,7 @@
 ###############################################################################
 
 import time
+from datetime import date
 from logging import info
 
 from .test_timetable_common import TestTimetableCommon
@@ -127,3 +128,78 @@ class TestTimetableReport(TestTimetableCommon):
         report._check_dates()
         report.onchange_course()
         report.gen_time_table_report()
+
+
+class TestFacultySessionCount(TestTimetableCommon):
+
+    def setUp(self):
+        super(TestFacultySessionCount, self).setUp()
+
+    def test_case_session_count_queries(self):
+        faculties = self.op_faculty.search([])
+        self.env.flush_all()
+        with self.assertQueryCount(1):
+            counts = faculties.mapped('session_count')
+        self.assertEqual(counts, [len(f.session_ids) for f in faculties])
+
+
+class TestTimetableReportJob(TestTimetableCommon):
+
+    def setUp(self):
+        super(TestTimetableReportJob, self).setUp()
+        self.patch(self.env.cr, 'commit', lambda: None)
+        self.batch = self.env.ref('openeducat_core.op_batch_1')
+        self.faculty = self.env.ref('openeducat_core.op_faculty_1')
+        # A week without demo sessions, from Monday to Sunday
+        self.start_date = date(2030, 1, 7)
+        self.end_date = date(2030, 1, 13)
+        self.session = self.op_session.create({
+            'timing_id': self.env.ref('openeducat_timetable.op_timing_1').id,
+            'start_datetime': '2030-01-08 09:00:00',
+            'end_datetime': '2030-01-08 10:00:00',
+            'course_id': self.batch.course_id.id,
+            'faculty_id': self.faculty.id,
+            'batch_id': self.batch.id,
+            'subject_id': self.env.ref('openeducat_core.op_subject_1').id,
+        })
+        # The test runs in one transaction, where write_date does not
+        # change: age the session so that a later write changes it
+        self.env.cr.execute(
+            "UPDATE op_session SET write_date = write_date - interval '1 day' "
+            "WHERE id = %s", [self.session.id])
+        self.session.invalidate_recordset(['write_date'])
+
+    def _run_job(self):
+        job = self.env['op.timetable.report.job'].create({
+            'start_date': self.start_date,
+            'end_date': self.end_date,
+            'batch_ids': [(6, 0, self.batch.ids)],
+            'faculty_ids': [(6, 0, self.faculty.ids)],
+        })
+        job.action_start()
+        self.assertEqual(job.state, 'queued')
+        job._cron_process_jobs()
+        self.assertEqual(job.state, 'done')
+        self.assertFalse(job.error_log)
+        return job
+
+    def test_case_timetable_report_job(self):
+        job = self._run_job()
+        self.assertEqual(job.rendered_count, 2)
+        pdfs = self.env['op.timetable.pdf'].search([
+            ('start_date', '=', self.start_date),
+            '|', ('batch_id', '=', self.batch.id),
+            ('faculty_id', '=', self.faculty.id)])
+        self.assertEqual(len(pdfs), 2)
+        self.assertTrue(all(pdfs.mapped('attachment_id')))
+
+        # Unchanged sessions are not rendered again
+        job = self._run_job()
+        self.assertEqual(job.rendered_count, 0)
+        self.assertEqual(job.cached_count, 2)
+
+        # A changed session renders the timetables showing it again
+        self.session.write({'color': 3})
+        job = self._run_job()
+        self.assertEqual(job.rendered_count, 2)
+        self.assertEqual(len(pdfs.exists()), 2)